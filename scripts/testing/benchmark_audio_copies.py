@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Measure the memory copied on the audio output path.
+
+Compares peak Python allocations (via tracemalloc) and bytes copied for serving synthesized
+audio with ``StreamingResponse(io.BytesIO(...))`` versus a plain ``Response``,
+and for joining WAV sentences by decoding them versus slicing their frames.
+
+Usage:
+    python scripts/testing/benchmark_audio_copies.py [--megabytes 64] [--sentences 8]
+"""
+import argparse
+import asyncio
+import io
+import os
+import sys
+import tracemalloc
+from typing import Awaitable, Callable, List, Optional
+
+from starlette.responses import Response, StreamingResponse
+
+# Add project root to path to allow imports from src
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+sys.path.append(PROJECT_ROOT)
+
+from src.utils.audio import concatenate_wav, read_wav, write_wav  # noqa: E402
+
+WAV_FORMAT = (1, 2, 16000)
+
+
+def make_wav(size: int) -> bytes:
+    """Build WAV audio with ``size`` bytes of frames."""
+    return write_wav(WAV_FORMAT, os.urandom(size))
+
+
+def concatenate_wav_decoded(chunks: List[bytes]) -> bytes:
+    """Previous implementation: decode every chunk, join, and re-encode."""
+    frames = [read_wav(chunk)[1] for chunk in chunks]
+    return write_wav(WAV_FORMAT, b"".join(frames))
+
+
+async def send_response(response: Response, audio: bytes) -> int:
+    """
+    Drive a response through a minimal ASGI server and count the body bytes
+    that reached the server as a copy rather than as ``audio`` itself.
+    """
+    copied = 0
+    disconnected = asyncio.Event()
+    
+    async def receive():
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+    
+    async def send(message):
+        nonlocal copied
+        body = message.get("body", b"")
+        if message["type"] == "http.response.body" and body is not audio:
+            copied += len(body)
+    
+    scope = {"type": "http", "method": "POST", "path": "/translate", "headers": []}
+    await response(scope, receive, send)
+    disconnected.set()
+    return copied
+
+
+def measure(label: str, size: int, func: Callable[[], Awaitable[Optional[int]]]) -> None:
+    """Run ``func`` under tracemalloc and report its peak allocation and copies."""
+    tracemalloc.start()
+    copied = asyncio.run(func())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    line = f"{label:<40} peak {peak / 1e6:8.1f} MB  ({peak / size:4.2f}x audio)"
+    if copied is not None:
+        line += f"  body copied {copied / 1e6:8.1f} MB"
+    print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark audio buffer copies")
+    parser.add_argument("--megabytes", type=int, default=64, help="Size of the synthesized audio")
+    parser.add_argument("--sentences", type=int, default=8, help="Number of sentences to join")
+    args = parser.parse_args()
+    
+    size = args.megabytes * 1024 * 1024
+    audio = make_wav(size)
+    sentences = [make_wav(size // args.sentences) for _ in range(args.sentences)]
+    
+    print(f"Audio size: {len(audio) / 1e6:.1f} MB, {args.sentences} sentences\n")
+    
+    async def streaming_response():
+        return await send_response(StreamingResponse(io.BytesIO(audio), media_type="audio/wav"), audio)
+    
+    async def plain_response():
+        return await send_response(Response(content=audio, media_type="audio/wav"), audio)
+    
+    async def decoded_concatenation():
+        concatenate_wav_decoded(sentences)
+    
+    async def view_concatenation():
+        concatenate_wav(sentences)
+    
+    measure("StreamingResponse(io.BytesIO(audio))", size, streaming_response)
+    measure("Response(content=audio)", size, plain_response)
+    measure("concatenate_wav (decode and re-encode)", size, decoded_concatenation)
+    measure("concatenate_wav (frame views)", size, view_concatenation)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+from typing import Any, Callable
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from src.utils import json_codec
+
+
+class ORJSONRequest(Request):
+    """
+    Request whose JSON body is parsed with orjson.
+    """
+    
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = json_codec.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """
+    Route that parses JSON request bodies with orjson.
+    """
+    
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+        
+        async def route_handler(request: Request) -> Response:
+            request = ORJSONRequest(request.scope, request.receive)
+            return await original_route_handler(request)
+        
+        return route_handler
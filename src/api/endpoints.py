@@ -1,15 +1,37 @@
 import io
+import json
+import math
 import time
 import asyncio
 import os
-from typing import List, Dict, Any, Optional
+from contextlib import aclosing, suppress
+from typing import AsyncIterator, Awaitable, List, Dict, Any, Optional, Union
 
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form, BackgroundTasks, Depends
-from fastapi.responses import StreamingResponse
+from fastapi import (
+    APIRouter,
+    HTTPException,
+    UploadFile,
+    File,
+    Form,
+    Header,
+    Query,
+    Request,
+    BackgroundTasks,
+    Depends,
+    WebSocket,
+    WebSocketDisconnect
+)
+from fastapi.responses import Response, StreamingResponse
 from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
+from starlette.background import BackgroundTask
 
+from src.api.codec import ORJSONRoute
+from src.api.responses import OpenFileResponse
 from src.config import get_settings, get_pipeline_config
+from src.orchestrator.batch import BatchItem, BatchTranslator
+from src.orchestrator.jobs import get_job_manager
 from src.orchestrator.pipeline import get_pipeline, TranslationPipeline
+from src.orchestrator.streaming import SUPPORTED_SAMPLE_RATES, OpusDecoder, UtteranceSegmenter
 from src.api.models import (
     TranslationRequest,
     HealthResponse,
@@ -17,17 +39,33 @@ from src.api.models import (
     LanguagesResponse,
     ConfigResponse,
     ErrorResponse,
+    JobResponse,
     get_language_name
 )
-from src.utils.errors import PipelineError
+from src.utils.audio import write_wav
+from src.utils.disk_cache import CachedAudioFile
+from src.utils.errors import (
+    NeuralBabelError,
+    OverloadedError,
+    PipelineError,
+    RateLimitError,
+    ValidationError,
+    error_status_code
+)
+from src.utils import deadline, json_codec
+from src.utils.admission import AdmissionController
+from src.utils.spool import SPOOL_CHUNK_SIZE, SpooledAudio, spool_stream
+from src.utils.tenancy import DEFAULT_TENANT, TenantLimiter, estimate_audio_seconds
 from src.utils.metrics import (
     SYSTEM_MEMORY_USAGE,
-    SYSTEM_CPU_USAGE
+    SYSTEM_CPU_USAGE,
+    TENANT_AUDIO_SECONDS,
+    TENANT_REQUESTS
 )
 from src.logging_setup import get_logger
 
-# Create router
-router = APIRouter()
+# Create router; JSON request bodies are parsed with orjson
+router = APIRouter(route_class=ORJSONRoute)
 
 # Get logger
 logger = get_logger(__name__)
@@ -41,6 +79,57 @@ pipeline_config = get_pipeline_config(settings)
 # Create pipeline
 pipeline = get_pipeline(pipeline_config)
 
+# Limit concurrent translations and shed load beyond a bounded queue
+admission_controller = AdmissionController(
+    max_in_flight=pipeline_config.admission_max_in_flight,
+    max_queue=pipeline_config.admission_max_queue,
+    max_wait=pipeline_config.admission_max_wait
+)
+
+# Per-tenant quotas
+tenant_limiter = TenantLimiter(pipeline_config.tenants)
+
+# Create the job manager; None if asynchronous jobs are not configured. Job
+# runs go through admission control like interactive requests
+job_manager = get_job_manager(pipeline, pipeline_config, admission_controller, tenant_limiter)
+
+
+async def get_tenant(
+    tenant_id: Optional[str] = Header(None, alias="X-Tenant-ID"),
+    api_key: Optional[str] = Header(None, alias="X-API-Key")
+) -> str:
+    """
+    Identify the tenant of a request from its API key or tenant header.
+    """
+    tenant = tenant_limiter.resolve_tenant(tenant_id, api_key)
+    if tenant is None:
+        raise HTTPException(status_code=401, detail="Invalid API key")
+    return tenant
+
+
+async def apply_deadline(
+    timeout_ms: Optional[str] = Header(None, alias=deadline.DEADLINE_HEADER)
+) -> None:
+    """
+    Set the request deadline from the deadline header, or the configured
+    default if the header is absent.
+    """
+    if timeout_ms is None:
+        if pipeline_config.request_timeout > 0:
+            deadline.set_deadline(pipeline_config.request_timeout)
+        return
+    
+    try:
+        timeout = float(timeout_ms) / 1000
+    except ValueError:
+        timeout = 0.0
+    if timeout <= 0:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid {deadline.DEADLINE_HEADER} header: {timeout_ms}"
+        )
+    deadline.set_deadline(timeout)
+
 
 # Health check endpoint
 @router.get("/health", response_model=HealthResponse)
@@ -51,10 +140,12 @@ async def health_check():
     try:
         # Check component services health
         services_health = await pipeline.check_services_health()
+        circuit_breakers = pipeline.circuit_breaker_states()
         
-        # Determine overall status
+        # Determine overall status; a breaker that is not closed means a
+        # service is being failed fast even if it answers health checks
         if all(services_health.values()):
-            status = "ok"
+            status = "ok" if all(state == "closed" for state in circuit_breakers.values()) else "degraded"
         elif any(services_health.values()):
             status = "degraded"
         else:
@@ -67,7 +158,8 @@ async def health_check():
         return HealthResponse(
             status=status,
             version=version,
-            services=services_health
+            services=services_health,
+            circuit_breakers=circuit_breakers
         )
     except Exception as e:
         logger.error("Health check failed", error=str(e), exc_info=True)
@@ -183,59 +275,587 @@ async def get_languages():
 
 
 # Translation endpoint with form data
-@router.post("/translate")
+@router.post("/translate", dependencies=[Depends(apply_deadline)])
 async def translate_speech_form(
+    request: Request,
     audio: UploadFile = File(...),
     source_lang: str = Form(...),
     target_lang: str = Form(...),
     audio_format: str = Form("wav"),
     voice: str = Form("default"),
+    stream: bool = Form(False),
+    tenant: str = Depends(get_tenant),
     background_tasks: BackgroundTasks = None
 ):
     """
     Translate speech from source language to target language using form data.
     """
-    # Read audio data
-    audio_data = await audio.read()
+    # Keep the upload in its spooled temporary file; it is streamed to ASR
+    # from there rather than read into memory
+    audio_data = SpooledAudio(audio.file)
     
     # Call the main translation function
-    return await translate_speech_internal(
-        audio_data=audio_data,
-        source_lang=source_lang,
-        target_lang=target_lang,
-        audio_format=audio_format,
-        voice=voice,
-        background_tasks=background_tasks
+    return await run_until_disconnect(
+        request,
+        translate_speech_internal(
+            audio_data=audio_data,
+            source_lang=source_lang,
+            target_lang=target_lang,
+            audio_format=audio_format,
+            voice=voice,
+            stream=stream,
+            tenant=tenant,
+            background_tasks=background_tasks
+        )
     )
 
 
 # Translation endpoint with JSON
-@router.post("/translate/json")
+@router.post("/translate/json", dependencies=[Depends(apply_deadline)])
 async def translate_speech_json(
     request: TranslationRequest,
+    http_request: Request,
+    tenant: str = Depends(get_tenant),
     background_tasks: BackgroundTasks = None
 ):
     """
     Translate speech from source language to target language using JSON.
     """
     # Call the main translation function
-    return await translate_speech_internal(
-        audio_data=request.audio,
-        source_lang=request.source_lang,
-        target_lang=request.target_lang,
-        audio_format=request.audio_format,
-        voice=request.voice,
-        background_tasks=background_tasks
+    return await run_until_disconnect(
+        http_request,
+        translate_speech_internal(
+            audio_data=request.audio,
+            source_lang=request.source_lang,
+            target_lang=request.target_lang,
+            audio_format=request.audio_format,
+            voice=request.voice,
+            stream=request.stream,
+            tenant=tenant,
+            background_tasks=background_tasks
+        )
     )
 
 
+# Translation endpoint with a raw audio body
+@router.post("/translate/raw", dependencies=[Depends(apply_deadline)])
+async def translate_speech_raw(
+    request: Request,
+    source_lang: Optional[str] = Query(None),
+    target_lang: Optional[str] = Query(None),
+    audio_format: Optional[str] = Query(None),
+    voice: Optional[str] = Query(None),
+    stream: bool = Query(False),
+    source_lang_header: Optional[str] = Header(None, alias="X-Source-Language"),
+    target_lang_header: Optional[str] = Header(None, alias="X-Target-Language"),
+    audio_format_header: Optional[str] = Header(None, alias="X-Audio-Format"),
+    voice_header: Optional[str] = Header(None, alias="X-Voice"),
+    tenant: str = Depends(get_tenant),
+    background_tasks: BackgroundTasks = None
+):
+    """
+    Translate speech sent as the raw request body (application/octet-stream).
+    
+    Parameters are taken from the query string, falling back to the
+    X-Source-Language, X-Target-Language, X-Audio-Format and X-Voice headers.
+    """
+    source_lang = source_lang or source_lang_header
+    target_lang = target_lang or target_lang_header
+    if not source_lang or not target_lang:
+        raise HTTPException(
+            status_code=400,
+            detail="source_lang and target_lang are required as query parameters or headers"
+        )
+    
+    # Spool the body as it arrives instead of buffering it in memory
+    audio_data = await spool_stream(request.stream())
+    
+    try:
+        # Call the main translation function
+        response = await run_until_disconnect(
+            request,
+            translate_speech_internal(
+                audio_data=audio_data,
+                source_lang=source_lang,
+                target_lang=target_lang,
+                audio_format=audio_format or audio_format_header or "wav",
+                voice=voice or voice_header or "default",
+                stream=stream,
+                tenant=tenant,
+                background_tasks=background_tasks
+            )
+        )
+    except BaseException:
+        audio_data.file.close()
+        raise
+    
+    # Release the spooled body once the response has been sent
+    background_tasks.add_task(audio_data.file.close)
+    
+    return response
+
+
+# Batch translation endpoint
+@router.post("/translate/batch")
+async def translate_speech_batch(
+    files: List[UploadFile] = File(...),
+    source_lang: Optional[str] = Form(None),
+    target_lang: Optional[str] = Form(None),
+    audio_format: str = Form("wav"),
+    voice: str = Form("default"),
+    manifest: Optional[str] = Form(None),
+    tenant: str = Depends(get_tenant)
+):
+    """
+    Translate many clips in one request.
+    
+    Every uploaded file is one item. ``manifest`` is an optional JSON list
+    with one object per file, in upload order, that can set ``id``,
+    ``source_lang``, ``target_lang``, ``audio_format`` and ``voice`` per item;
+    the form fields are the defaults.
+    
+    Results are streamed as NDJSON, one line per item in completion order,
+    with the translated audio base64 encoded or a per-item error.
+    """
+    if len(files) > pipeline_config.batch_max_items:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch has {len(files)} items; the limit is {pipeline_config.batch_max_items}"
+        )
+    
+    # Per-item overrides
+    overrides: List[Dict[str, Any]] = [{} for _ in files]
+    if manifest is not None:
+        try:
+            overrides = json_codec.loads(manifest)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid manifest: {str(e)}")
+        if not isinstance(overrides, list) or len(overrides) != len(files):
+            raise HTTPException(
+                status_code=400,
+                detail="Manifest must be a JSON list with one entry per file"
+            )
+    
+    # Check every item has a language pair before any work starts
+    for index, override in enumerate(overrides):
+        if not isinstance(override, dict):
+            raise HTTPException(status_code=400, detail=f"Manifest entry {index} must be an object")
+        if not (override.get("source_lang") or source_lang) or not (override.get("target_lang") or target_lang):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Item {index} has no source_lang or target_lang"
+            )
+    
+    # Uploads are closed once this handler returns, so spool each one into a
+    # file owned by the response
+    items = []
+    try:
+        for index, (upload, override) in enumerate(zip(files, overrides)):
+            audio_data = await spool_stream(read_upload(upload))
+            items.append(
+                BatchItem(
+                    item_id=str(override.get("id") or upload.filename or index),
+                    audio_data=audio_data,
+                    source_lang=override.get("source_lang") or source_lang,
+                    target_lang=override.get("target_lang") or target_lang,
+                    audio_format=override.get("audio_format") or audio_format,
+                    voice=override.get("voice") or voice
+                )
+            )
+    except BaseException:
+        close_batch_items(items)
+        raise
+    
+    # The whole batch is charged to the tenant's quotas up front
+    try:
+        tenant_limiter.check(
+            tenant,
+            sum(estimate_audio_seconds(item.audio_data, item.audio_format) for item in items),
+            requests=len(items)
+        )
+    except OverloadedError as e:
+        close_batch_items(items)
+        raise overloaded_exception(e)
+    
+    # Each item is admitted on its own, queued fairly against other tenants
+    translator = BatchTranslator(
+        pipeline,
+        pipeline_config.batch_max_concurrency,
+        admission=admission_controller,
+        tenant=tenant,
+        weight=tenant_limiter.weight(tenant)
+    )
+    
+    async def results():
+        async with aclosing(translator.run(items)) as outcomes:
+            async for result in outcomes:
+                yield json_codec.dumps(result) + b"\n"
+    
+    body = results()
+    
+    async def finish():
+        # After a disconnect the stream is abandoned mid-iteration; closing it
+        # cancels the outstanding items and frees their concurrency slots
+        await body.aclose()
+        close_batch_items(items)
+    
+    return StreamingResponse(
+        body,
+        media_type="application/x-ndjson",
+        background=BackgroundTask(finish)
+    )
+
+
+async def read_upload(upload: UploadFile) -> AsyncIterator[bytes]:
+    """
+    Read an uploaded file in chunks.
+    
+    Args:
+        upload: Uploaded file
+    
+    Yields:
+        bytes: File chunks
+    """
+    while True:
+        chunk = await upload.read(SPOOL_CHUNK_SIZE)
+        if not chunk:
+            break
+        yield chunk
+
+
+def close_batch_items(items: List[BatchItem]) -> None:
+    """
+    Release the spooled audio of batch items.
+    
+    Args:
+        items: Batch items
+    """
+    for item in items:
+        item.audio_data.file.close()
+
+
+# Asynchronous translation job endpoints
+@router.post("/jobs", response_model=JobResponse, status_code=202)
+async def submit_job(
+    audio: UploadFile = File(...),
+    source_lang: str = Form(...),
+    target_lang: str = Form(...),
+    audio_format: str = Form("wav"),
+    voice: str = Form("default"),
+    tenant: str = Depends(get_tenant)
+):
+    """
+    Queue a translation job; poll ``GET /jobs/{job_id}`` for its progress.
+    """
+    if job_manager is None:
+        raise HTTPException(status_code=503, detail="Asynchronous jobs are not enabled")
+    
+    # Validate language pair
+    if (source_lang, target_lang) not in pipeline_config.supported_language_pairs:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported language pair: {source_lang} to {target_lang}"
+        )
+    
+    # Jobs count against the tenant's quotas when they are submitted
+    audio_data = SpooledAudio(audio.file)
+    try:
+        tenant_limiter.check(tenant, estimate_audio_seconds(audio_data, audio_format))
+    except OverloadedError as e:
+        raise overloaded_exception(e)
+    
+    job_id = await job_manager.submit(
+        audio_file=audio_data.open(),
+        source_lang=source_lang,
+        target_lang=target_lang,
+        audio_format=audio_format,
+        voice=voice,
+        tenant=tenant
+    )
+    
+    return get_job_response(await job_manager.get(job_id))
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str, tenant: str = Depends(get_tenant)):
+    """
+    Get the status of a translation job.
+    """
+    return get_job_response(await get_tenant_job(job_id, tenant))
+
+
+@router.get("/jobs/{job_id}/audio")
+async def get_job_audio(job_id: str, tenant: str = Depends(get_tenant)):
+    """
+    Download the translated audio of a completed job.
+    """
+    job = await get_tenant_job(job_id, tenant)
+    if job["status"] != "completed":
+        raise HTTPException(status_code=409, detail=f"Job is {job['status']}")
+    
+    # No speech in the input means no translated audio
+    if not job["output_size"]:
+        return Response(status_code=204)
+    
+    # Open the file up front, so a job purged meanwhile is a 404 and not a
+    # failed response
+    output_path = job_manager.output_path(job)
+    try:
+        output_file = await asyncio.to_thread(open, output_path, "rb")
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Job audio not found: {job_id}")
+    
+    return OpenFileResponse(
+        output_file,
+        output_path,
+        media_type=get_content_type(job["audio_format"])
+    )
+
+
+async def get_tenant_job(job_id: str, tenant: str) -> Dict[str, Any]:
+    """
+    Look up a job of the calling tenant.
+    
+    Another tenant's job is reported as not found, so job IDs cannot be
+    probed across tenants.
+    
+    Args:
+        job_id: Job ID
+        tenant: Calling tenant
+    
+    Returns:
+        Dict[str, Any]: Job
+    """
+    if job_manager is None:
+        raise HTTPException(status_code=503, detail="Asynchronous jobs are not enabled")
+    
+    job = await job_manager.get(job_id)
+    if job is None or job["tenant"] != tenant:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job
+
+
+def get_job_response(job: Dict[str, Any]) -> JobResponse:
+    """
+    Build the API view of a job.
+    
+    Args:
+        job: Job from the job store
+    
+    Returns:
+        JobResponse: Job response
+    """
+    return JobResponse(
+        job_id=job["id"],
+        status=job["status"],
+        stage=job["stage"],
+        source_lang=job["source_lang"],
+        target_lang=job["target_lang"],
+        audio_format=job["audio_format"],
+        attempts=job["attempts"],
+        created_at=job["created_at"],
+        started_at=job["started_at"],
+        finished_at=job["finished_at"],
+        output_size=job["output_size"],
+        error=job["error"],
+        details=job["details"]
+    )
+
+
+def get_content_type(audio_format: str) -> str:
+    """
+    Get the content type for an audio format.
+    
+    Args:
+        audio_format: Audio format
+    
+    Returns:
+        str: Content type
+    """
+    return {
+        "wav": "audio/wav",
+        "mp3": "audio/mpeg",
+        "ogg": "audio/ogg"
+    }.get(audio_format, "application/octet-stream")
+
+
+def overloaded_exception(error: OverloadedError) -> HTTPException:
+    """
+    Build the 429 response for a request that was rate limited or shed.
+    
+    Args:
+        error: Overload error
+    
+    Returns:
+        HTTPException: HTTP exception with a Retry-After header
+    """
+    return HTTPException(
+        status_code=429,
+        detail=ErrorResponse(
+            error=str(error),
+            status_code=429,
+            details=error.details
+        ).dict(),
+        headers={"Retry-After": str(math.ceil(error.retry_after))}
+    )
+
+
+async def wait_for_disconnect(request: Request) -> None:
+    """
+    Wait until the client disconnects.
+    
+    Only call this once the request body has been read.
+    
+    Args:
+        request: HTTP request
+    """
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+async def run_until_disconnect(request: Request, work: Awaitable[Response]) -> Response:
+    """
+    Produce a response, cancelling the work if the client disconnects first.
+    
+    Cancelling the work aborts in-flight calls to the ASR, translation and
+    TTS services, skips any pending retries and gives up its admission slot.
+    
+    Args:
+        request: HTTP request, with its body already read
+        work: Awaitable producing the response
+    
+    Returns:
+        Response: The response, or an empty 499 response if the client
+        disconnected
+    """
+    task = asyncio.ensure_future(work)
+    watcher = asyncio.ensure_future(wait_for_disconnect(request))
+    try:
+        await asyncio.wait({task, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    except asyncio.CancelledError:
+        task.cancel()
+        watcher.cancel()
+        raise
+    
+    watcher.cancel()
+    if task.done():
+        return task.result()
+    
+    # The client is gone: stop the work and let it unwind
+    task.cancel()
+    with suppress(asyncio.CancelledError):
+        await task
+    
+    logger.info("Client disconnected, cancelled translation", path=request.url.path)
+    return Response(status_code=499)
+
+
 # Internal translation function
 async def translate_speech_internal(
-    audio_data: bytes,
+    audio_data: Union[bytes, SpooledAudio],
+    source_lang: str,
+    target_lang: str,
+    audio_format: str,
+    voice: str,
+    stream: bool = False,
+    tenant: str = DEFAULT_TENANT,
+    background_tasks: BackgroundTasks = None
+):
+    """
+    Run a translation once the tenant's quotas and admission control let it in.
+    
+    Requests over quota or shed by admission control get a 429 with
+    Retry-After. Queued requests are admitted fairly across tenants, by
+    weight and input audio duration. A streamed response holds its slot
+    until the stream ends.
+    """
+    audio_seconds = estimate_audio_seconds(audio_data, audio_format)
+    
+    try:
+        tenant_limiter.check(tenant, audio_seconds)
+    except RateLimitError as e:
+        raise overloaded_exception(e)
+    
+    try:
+        await admission_controller.acquire(
+            tenant=tenant,
+            cost=audio_seconds,
+            weight=tenant_limiter.weight(tenant)
+        )
+    except BaseException as e:
+        # The request never ran, so it does not count against the quotas
+        tenant_limiter.refund(tenant, audio_seconds)
+        if isinstance(e, OverloadedError):
+            TENANT_REQUESTS.labels(tenant=tenant, outcome="shed").inc()
+            raise overloaded_exception(e)
+        raise
+    
+    TENANT_REQUESTS.labels(tenant=tenant, outcome="admitted").inc()
+    TENANT_AUDIO_SECONDS.labels(tenant=tenant).inc(audio_seconds)
+    
+    start_time = time.monotonic()
+    try:
+        response = await run_translation(
+            audio_data=audio_data,
+            source_lang=source_lang,
+            target_lang=target_lang,
+            audio_format=audio_format,
+            voice=voice,
+            stream=stream,
+            background_tasks=background_tasks
+        )
+    except BaseException:
+        admission_controller.release(time.monotonic() - start_time)
+        raise
+    
+    if not isinstance(response, StreamingResponse):
+        admission_controller.release(time.monotonic() - start_time)
+        return response
+    
+    body_iterator = response.body_iterator
+    released = False
+    
+    def release_slot() -> None:
+        nonlocal released
+        if not released:
+            released = True
+            admission_controller.release(time.monotonic() - start_time)
+    
+    async def release_when_done():
+        try:
+            async with aclosing(body_iterator):
+                async for chunk in body_iterator:
+                    yield chunk
+        finally:
+            release_slot()
+    
+    response.body_iterator = release_when_done()
+    
+    async def close_stream() -> None:
+        try:
+            await response.body_iterator.aclose()
+            await body_iterator.aclose()
+        finally:
+            release_slot()
+    
+    # Close the stream, and with it the pipeline, if the client disconnects
+    # part way through. A generator closed before it started never runs its
+    # finally block, so the slot is given back here as well
+    if background_tasks:
+        background_tasks.add_task(close_stream)
+    
+    return response
+
+
+async def run_translation(
+    audio_data: Union[bytes, SpooledAudio],
     source_lang: str,
     target_lang: str,
     audio_format: str,
     voice: str,
+    stream: bool = False,
     background_tasks: BackgroundTasks = None
 ):
     """
@@ -253,6 +873,28 @@ async def translate_speech_internal(
                 detail=f"Unsupported language pair: {source_lang} to {target_lang}"
             )
         
+        # Stream audio sentence by sentence as it is synthesized
+        if stream:
+            audio_chunks = await pipeline.translate_speech_stream(
+                audio_data=audio_data,
+                source_lang=source_lang,
+                target_lang=target_lang,
+                audio_format=audio_format,
+                voice=voice
+            )
+            
+            if background_tasks:
+                background_tasks.add_task(cleanup_resources)
+            
+            return StreamingResponse(
+                audio_chunks,
+                media_type=get_content_type(audio_format),
+                headers={
+                    "X-Source-Language": source_lang,
+                    "X-Target-Language": target_lang
+                }
+            )
+        
         # Perform translation
         audio_output = await pipeline.translate_speech(
             audio_data=audio_data,
@@ -270,21 +912,34 @@ async def translate_speech_internal(
             background_tasks.add_task(cleanup_resources)
         
         # Determine content type based on format
-        content_type = {
-            "wav": "audio/wav",
-            "mp3": "audio/mpeg",
-            "ogg": "audio/ogg"
-        }.get(audio_format, "application/octet-stream")
+        content_type = get_content_type(audio_format)
+        
+        headers = {
+            "X-Processing-Time": str(latency),
+            "X-Source-Language": source_lang,
+            "X-Target-Language": target_lang
+        }
+        
+        # No speech in the input means no translated audio
+        if not isinstance(audio_output, CachedAudioFile) and not audio_output:
+            return Response(status_code=204, headers=headers)
         
-        # Return audio stream
-        return StreamingResponse(
-            io.BytesIO(audio_output),
+        # Serve cached audio straight from its file, which the cache opened
+        # so it cannot be evicted from under the response
+        if isinstance(audio_output, CachedAudioFile):
+            return OpenFileResponse(
+                await asyncio.to_thread(audio_output.open),
+                audio_output.path,
+                media_type=content_type,
+                headers=headers
+            )
+        
+        # The response takes ownership of the synthesized buffer and sends it
+        # as a single body, without another copy
+        return Response(
+            content=audio_output,
             media_type=content_type,
-            headers={
-                "X-Processing-Time": str(latency),
-                "X-Source-Language": source_lang,
-                "X-Target-Language": target_lang
-            }
+            headers=headers
         )
     except PipelineError as e:
         # Log error
@@ -297,12 +952,14 @@ async def translate_speech_internal(
             target_lang=target_lang
         )
         
+        status_code = error_status_code(e)
+        
         # Return error response
         raise HTTPException(
-            status_code=500,
+            status_code=status_code,
             detail=ErrorResponse(
                 error=str(e),
-                status_code=500,
+                status_code=status_code,
                 details=e.details,
                 stage=e.stage
             ).dict()
@@ -310,6 +967,26 @@ async def translate_speech_internal(
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
+    except NeuralBabelError as e:
+        # Raised outside a stage, such as a deadline passing while a call
+        # waits for a micro-batch
+        logger.error(
+            "Translation error",
+            error=str(e),
+            details=e.details,
+            source_lang=source_lang,
+            target_lang=target_lang
+        )
+        
+        status_code = error_status_code(e)
+        raise HTTPException(
+            status_code=status_code,
+            detail=ErrorResponse(
+                error=str(e),
+                status_code=status_code,
+                details=e.details
+            ).dict()
+        )
     except Exception as e:
         # Log error
         logger.error(
@@ -330,6 +1007,260 @@ async def translate_speech_internal(
         )
 
 
+# Real-time translation over a WebSocket
+@router.websocket("/ws/translate")
+async def translate_speech_websocket(
+    websocket: WebSocket,
+    source_lang: str = Query(...),
+    target_lang: str = Query(...),
+    voice: str = Query("default"),
+    encoding: str = Query("pcm16"),
+    sample_rate: int = Query(16000),
+    tenant_id: Optional[str] = Header(None, alias="X-Tenant-ID"),
+    api_key: Optional[str] = Header(None, alias="X-API-Key")
+):
+    """
+    Translate live speech sent as binary frames of 16-bit mono PCM or Opus.
+    
+    The stream is cut into utterances at pauses. For each utterance the
+    transcript and translation are sent as JSON messages, followed by the
+    translated WAV audio as a binary message and an ``utterance_end`` message.
+    Send ``{"type": "end"}`` to flush the last utterance and close.
+    
+    A frame that cannot be decoded gets an ``error`` message and closes the
+    connection with code 1007. If translation falls more than
+    ``stream_max_queued_utterances`` utterances behind the stream, the
+    connection is closed with code 1013 so the client can reconnect later.
+    
+    Each utterance goes through admission control for the tenant; one that
+    is shed gets an ``error`` message and the stream carries on.
+    """
+    # Real-time translation is opt-in
+    if not pipeline_config.enable_streaming:
+        await websocket.close(code=1008, reason="Streaming is disabled")
+        return
+    
+    tenant = tenant_limiter.resolve_tenant(tenant_id, api_key)
+    if tenant is None:
+        await websocket.close(code=1008, reason="Invalid API key")
+        return
+    
+    # Validate language pair
+    if (source_lang, target_lang) not in pipeline_config.supported_language_pairs:
+        await websocket.close(
+            code=1008,
+            reason=f"Unsupported language pair: {source_lang} to {target_lang}"
+        )
+        return
+    
+    if sample_rate not in SUPPORTED_SAMPLE_RATES:
+        await websocket.close(code=1003, reason=f"Unsupported sample rate: {sample_rate}")
+        return
+    
+    # Set up the decoder for the input encoding
+    decoder = None
+    if encoding == "opus":
+        try:
+            decoder = OpusDecoder(sample_rate)
+        except ValidationError as e:
+            await websocket.close(code=1003, reason=str(e))
+            return
+    elif encoding != "pcm16":
+        await websocket.close(code=1003, reason=f"Unsupported encoding: {encoding}")
+        return
+    
+    await websocket.accept()
+    
+    segmenter = UtteranceSegmenter(
+        sample_rate,
+        silence_threshold_db=pipeline_config.stream_silence_threshold_db,
+        min_silence_ms=pipeline_config.stream_min_silence_ms,
+        max_utterance_seconds=pipeline_config.stream_max_utterance_seconds
+    )
+    
+    # Utterances are translated in order by a worker so that receiving
+    # audio never waits on the pipeline
+    utterances: asyncio.Queue = asyncio.Queue(maxsize=pipeline_config.stream_max_queued_utterances)
+    worker = asyncio.create_task(
+        process_utterances(
+            websocket=websocket,
+            utterances=utterances,
+            source_lang=source_lang,
+            target_lang=target_lang,
+            voice=voice,
+            sample_rate=sample_rate,
+            tenant=tenant
+        )
+    )
+    
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+            
+            if message.get("bytes") is not None:
+                try:
+                    pcm = decoder.decode(message["bytes"]) if decoder else message["bytes"]
+                except ValidationError as e:
+                    await websocket.send_json({"type": "error", "error": str(e)})
+                    await websocket.close(code=1007, reason="Invalid audio frame")
+                    return
+                
+                for utterance in segmenter.feed(pcm):
+                    if worker.done():
+                        # The worker failed and has closed the stream
+                        return
+                    try:
+                        utterances.put_nowait(utterance)
+                    except asyncio.QueueFull:
+                        # Live audio cannot wait, so give up rather than fall
+                        # further behind
+                        logger.warning(
+                            "WebSocket translation falling behind, closing stream",
+                            queued=utterances.qsize(),
+                            source_lang=source_lang,
+                            target_lang=target_lang
+                        )
+                        await websocket.close(code=1013, reason="Translation is falling behind")
+                        return
+            elif message.get("text") is not None:
+                try:
+                    control = json.loads(message["text"])
+                except ValueError:
+                    control = None
+                if not isinstance(control, dict):
+                    await websocket.send_json({"type": "error", "error": "Control messages must be JSON objects"})
+                    await websocket.close(code=1007, reason="Invalid control message")
+                    return
+                if control.get("type") == "end":
+                    break
+        
+        # Flush the last utterance and wait for its translation
+        utterance = segmenter.flush()
+        if utterance is not None:
+            await utterances.put(utterance)
+        await utterances.put(None)
+        await worker
+        
+        await websocket.close()
+    except WebSocketDisconnect:
+        logger.info("WebSocket client disconnected", source_lang=source_lang, target_lang=target_lang)
+    finally:
+        # Stop translating utterances nobody will receive
+        worker.cancel()
+
+
+async def process_utterances(
+    websocket: WebSocket,
+    utterances: asyncio.Queue,
+    source_lang: str,
+    target_lang: str,
+    voice: str,
+    sample_rate: int,
+    tenant: str = DEFAULT_TENANT
+):
+    """
+    Translate queued utterances one at a time and send the results.
+    
+    Args:
+        websocket: Client connection
+        utterances: Queue of utterance PCM, terminated by None
+        source_lang: Source language code
+        target_lang: Target language code
+        voice: Voice ID for synthesis
+        sample_rate: Sample rate of the utterance PCM
+        tenant: Tenant the stream belongs to
+    """
+    try:
+        index = 0
+        while True:
+            pcm = await utterances.get()
+            if pcm is None:
+                return
+            
+            # Each utterance is admitted like a single request
+            try:
+                await admission_controller.acquire(
+                    tenant=tenant,
+                    cost=len(pcm) / (2 * sample_rate),
+                    weight=tenant_limiter.weight(tenant)
+                )
+            except OverloadedError as e:
+                TENANT_REQUESTS.labels(tenant=tenant, outcome="shed").inc()
+                await websocket.send_json({
+                    "type": "error",
+                    "utterance": index,
+                    "error": str(e),
+                    "retry_after": e.retry_after
+                })
+                index += 1
+                continue
+            
+            start_time = time.monotonic()
+            try:
+                events = pipeline.translate_utterance(
+                    audio_data=write_wav((1, 2, sample_rate), pcm),
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                    voice=voice
+                )
+                async for event in events:
+                    if event["type"] == "audio":
+                        await websocket.send_bytes(event["audio"])
+                    else:
+                        await websocket.send_json({**event, "utterance": index})
+                
+                await websocket.send_json({"type": "utterance_end", "utterance": index})
+            except WebSocketDisconnect:
+                raise
+            except Exception as e:
+                # Report the failure and keep serving the stream
+                stage = getattr(e, "stage", None)
+                if isinstance(e, NeuralBabelError):
+                    message = str(e)
+                    logger.error(
+                        "Utterance translation failed",
+                        error=message,
+                        stage=stage,
+                        source_lang=source_lang,
+                        target_lang=target_lang
+                    )
+                else:
+                    message = f"Unexpected error: {str(e)}"
+                    logger.error(
+                        "Unexpected error translating utterance",
+                        error=str(e),
+                        source_lang=source_lang,
+                        target_lang=target_lang,
+                        exc_info=True
+                    )
+                await websocket.send_json({
+                    "type": "error",
+                    "utterance": index,
+                    "error": message,
+                    "stage": stage
+                })
+            finally:
+                admission_controller.release(time.monotonic() - start_time)
+            
+            index += 1
+    except WebSocketDisconnect:
+        raise
+    except Exception as e:
+        # The worker cannot carry on, so end the stream rather than let the
+        # queue fill up behind it
+        logger.error(
+            "WebSocket translation worker failed",
+            error=str(e),
+            source_lang=source_lang,
+            target_lang=target_lang,
+            exc_info=True
+        )
+        with suppress(Exception):
+            await websocket.close(code=1011, reason="Translation failed")
+
+
 # Cleanup function
 async def cleanup_resources():
     """
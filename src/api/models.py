@@ -11,6 +11,7 @@ class TranslationRequest(BaseModel):
     target_lang: str = Field(..., description="Target language code")
     audio_format: str = Field("wav", description="Audio format (wav, mp3, ogg)")
     voice: str = Field("default", description="Voice ID for synthesis")
+    stream: bool = Field(False, description="Stream the audio sentence by sentence as it is synthesized")
 
 
 class HealthResponse(BaseModel):
@@ -20,6 +21,10 @@ class HealthResponse(BaseModel):
     status: str = Field(..., description="Health status (ok, degraded, error)")
     version: str = Field(..., description="Service version")
     services: Dict[str, bool] = Field(..., description="Health status of component services")
+    circuit_breakers: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Circuit breaker state of component services (closed, open, half_open)"
+    )
     details: Optional[Dict[str, Any]] = Field(None, description="Additional health details")
 
 
@@ -65,6 +70,25 @@ class ErrorResponse(BaseModel):
     stage: Optional[str] = Field(None, description="Pipeline stage where the error occurred")
 
 
+class JobResponse(BaseModel):
+    """
+    Response model for an asynchronous translation job.
+    """
+    job_id: str = Field(..., description="Job ID")
+    status: str = Field(..., description="Job status (queued, running, completed, failed)")
+    stage: Optional[str] = Field(None, description="Pipeline stage the job is in, or failed in")
+    source_lang: str = Field(..., description="Source language code")
+    target_lang: str = Field(..., description="Target language code")
+    audio_format: str = Field(..., description="Audio format")
+    attempts: int = Field(..., description="Number of times the job has been started")
+    created_at: float = Field(..., description="Submission time (Unix seconds)")
+    started_at: Optional[float] = Field(None, description="Time the latest attempt started (Unix seconds)")
+    finished_at: Optional[float] = Field(None, description="Completion time (Unix seconds)")
+    output_size: Optional[int] = Field(None, description="Size of the translated audio in bytes")
+    error: Optional[str] = Field(None, description="Error message if the job failed")
+    details: Optional[Dict[str, Any]] = Field(None, description="Additional error details")
+
+
 # Language name mapping
 LANGUAGE_NAMES = {
     "en": "English",
@@ -96,7 +120,7 @@ def get_language_name(lang_code: str) -> str:
     
     Args:
         lang_code: Language code
-        
+    
     Returns:
         str: Language name
     """
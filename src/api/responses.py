@@ -0,0 +1,79 @@
+import asyncio
+import os
+from typing import BinaryIO, Mapping, Optional
+
+from fastapi.responses import FileResponse
+from starlette.background import BackgroundTask
+from starlette.types import Receive, Scope, Send
+
+
+class OpenFileResponse(FileResponse):
+    """
+    File response that sends a file which is already open.
+    
+    Sending from the open descriptor rather than the path means the file
+    stays servable if it is evicted or purged, and deleted, after it was
+    looked up. When the server supports the ASGI zero-copy send extension
+    the file is handed to it for ``sendfile``; otherwise it is read in
+    chunks in worker threads, as ``FileResponse`` does. The file is closed
+    when the response ends, however it ends.
+    """
+    
+    def __init__(
+        self,
+        file: BinaryIO,
+        path: str,
+        media_type: Optional[str] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        background: Optional[BackgroundTask] = None
+    ):
+        """
+        Initialize the response.
+        
+        Args:
+            file: The file to send, opened in binary mode; the response
+                takes ownership of it
+            path: Path the file was opened from, used for its headers
+            media_type: Content type
+            headers: Extra response headers
+            background: Task to run after the response is sent
+        """
+        super().__init__(
+            path,
+            media_type=media_type,
+            headers=headers,
+            background=background,
+            stat_result=os.fstat(file.fileno())
+        )
+        self.file = file
+        self.size = self.stat_result.st_size
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await send({
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers
+            })
+            if scope["method"].upper() == "HEAD":
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+            elif "http.response.zerocopysend" in scope.get("extensions", {}):
+                await send({
+                    "type": "http.response.zerocopysend",
+                    "file": self.file,
+                    "offset": 0,
+                    "count": self.size,
+                    "more_body": False
+                })
+            else:
+                await asyncio.to_thread(self.file.seek, 0)
+                more_body = True
+                while more_body:
+                    chunk = await asyncio.to_thread(self.file.read, self.chunk_size)
+                    more_body = len(chunk) == self.chunk_size
+                    await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+        finally:
+            self.file.close()
+        
+        if self.background is not None:
+            await self.background()
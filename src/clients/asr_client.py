@@ -1,33 +1,53 @@
 import asyncio
-import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 
-import httpx
 from httpx import Response
 
-from src.config import ServiceConfig
+from src.config import LongAudioConfig, ServiceConfig
+from src.clients.http_pool import get_connection_pool
+from src.clients.retry import RetryPolicy
 from src.logging_setup import get_logger
 from src.orchestrator.service_discovery import get_service_discovery
-from src.utils.errors import ASRError
-from src.utils.metrics import SERVICE_REQUESTS, SERVICE_ERRORS, SERVICE_LATENCY
+from src.utils.audio import wav_duration
+from src.utils.cache import SingleFlight, TranscriptionCache
+from src.utils import json_codec
+from src.utils.errors import ASRError, NeuralBabelError, ValidationError
+from src.utils.long_audio import merge_transcriptions, split_wav_on_silence
+from src.utils.spool import SpooledAudio
 
 logger = get_logger(__name__)
 
+# Bytes read from spooled audio to find the WAV header
+WAV_HEADER_PROBE_SIZE = 64 * 1024
+
 
 class ASRClient:
     """
     Client for the Kube-Whisperer ASR service.
     """
     
-    def __init__(self, service_config: ServiceConfig):
+    def __init__(
+        self,
+        service_config: ServiceConfig,
+        cache: Optional[TranscriptionCache] = None,
+        long_audio: Optional[LongAudioConfig] = None
+    ):
         """
         Initialize the ASR client.
         
         Args:
             service_config: Service configuration
+            cache: Transcription cache. If None, every call goes to the service.
+            long_audio: Chunking configuration for long recordings. If None,
+                audio is always sent in a single request.
         """
         self.service_config = service_config
+        self.cache = cache
+        self.long_audio = long_audio
+        self._in_flight = SingleFlight()
         self.service_discovery = get_service_discovery()
+        self.connection_pool = get_connection_pool()
+        self.retry_policy = RetryPolicy(service_config, self.connection_pool, ASRError, "ASR")
         self.base_url = None
     
     async def _get_base_url(self) -> str:
@@ -64,160 +84,224 @@ class ASRClient:
         # Get base URL
         base_url = await self._get_base_url()
         
-        # Construct URL
-        url = f"{base_url}{path}"
+        # Send with the shared retry policy
+        return await self.retry_policy.request(method, f"{base_url}{path}", path, **kwargs)
+    
+    async def transcribe(
+        self, 
+        audio_data: Union[bytes, SpooledAudio],
+        language: str,
+        audio_format: str = "wav"
+    ) -> str:
+        """
+        Transcribe audio to text.
         
-        # Set timeout
-        timeout = httpx.Timeout(self.service_config.timeout)
+        Args:
+            audio_data: Audio data, in memory or spooled to a file
+            language: Language code
+            audio_format: Audio format
+            
+        Returns:
+            str: Transcribed text
+            
+        Raises:
+            ASRError: If transcription fails
+        """
+        result = await self.transcribe_verbose(
+            audio_data=audio_data,
+            language=language,
+            audio_format=audio_format
+        )
+        return result.get("text", "")
+    
+    async def transcribe_verbose(
+        self, 
+        audio_data: Union[bytes, SpooledAudio],
+        language: str,
+        audio_format: str = "wav"
+    ) -> Dict[str, Any]:
+        """
+        Transcribe audio, returning the full ASR response including segments.
         
-        # Initialize retry count
-        retry_count = 0
+        When a cache is configured, results are cached by audio content hash
+        and concurrent identical requests share a single ASR call. The
+        returned dictionary may be shared and must not be mutated.
         
-        while True:
+        Args:
+            audio_data: Audio data, in memory or spooled to a file
+            language: Language code
+            audio_format: Audio format
+            
+        Returns:
+            Dict[str, Any]: ASR response with "text" and "segments"
+            
+        Raises:
+            ASRError: If transcription fails
+        """
+        if self.cache is None:
+            return await self._transcribe_audio(audio_data, language, audio_format)
+        
+        # Serve repeated uploads from the cache
+        cache_key = await self.cache.make_key(audio_data, language, audio_format)
+        cached_result = self.cache.get(cache_key)
+        if cached_result is not None:
+            logger.info(
+                "Transcription served from cache",
+                language=language,
+                audio_format=audio_format,
+                audio_size=len(audio_data)
+            )
+            return cached_result
+        
+        # The shared call can outlive this request, which closes its upload,
+        # so it reads from its own handle on the audio
+        shared_audio = audio_data
+        if isinstance(audio_data, SpooledAudio) and cache_key not in self._in_flight:
+            shared_audio = audio_data.clone()
+        
+        async def _transcribe_and_cache() -> Dict[str, Any]:
             try:
-                # Record start time
-                start_time = time.time()
-                
-                # Increment request counter
-                SERVICE_REQUESTS.labels(
-                    service="asr",
-                    operation=path
-                ).inc()
-                
-                # Make request
-                async with httpx.AsyncClient(timeout=timeout) as client:
-                    response = await client.request(
-                        method=method,
-                        url=url,
-                        **kwargs
-                    )
-                
-                # Record latency
-                latency = time.time() - start_time
-                SERVICE_LATENCY.labels(
-                    service="asr",
-                    operation=path
-                ).observe(latency)
-                
-                # Check response
-                if response.status_code >= 400:
-                    # Increment error counter
-                    SERVICE_ERRORS.labels(
-                        service="asr",
-                        operation=path,
-                        error_type=f"http_{response.status_code}"
-                    ).inc()
-                    
-                    # Log error
-                    logger.error(
-                        "ASR service request failed",
-                        status_code=response.status_code,
-                        response=response.text,
-                        url=url
-                    )
-                    
-                    # Raise error
-                    raise ASRError(
-                        f"ASR service request failed with status code {response.status_code}: {response.text}",
-                        response.status_code,
-                        {"response": response.text}
-                    )
-                
-                # Return response
-                return response
+                result = await self._transcribe_audio(shared_audio, language, audio_format)
+            finally:
+                if shared_audio is not audio_data:
+                    shared_audio.close()
+            self.cache.set_result(cache_key, result)
+            return result
+        
+        # Collapse concurrent identical requests into one ASR call
+        return await self._in_flight.run(cache_key, _transcribe_and_cache)
+    
+    async def _transcribe_audio(
+        self,
+        audio_data: Union[bytes, SpooledAudio],
+        language: str,
+        audio_format: str
+    ) -> Dict[str, Any]:
+        """
+        Transcribe audio in one request, or in parallel windows if it is a
+        long WAV recording and long-audio mode is enabled.
+        
+        Args:
+            audio_data: Audio data, in memory or spooled to a file
+            language: Language code
+            audio_format: Audio format
             
-            except httpx.TimeoutException as e:
-                # Increment error counter
-                SERVICE_ERRORS.labels(
-                    service="asr",
-                    operation=path,
-                    error_type="timeout"
-                ).inc()
-                
-                # Log error
-                logger.warning(
-                    "ASR service request timed out",
-                    retry_count=retry_count,
-                    max_retries=self.service_config.retries,
-                    url=url
-                )
-                
-                # Check if we should retry
-                if retry_count < self.service_config.retries:
-                    # Increment retry count
-                    retry_count += 1
-                    
-                    # Calculate backoff time
-                    backoff_time = self.service_config.backoff_factor * (2 ** (retry_count - 1))
-                    
-                    # Log retry
-                    logger.info(
-                        "Retrying ASR service request",
-                        retry_count=retry_count,
-                        backoff_time=backoff_time,
-                        url=url
-                    )
-                    
-                    # Wait before retrying
-                    await asyncio.sleep(backoff_time)
-                    
-                    # Continue to next retry
-                    continue
-                
-                # If we've exhausted retries, raise error
-                raise ASRError(
-                    f"ASR service request timed out after {retry_count} retries: {str(e)}",
-                    None,
-                    {"error": str(e)}
-                )
+        Returns:
+            Dict[str, Any]: ASR response
+            
+        Raises:
+            ASRError: If transcription fails
+        """
+        if self.long_audio is not None and self.long_audio.enabled and audio_format == "wav":
+            long_audio = self.long_audio.for_language(language)
+            header = audio_data
+            if isinstance(audio_data, SpooledAudio):
+                header = audio_data.head(WAV_HEADER_PROBE_SIZE)
+            try:
+                duration = wav_duration(header)
+            except ValidationError:
+                # Let the ASR service report malformed audio
+                duration = 0.0
             
-            except Exception as e:
-                # Increment error counter
-                SERVICE_ERRORS.labels(
-                    service="asr",
-                    operation=path,
-                    error_type=type(e).__name__
-                ).inc()
-                
-                # Log error
-                logger.error(
-                    "ASR service request failed",
-                    error=str(e),
-                    url=url,
-                    exc_info=True
-                )
-                
-                # Raise error
-                raise ASRError(
-                    f"ASR service request failed: {str(e)}",
-                    None,
-                    {"error": str(e)}
-                )
+            if duration > long_audio.threshold_seconds:
+                # Splitting needs the whole recording in memory
+                if isinstance(audio_data, SpooledAudio):
+                    audio_data = await audio_data.read()
+                return await self._transcribe_long(audio_data, language, long_audio)
+        
+        return await self._request_transcription(audio_data, language, audio_format)
     
-    async def transcribe(
+    async def _transcribe_long(
+        self,
+        audio_data: bytes,
+        language: str,
+        long_audio: LongAudioConfig
+    ) -> Dict[str, Any]:
+        """
+        Transcribe a long WAV recording as overlapping windows in parallel.
+        
+        Args:
+            audio_data: WAV audio
+            language: Language code
+            long_audio: Chunking configuration for the language
+            
+        Returns:
+            Dict[str, Any]: Stitched ASR response
+            
+        Raises:
+            ASRError: If splitting or any window fails
+        """
+        # Split off the event loop; scanning a long recording takes a while
+        try:
+            windows = await asyncio.to_thread(
+                split_wav_on_silence,
+                audio_data,
+                long_audio.window_seconds,
+                long_audio.overlap_seconds
+            )
+        except ValidationError as e:
+            raise ASRError(
+                f"Failed to split long audio: {str(e)}",
+                None,
+                {"error": str(e), "language": language}
+            )
+        
+        semaphore = asyncio.Semaphore(long_audio.concurrency)
+        
+        async def _transcribe_window(window_audio: bytes) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._request_transcription(window_audio, language, "wav")
+        
+        tasks = [
+            asyncio.ensure_future(_transcribe_window(window_audio))
+            for _, _, window_audio in windows
+        ]
+        
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            # Stop the remaining windows
+            for task in tasks:
+                task.cancel()
+            raise
+        
+        logger.info(
+            "Long audio transcribed in windows",
+            language=language,
+            windows=len(windows),
+            duration=windows[-1][1]
+        )
+        
+        return merge_transcriptions([
+            (start, end, result)
+            for (start, end, _), result in zip(windows, results)
+        ])
+    
+    async def _request_transcription(
         self, 
-        audio_data: bytes, 
+        audio_data: Union[bytes, SpooledAudio],
         language: str,
-        audio_format: str = "wav"
-    ) -> str:
+        audio_format: str
+    ) -> Dict[str, Any]:
         """
-        Transcribe audio to text.
+        Send audio to the ASR service.
         
         Args:
-            audio_data: Audio data
+            audio_data: Audio data, in memory or spooled to a file
             language: Language code
             audio_format: Audio format
             
         Returns:
-            str: Transcribed text
+            Dict[str, Any]: ASR response
             
         Raises:
             ASRError: If transcription fails
         """
         try:
-            # Prepare request
+            # Prepare request; spooled audio is streamed from its file
+            upload = audio_data.open() if isinstance(audio_data, SpooledAudio) else audio_data
             files = {
-                "file": ("audio." + audio_format, audio_data)
+                "file": ("audio." + audio_format, upload)
             }
             
             # Include options for language in a format the ASR service expects
@@ -234,23 +318,21 @@ class ASRClient:
             )
             
             # Parse response
-            result = response.json()
-            
-            # Extract transcription
-            transcription = result.get("text", "")
+            result = json_codec.loads(response.content)
             
             # Log success
             logger.info(
                 "Audio transcribed successfully",
                 language=language,
                 audio_format=audio_format,
-                transcription_length=len(transcription)
+                transcription_length=len(result.get("text", "")),
+                segments=len(result.get("segments", []))
             )
             
-            return transcription
+            return result
         
-        except ASRError:
-            # Re-raise ASR errors
+        except NeuralBabelError:
+            # Re-raise ASR, deadline and overload errors unchanged
             raise
         
         except Exception as e:
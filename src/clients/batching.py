@@ -0,0 +1,270 @@
+import asyncio
+import contextvars
+import copy
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Type
+
+from src.logging_setup import get_logger
+from src.utils import deadline
+from src.utils.errors import DeadlineExceededError, NeuralBabelError, ServiceError
+from src.utils.metrics import BATCH_SIZE, BATCH_QUEUE_WAIT, BATCH_WINDOW
+
+logger = get_logger(__name__)
+
+# Sends one batch: receives the group key and the items, returns one result
+# per item, in order. A result that is an exception fails only that item.
+BatchFunction = Callable[[Hashable, List[Any]], Awaitable[List[Any]]]
+
+# Status codes meaning a service has no batch endpoint
+BATCH_UNSUPPORTED_STATUS_CODES = (404, 405, 501)
+
+
+class _PendingBatch:
+    """
+    Items collected for one group while its flush window is open.
+    """
+    
+    def __init__(self):
+        self.items: List[Any] = []
+        self.futures: List[asyncio.Future] = []
+        self.enqueued_at: List[float] = []
+        self.deadlines: List[Optional[float]] = []
+        self.timer = None
+    
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent calls that share a group key into batched calls.
+    
+    The first item for a group opens a flush window of ``max_wait`` seconds;
+    the batch is sent when the window closes or when it reaches
+    ``max_batch_size`` items, whichever comes first.
+    
+    With ``adaptive`` set, the window instead scales with the group's
+    observed queue depth (items waiting or in flight): it is zero when a
+    group is idle, so a lone request is sent on the next loop iteration,
+    and grows to ``max_wait`` as load builds up.
+    
+    A batch is sent in a fresh context under the latest of its callers'
+    deadlines, so one caller with a short deadline cannot fail the others;
+    each caller still stops waiting at its own deadline. When a whole batch
+    fails, each caller gets its own copy of the error; unexpected errors
+    are wrapped in ``error_class``, carrying the original details.
+    """
+    
+    # Weight of the newest sample in the queue depth average
+    DEPTH_SMOOTHING = 0.2
+    
+    def __init__(
+        self,
+        name: str,
+        send_batch: BatchFunction,
+        max_batch_size: int,
+        max_wait: float,
+        adaptive: bool = False,
+        error_class: Optional[Type[ServiceError]] = None
+    ):
+        """
+        Initialize the batcher.
+        
+        Args:
+            name: Service name, used as the metrics label
+            send_batch: Coroutine function that sends one batch
+            max_batch_size: Maximum number of items per batch
+            max_wait: Maximum time in seconds an item waits for its batch
+            adaptive: Scale the flush window with observed queue depth
+            error_class: Stage error class that unexpected batch failures
+                are wrapped in; if not set, each caller gets a copy of the error
+        """
+        self.name = name
+        self.send_batch = send_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.adaptive = adaptive
+        self.error_class = error_class
+        self._pending: Dict[Hashable, _PendingBatch] = {}
+        self._in_flight: Dict[Hashable, int] = {}
+        self._depth: Dict[Hashable, float] = {}
+        self._tasks: Set[asyncio.Task] = set()
+    
+    async def submit(self, key: Hashable, item: Any) -> Any:
+        """
+        Add an item to its group's next batch and wait for its result.
+        
+        Args:
+            key: Group key; only items with equal keys are batched together
+            item: Item to send
+        
+        Returns:
+            Any: Result for this item
+        
+        Raises:
+            DeadlineExceededError: If the caller's deadline passes first
+            Exception: The error reported for this item
+        """
+        loop = asyncio.get_running_loop()
+        
+        # Open a batch for the group if none is collecting
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = _PendingBatch()
+            batch.timer = loop.call_later(self._window(key), self._flush, key)
+            self._pending[key] = batch
+        
+        future = loop.create_future()
+        batch.items.append(item)
+        batch.futures.append(future)
+        batch.enqueued_at.append(time.monotonic())
+        batch.deadlines.append(deadline.current())
+        
+        # Send full batches right away
+        if len(batch) >= self.max_batch_size:
+            self._flush(key)
+        
+        left = deadline.remaining()
+        if left is None:
+            return await future
+        
+        try:
+            return await asyncio.wait_for(future, max(left, 0.0))
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError(
+                f"{self.name} batched request deadline exceeded",
+                {"batch_size": len(batch)}
+            )
+    
+    def _window(self, key: Hashable) -> float:
+        """
+        Get the flush window for a new batch of a group.
+        
+        Args:
+            key: Group key
+        
+        Returns:
+            float: Window in seconds
+        """
+        if not self.adaptive:
+            return self.max_wait
+        
+        # Track queue depth as a moving average of work already waiting
+        depth = self._in_flight.get(key, 0) + 1
+        average = self._depth.get(key, 1.0)
+        average += self.DEPTH_SMOOTHING * (depth - average)
+        self._depth[key] = average
+        
+        # Idle groups flush at once; busy groups wait for fuller batches
+        load = (average - 1) / max(self.max_batch_size - 1, 1)
+        window = self.max_wait * min(max(load, 0.0), 1.0)
+        BATCH_WINDOW.labels(service=self.name).set(window)
+        
+        return window
+    
+    def _flush(self, key: Hashable) -> None:
+        """
+        Close a group's batch and send it in the background.
+        
+        Args:
+            key: Group key
+        """
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        batch.timer.cancel()
+        
+        # Send in a fresh context, not the one of the caller that happened to
+        # trigger the flush
+        task = asyncio.get_running_loop().create_task(
+            self._send(key, batch),
+            context=contextvars.Context()
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _send(self, key: Hashable, batch: _PendingBatch) -> None:
+        """
+        Send a batch and hand each result to its caller.
+        
+        Args:
+            key: Group key
+            batch: Batch to send
+        """
+        # Skip items whose callers have gone away
+        now = time.monotonic()
+        items = []
+        futures = []
+        deadlines = []
+        for item, future, enqueued_at, item_deadline in zip(
+            batch.items, batch.futures, batch.enqueued_at, batch.deadlines
+        ):
+            if future.done():
+                continue
+            items.append(item)
+            futures.append(future)
+            deadlines.append(item_deadline)
+            BATCH_QUEUE_WAIT.labels(service=self.name).observe(now - enqueued_at)
+        
+        if not items:
+            return
+        
+        # Give the batch as long as its most patient caller has
+        if None not in deadlines:
+            deadline.set_deadline(max(deadlines) - now)
+        
+        BATCH_SIZE.labels(service=self.name).observe(len(items))
+        self._in_flight[key] = self._in_flight.get(key, 0) + len(items)
+        
+        try:
+            results = await self.send_batch(key, items)
+            if len(results) != len(items):
+                raise ValueError(
+                    f"Batch returned {len(results)} results for {len(items)} items"
+                )
+        except Exception as e:
+            logger.error(
+                "Batched request failed",
+                service=self.name,
+                batch_size=len(items),
+                error=str(e)
+            )
+            # Each caller gets its own error, so that marking one, as when
+            # its deadline has passed, does not affect the others
+            results = [self._item_error(e) for _ in items]
+        finally:
+            self._in_flight[key] -= len(items)
+        
+        # Hand each result to its caller
+        for future, result in zip(futures, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+    
+    def _item_error(self, error: Exception) -> Exception:
+        """
+        Build one caller's error for a batch that failed as a whole.
+        
+        Args:
+            error: Error that failed the batch
+        
+        Returns:
+            Exception: Error for the caller
+        """
+        details = dict(getattr(error, "details", None) or {})
+        
+        # Service, deadline and overload errors keep their type
+        if self.error_class is None or isinstance(error, NeuralBabelError):
+            item_error = copy.copy(error)
+            if hasattr(item_error, "details"):
+                item_error.details = details
+            return item_error
+        
+        return self.error_class(
+            f"Batched {self.name} request failed: {error}",
+            None,
+            details
+        )
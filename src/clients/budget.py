@@ -0,0 +1,39 @@
+class RequestBudget:
+    """
+    Caps extra requests, such as retries or hedges, at a fraction of all
+    requests.
+    
+    Every request earns ``ratio`` of a token, up to ``burst`` tokens, and
+    every extra request spends a whole one, so extra requests cannot
+    multiply load when a service is failing or slow across the board.
+    """
+    
+    def __init__(self, ratio: float, burst: float):
+        """
+        Initialize the budget full.
+        
+        Args:
+            ratio: Tokens earned per request
+            burst: Maximum number of tokens
+        """
+        self.ratio = ratio
+        self.burst = burst
+        self._tokens = burst
+    
+    def record_request(self) -> None:
+        """
+        Earn credit for a request.
+        """
+        self._tokens = min(self.burst, self._tokens + self.ratio)
+    
+    def try_spend(self) -> bool:
+        """
+        Take a token for an extra request if one is available.
+        
+        Returns:
+            bool: True if the extra request may be sent
+        """
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
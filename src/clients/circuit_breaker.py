@@ -0,0 +1,208 @@
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from src.config import ServiceConfig
+from src.logging_setup import get_logger
+from src.utils.metrics import CIRCUIT_BREAKER_REJECTED, CIRCUIT_BREAKER_STATE
+
+logger = get_logger(__name__)
+
+# Circuit breaker states
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+# Value of each state in the circuit breaker gauge
+CIRCUIT_STATE_VALUES = {CIRCUIT_CLOSED: 0, CIRCUIT_HALF_OPEN: 1, CIRCUIT_OPEN: 2}
+
+# Width of the buckets the rolling window is kept in, in seconds
+WINDOW_BUCKET_SECONDS = 1.0
+
+
+class CircuitBreaker:
+    """
+    Stops calling a service that is failing or too slow.
+    
+    Calls are counted over a rolling window of ``circuit_window`` seconds.
+    Once the window holds ``circuit_min_calls`` calls and the share that
+    failed reaches ``circuit_failure_rate``, or the share slower than
+    ``circuit_slow_call_threshold`` reaches ``circuit_slow_call_rate``, the
+    breaker opens and calls are refused without being sent. After
+    ``circuit_open_duration`` it lets ``circuit_half_open_calls`` probe calls
+    through: if they all succeed it closes again, and if any fails it opens
+    for another period.
+    """
+    
+    def __init__(self, service_config: ServiceConfig):
+        """
+        Initialize the breaker closed.
+        
+        Args:
+            service_config: Service configuration
+        """
+        self.service_config = service_config
+        self._state = CIRCUIT_CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+        # Each bucket is [start time, calls, failures, slow calls]
+        self._buckets: Deque[List[float]] = deque()
+        self._set_state(CIRCUIT_CLOSED)
+    
+    @property
+    def state(self) -> str:
+        """
+        Current state, moving an open breaker to half-open once its open
+        period has passed.
+        """
+        if self._state == CIRCUIT_OPEN and time.monotonic() >= self._opened_at + self.service_config.circuit_open_duration:
+            self._probes = 0
+            self._probe_successes = 0
+            self._set_state(CIRCUIT_HALF_OPEN)
+        return self._state
+    
+    def retry_after(self) -> float:
+        """
+        Get how long until an open breaker lets probe calls through.
+        
+        Returns:
+            float: Seconds, or 0 if the breaker is not open
+        """
+        if self.state != CIRCUIT_OPEN:
+            return 0.0
+        return self._opened_at + self.service_config.circuit_open_duration - time.monotonic()
+    
+    def allow(self) -> bool:
+        """
+        Ask to send a call. A call that is allowed must be ended with
+        ``record`` or ``release``.
+        
+        Returns:
+            bool: True if the call may be sent
+        """
+        state = self.state
+        if state == CIRCUIT_CLOSED:
+            return True
+        
+        if state == CIRCUIT_HALF_OPEN and self._probes < self.service_config.circuit_half_open_calls:
+            self._probes += 1
+            return True
+        
+        CIRCUIT_BREAKER_REJECTED.labels(service=self.service_config.service_type).inc()
+        return False
+    
+    def record(self, failed: bool, latency: Optional[float] = None) -> None:
+        """
+        Record the outcome of an allowed call.
+        
+        Args:
+            failed: Whether the call failed
+            latency: Call latency in seconds, if a response arrived
+        """
+        config = self.service_config
+        slow = (
+            config.circuit_slow_call_threshold is not None
+            and latency is not None
+            and latency >= config.circuit_slow_call_threshold
+        )
+        
+        if self._state == CIRCUIT_HALF_OPEN:
+            if failed or slow:
+                self._open("probe_failed")
+                return
+            
+            self._probe_successes += 1
+            if self._probe_successes >= config.circuit_half_open_calls:
+                self._buckets.clear()
+                self._set_state(CIRCUIT_CLOSED)
+                logger.info("Circuit breaker closed", service=config.name)
+            return
+        
+        bucket = self._current_bucket()
+        bucket[1] += 1
+        bucket[2] += failed
+        bucket[3] += slow
+        
+        if self._state != CIRCUIT_CLOSED:
+            return
+        
+        # Check the rates over the window
+        calls = sum(b[1] for b in self._buckets)
+        if calls < config.circuit_min_calls:
+            return
+        
+        if sum(b[2] for b in self._buckets) / calls >= config.circuit_failure_rate:
+            self._open("failure_rate")
+        elif sum(b[3] for b in self._buckets) / calls >= config.circuit_slow_call_rate:
+            self._open("slow_call_rate")
+    
+    def release(self) -> None:
+        """
+        End an allowed call that produced no outcome, e.g. because it was
+        cancelled.
+        """
+        if self._state == CIRCUIT_HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+    
+    def _current_bucket(self) -> List[float]:
+        """
+        Get the window bucket for now, dropping buckets that left the window.
+        
+        Returns:
+            List[float]: Current bucket
+        """
+        now = time.monotonic()
+        while self._buckets and self._buckets[0][0] <= now - self.service_config.circuit_window:
+            self._buckets.popleft()
+        
+        if not self._buckets or self._buckets[-1][0] <= now - WINDOW_BUCKET_SECONDS:
+            self._buckets.append([now, 0, 0, 0])
+        return self._buckets[-1]
+    
+    def _open(self, reason: str) -> None:
+        """
+        Open the breaker.
+        
+        Args:
+            reason: Why the breaker opened
+        """
+        self._opened_at = time.monotonic()
+        self._set_state(CIRCUIT_OPEN)
+        logger.warning(
+            "Circuit breaker opened",
+            service=self.service_config.name,
+            reason=reason,
+            open_duration=self.service_config.circuit_open_duration
+        )
+    
+    def _set_state(self, state: str) -> None:
+        """
+        Change state and update the state gauge.
+        
+        Args:
+            state: New state
+        """
+        self._state = state
+        CIRCUIT_BREAKER_STATE.labels(service=self.service_config.service_type).set(CIRCUIT_STATE_VALUES[state])
+
+
+# Circuit breakers, shared by all clients of a service
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(service_config: ServiceConfig) -> CircuitBreaker:
+    """
+    Get the circuit breaker of a service.
+    
+    Args:
+        service_config: Service configuration
+    
+    Returns:
+        CircuitBreaker: Circuit breaker instance
+    """
+    breaker = _circuit_breakers.get(service_config.name)
+    if breaker is None:
+        breaker = CircuitBreaker(service_config)
+        _circuit_breakers[service_config.name] = breaker
+    return breaker
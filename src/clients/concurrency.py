@@ -0,0 +1,262 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from src.config import ServiceConfig
+from src.logging_setup import get_logger
+from src.utils import deadline
+from src.utils.metrics import (
+    SERVICE_CONCURRENCY_LIMIT,
+    SERVICE_CONCURRENCY_SHED,
+    SERVICE_IN_FLIGHT,
+    SERVICE_QUEUE_WAIT
+)
+
+logger = get_logger(__name__)
+
+# Weight of the newest sample in the short-term latency average
+LATENCY_EWMA_WEIGHT = 0.2
+
+# Once recent latency drops below this fraction of the baseline, the
+# baseline is pulled down by BASELINE_RECOVERY per sample, so it does not
+# stay inflated after an overload
+BASELINE_RECOVERY_THRESHOLD = 0.5
+BASELINE_RECOVERY = 0.95
+
+# Bounds on how far one sample can move the limit down
+MIN_GRADIENT = 0.5
+MAX_GRADIENT = 1.0
+
+# Share of the step towards a new limit taken per sample
+LIMIT_SMOOTHING = 0.2
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limits concurrent requests to a service, finding the limit from latency.
+    
+    The limiter compares a short-term moving average of latency with a
+    long-term one over about ``concurrency_baseline_samples`` requests,
+    which serves as the no-load baseline. Both average the same mix of
+    request sizes, such as short and long clips, so only a sustained rise
+    in latency moves the limit. While the short-term average stays within
+    ``concurrency_latency_tolerance`` times the baseline the limit keeps
+    growing, by a fraction of its square root per sample; as requests start
+    to queue in the service and latency rises, the limit shrinks in
+    proportion (a gradient limiter). Failed requests cut the limit by
+    ``concurrency_backoff_ratio``.
+    
+    Requests beyond the limit wait in a FIFO queue of up to
+    ``concurrency_max_queue`` requests for at most ``concurrency_max_wait``
+    seconds, or the request deadline if sooner, and are shed after that.
+    """
+    
+    def __init__(self, service_config: ServiceConfig):
+        """
+        Initialize the limiter at the initial limit.
+        
+        Args:
+            service_config: Service configuration
+        """
+        self.service_config = service_config
+        self._service = service_config.service_type
+        self._limit = float(service_config.concurrency_initial_limit)
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._latency: Optional[float] = None
+        self._baseline: Optional[float] = None
+        self._baseline_weight = 2 / (max(service_config.concurrency_baseline_samples, 1) + 1)
+        self._clamp_limit()
+    
+    @property
+    def limit(self) -> int:
+        """
+        Current number of requests allowed at once.
+        """
+        return max(1, int(self._limit))
+    
+    @property
+    def in_flight(self) -> int:
+        """
+        Number of requests holding a slot.
+        """
+        return self._in_flight
+    
+    @property
+    def queued(self) -> int:
+        """
+        Number of requests waiting for a slot.
+        """
+        return len(self._waiters)
+    
+    @property
+    def baseline(self) -> Optional[float]:
+        """
+        No-load latency estimate in seconds, or None before any sample.
+        """
+        return self._baseline
+    
+    async def acquire(self) -> bool:
+        """
+        Wait for a slot. A request that gets one must give it back with
+        ``release``.
+        
+        Returns:
+            bool: True if the request got a slot, False if it was shed
+        """
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            SERVICE_IN_FLIGHT.labels(service=self._service).set(self._in_flight)
+            SERVICE_QUEUE_WAIT.labels(service=self._service).observe(0)
+            return True
+        
+        if len(self._waiters) >= self.service_config.concurrency_max_queue:
+            return self._shed("queue_full")
+        
+        # Never wait past the request's own deadline
+        max_wait = self.service_config.concurrency_max_wait
+        left = deadline.remaining()
+        if left is not None:
+            max_wait = min(max_wait, left)
+        if max_wait <= 0:
+            return self._shed("timeout")
+        
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        start_time = time.monotonic()
+        
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), max_wait)
+        except asyncio.TimeoutError:
+            self._abandon(waiter)
+            return self._shed("timeout")
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+        finally:
+            SERVICE_QUEUE_WAIT.labels(service=self._service).observe(time.monotonic() - start_time)
+        return True
+    
+    def release(self, latency: Optional[float] = None, dropped: bool = False) -> None:
+        """
+        Give back a slot and adjust the limit from the request's outcome.
+        
+        Args:
+            latency: Request latency in seconds, if it succeeded
+            dropped: Whether the request failed in a way that suggests
+                overload, such as a timeout or a 5xx response
+        """
+        if dropped:
+            self._limit *= self.service_config.concurrency_backoff_ratio
+            self._clamp_limit()
+        elif latency is not None:
+            self._update(latency)
+        
+        self._in_flight -= 1
+        self._wake()
+    
+    def _update(self, latency: float) -> None:
+        """
+        Move the limit by the gradient between baseline and current latency.
+        
+        Args:
+            latency: Latency of a successful request in seconds
+        """
+        if self._latency is None:
+            self._latency = self._baseline = latency
+        else:
+            self._latency += LATENCY_EWMA_WEIGHT * (latency - self._latency)
+            self._baseline += self._baseline_weight * (latency - self._baseline)
+            if self._latency < self._baseline * BASELINE_RECOVERY_THRESHOLD:
+                self._baseline *= BASELINE_RECOVERY
+        
+        gradient = self.service_config.concurrency_latency_tolerance * self._baseline / max(self._latency, 1e-9)
+        gradient = max(MIN_GRADIENT, min(MAX_GRADIENT, gradient))
+        new_limit = self._limit * gradient + math.sqrt(self._limit)
+        
+        # Only grow a limit that is in use, or it climbs without bound while idle
+        if new_limit > self._limit and self._in_flight * 2 < self.limit:
+            return
+        
+        self._limit += LIMIT_SMOOTHING * (new_limit - self._limit)
+        self._clamp_limit()
+    
+    def _clamp_limit(self) -> None:
+        """
+        Keep the limit within its bounds and export it.
+        """
+        self._limit = max(
+            float(self.service_config.concurrency_min_limit),
+            min(float(self.service_config.concurrency_max_limit), self._limit)
+        )
+        SERVICE_CONCURRENCY_LIMIT.labels(service=self._service).set(self.limit)
+    
+    def _wake(self) -> None:
+        """
+        Hand free slots to queued requests.
+        """
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+        SERVICE_IN_FLIGHT.labels(service=self._service).set(self._in_flight)
+    
+    def _abandon(self, waiter: asyncio.Future) -> None:
+        """
+        Withdraw a waiter that gave up, passing on a slot it was handed.
+        
+        Args:
+            waiter: Waiter future
+        """
+        if waiter.done() and not waiter.cancelled():
+            # Handed a slot just as it gave up
+            self.release()
+            return
+        
+        waiter.cancel()
+        self._waiters.remove(waiter)
+    
+    def _shed(self, reason: str) -> bool:
+        """
+        Reject a request.
+        
+        Args:
+            reason: Why the request was shed
+        
+        Returns:
+            bool: Always False
+        """
+        SERVICE_CONCURRENCY_SHED.labels(service=self._service, reason=reason).inc()
+        logger.warning(
+            "Service concurrency limit reached, shedding request",
+            service=self.service_config.name,
+            reason=reason,
+            limit=self.limit,
+            queued=len(self._waiters)
+        )
+        return False
+
+
+# Concurrency limiters, shared by all clients of a service
+_concurrency_limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
+
+
+def get_concurrency_limiter(service_config: ServiceConfig) -> AdaptiveConcurrencyLimiter:
+    """
+    Get the concurrency limiter of a service.
+    
+    Args:
+        service_config: Service configuration
+    
+    Returns:
+        AdaptiveConcurrencyLimiter: Concurrency limiter instance
+    """
+    limiter = _concurrency_limiters.get(service_config.name)
+    if limiter is None:
+        limiter = AdaptiveConcurrencyLimiter(service_config)
+        _concurrency_limiters[service_config.name] = limiter
+    return limiter
@@ -0,0 +1,131 @@
+import math
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from src.clients.budget import RequestBudget
+from src.utils.metrics import SERVICE_LATENCY
+
+# Share of requests that may be hedged, and how many hedges can be saved up
+DEFAULT_HEDGE_BUDGET_RATIO = 0.05
+DEFAULT_HEDGE_BUDGET_BURST = 10.0
+
+# Seconds a computed hedge delay is reused before it is recomputed
+HEDGE_DELAY_REFRESH = 1.0
+
+
+class HedgeBudget(RequestBudget):
+    """
+    Caps hedged requests at a fraction of all hedgeable requests.
+    """
+    
+    def __init__(
+        self,
+        ratio: float = DEFAULT_HEDGE_BUDGET_RATIO,
+        burst: float = DEFAULT_HEDGE_BUDGET_BURST
+    ):
+        """
+        Initialize the budget full.
+        
+        Args:
+            ratio: Hedges allowed per request
+            burst: Maximum number of hedges saved up
+        """
+        super().__init__(ratio, burst)
+
+
+def latency_percentile(service: str, operation: str, percentile: float, min_samples: int) -> Optional[float]:
+    """
+    Estimate a latency percentile from the SERVICE_LATENCY histogram.
+    
+    The value is interpolated linearly within the bucket the percentile
+    falls in.
+    
+    Args:
+        service: Service label
+        operation: Operation label
+        percentile: Percentile as a fraction, e.g. 0.95
+        min_samples: Observations needed for a meaningful estimate
+    
+    Returns:
+        Optional[float]: Latency in seconds, or None if there are too few
+        observations
+    """
+    buckets = []
+    for metric in SERVICE_LATENCY.collect():
+        for sample in metric.samples:
+            if (
+                sample.name.endswith("_bucket")
+                and sample.labels.get("service") == service
+                and sample.labels.get("operation") == operation
+            ):
+                buckets.append((float(sample.labels["le"]), sample.value))
+    
+    if not buckets:
+        return None
+    buckets.sort()
+    
+    total = buckets[-1][1]
+    if total < max(min_samples, 1):
+        return None
+    
+    # Walk the cumulative buckets to the one holding the percentile
+    rank = percentile * total
+    lower_bound, lower_count = 0.0, 0.0
+    for upper_bound, count in buckets:
+        if count >= rank:
+            if math.isinf(upper_bound):
+                return lower_bound
+            if count == lower_count:
+                return upper_bound
+            return lower_bound + (upper_bound - lower_bound) * (rank - lower_count) / (count - lower_count)
+        lower_bound, lower_count = upper_bound, count
+    
+    return lower_bound
+
+
+class HedgeDelays:
+    """
+    Caches hedge delays per service and operation, recomputing them from
+    the latency histogram at most every ``HEDGE_DELAY_REFRESH`` seconds.
+    """
+    
+    def __init__(self):
+        """
+        Initialize the cache.
+        """
+        self._entries: Dict[Tuple[Any, ...], Tuple[float, Optional[float]]] = {}
+    
+    def get(
+        self,
+        service: str,
+        operation: str,
+        percentile: float,
+        min_samples: int,
+        min_delay: float
+    ) -> Optional[float]:
+        """
+        Get how long to wait for a response before hedging.
+        
+        Args:
+            service: Service label
+            operation: Operation label
+            percentile: Latency percentile to hedge at
+            min_samples: Observations needed before hedging starts
+            min_delay: Shortest delay in seconds
+        
+        Returns:
+            Optional[float]: Delay in seconds, or None if there is not enough
+            data to hedge yet
+        """
+        key = (service, operation, percentile, min_samples)
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None and entry[0] > now:
+            delay = entry[1]
+        else:
+            delay = latency_percentile(service, operation, percentile, min_samples)
+            self._entries[key] = (now + HEDGE_DELAY_REFRESH, delay)
+        
+        if delay is None:
+            return None
+        return max(delay, min_delay)
@@ -0,0 +1,494 @@
+import asyncio
+import ipaddress
+import socket
+import time
+from typing import Dict, List, Optional, Tuple
+
+import httpcore
+import httpx
+from httpx import Response
+
+from src.clients.hedging import HedgeBudget, HedgeDelays
+from src.config import ServiceConfig
+from src.logging_setup import get_logger
+from src.utils import deadline
+from src.utils.errors import DeadlineExceededError
+from src.utils.metrics import (
+    HTTP_POOL_IN_FLIGHT,
+    HTTP_POOL_SATURATION,
+    HTTP_POOL_CONNECTIONS_OPENED,
+    HTTP_POOL_CONNECTIONS_REUSED,
+    HTTP_POOL_TIMEOUTS,
+    SERVICE_HEDGES,
+    SERVICE_HEDGES_DENIED,
+    SERVICE_HEDGE_WINS
+)
+
+logger = get_logger(__name__)
+
+
+class DNSCache:
+    """
+    Caches hostname resolution results for a fixed TTL.
+    """
+    
+    def __init__(self, ttl: float = 60.0):
+        """
+        Initialize the DNS cache.
+        
+        Args:
+            ttl: Time in seconds a resolved address stays valid
+        """
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, int], Tuple[float, str]] = {}
+    
+    async def resolve(self, host: str, port: int) -> str:
+        """
+        Resolve a hostname to an IP address, using the cache when possible.
+        
+        Args:
+            host: Hostname or IP literal
+            port: Port number
+        
+        Returns:
+            str: IP address to connect to
+        """
+        # IP literals never need resolving
+        try:
+            ipaddress.ip_address(host)
+            return host
+        except ValueError:
+            pass
+        
+        # Check for a fresh cached entry
+        key = (host, port)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        
+        # Resolve without blocking the event loop
+        loop = asyncio.get_running_loop()
+        infos = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        address = infos[0][4][0]
+        
+        # Cache the address
+        self._entries[key] = (time.monotonic() + self.ttl, address)
+        
+        logger.debug("Resolved service host", host=host, address=address)
+        
+        return address
+    
+    def clear(self) -> None:
+        """
+        Drop all cached entries.
+        """
+        self._entries.clear()
+
+
+class DNSCachingBackend(httpcore.AsyncNetworkBackend):
+    """
+    Network backend that resolves hosts through a DNSCache before connecting.
+    
+    TLS server names are taken from the request origin rather than the
+    connected address, so substituting the IP here is transparent.
+    """
+    
+    def __init__(self, backend: httpcore.AsyncNetworkBackend, dns_cache: DNSCache):
+        self._backend = backend
+        self._dns_cache = dns_cache
+    
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        address = await self._dns_cache.resolve(host, port)
+        return await self._backend.connect_tcp(
+            address,
+            port,
+            timeout=timeout,
+            local_address=local_address,
+            socket_options=socket_options
+        )
+    
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        return await self._backend.connect_unix_socket(
+            path,
+            timeout=timeout,
+            socket_options=socket_options
+        )
+    
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class PooledTransport(httpx.AsyncHTTPTransport):
+    """
+    HTTP transport whose connection pool resolves hosts through a DNSCache.
+    """
+    
+    def __init__(self, dns_cache: DNSCache, limits: httpx.Limits, http2: bool = False):
+        super().__init__(limits=limits, http2=http2)
+        
+        # httpx does not take a network backend, so build the connection
+        # pool it sends through with one that resolves via the cache
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(http2=http2),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http2=http2,
+            network_backend=DNSCachingBackend(httpcore.AnyIOBackend(), dns_cache)
+        )
+
+
+def _http2_available() -> bool:
+    """
+    Check whether the optional HTTP/2 dependency is installed.
+    
+    Returns:
+        bool: True if the h2 package can be imported
+    """
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def build_timeout(service_config: ServiceConfig) -> httpx.Timeout:
+    """
+    Build the split connect/read/write/pool timeout for a service.
+    
+    Phases without an explicit value fall back to ``service_config.timeout``.
+    
+    Args:
+        service_config: Service configuration
+    
+    Returns:
+        httpx.Timeout: Timeout configuration
+    """
+    def _or_default(value: Optional[float]) -> float:
+        return service_config.timeout if value is None else value
+    
+    return httpx.Timeout(
+        connect=_or_default(service_config.connect_timeout),
+        read=_or_default(service_config.read_timeout),
+        write=_or_default(service_config.write_timeout),
+        pool=_or_default(service_config.pool_timeout)
+    )
+
+
+class ConnectionPoolManager:
+    """
+    Owns one long-lived, pooled HTTP client per component service.
+    """
+    
+    def __init__(self):
+        """
+        Initialize the connection pool manager.
+        """
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._in_flight: Dict[str, int] = {}
+        self.hedge_budget = HedgeBudget()
+        self._hedge_delays = HedgeDelays()
+    
+    def _create_client(self, service_config: ServiceConfig) -> httpx.AsyncClient:
+        """
+        Create the pooled client for a service.
+        
+        Args:
+            service_config: Service configuration
+        
+        Returns:
+            httpx.AsyncClient: Pooled HTTP client
+        """
+        http2 = service_config.http2
+        if http2 and not _http2_available():
+            logger.warning(
+                "HTTP/2 requested but the h2 package is not installed, falling back to HTTP/1.1",
+                service=service_config.name
+            )
+            http2 = False
+        
+        limits = httpx.Limits(
+            max_connections=service_config.max_connections,
+            max_keepalive_connections=service_config.max_keepalive_connections,
+            keepalive_expiry=service_config.keepalive_expiry
+        )
+        
+        transport = PooledTransport(
+            dns_cache=DNSCache(ttl=service_config.dns_cache_ttl),
+            limits=limits,
+            http2=http2
+        )
+        
+        logger.info(
+            "Created connection pool",
+            service=service_config.name,
+            max_connections=service_config.max_connections,
+            max_keepalive_connections=service_config.max_keepalive_connections,
+            http2=http2
+        )
+        
+        return httpx.AsyncClient(
+            transport=transport,
+            timeout=build_timeout(service_config)
+        )
+    
+    def get_client(self, service_config: ServiceConfig) -> httpx.AsyncClient:
+        """
+        Get the pooled client for a service, creating it on first use.
+        
+        Args:
+            service_config: Service configuration
+        
+        Returns:
+            httpx.AsyncClient: Pooled HTTP client
+        """
+        client = self._clients.get(service_config.name)
+        if client is None or client.is_closed:
+            client = self._create_client(service_config)
+            self._clients[service_config.name] = client
+        return client
+    
+    async def start(
+        self,
+        service_configs: List[ServiceConfig],
+        hedge_budget: Optional[HedgeBudget] = None
+    ) -> None:
+        """
+        Open the pools for the given services.
+        
+        Args:
+            service_configs: Service configurations
+            hedge_budget: Budget shared by hedged requests to all services;
+                keeps the default budget if None
+        """
+        if hedge_budget is not None:
+            self.hedge_budget = hedge_budget
+        
+        for service_config in service_configs:
+            self.get_client(service_config)
+    
+    async def close(self) -> None:
+        """
+        Close all pooled clients and their connections.
+        """
+        clients = list(self._clients.values())
+        self._clients.clear()
+        
+        for client in clients:
+            await client.aclose()
+        
+        logger.info("Closed connection pools", count=len(clients))
+    
+    def _record_in_flight(self, service_config: ServiceConfig, delta: int) -> None:
+        """
+        Update the in-flight and saturation gauges for a service.
+        
+        Args:
+            service_config: Service configuration
+            delta: Change in the number of in-flight requests
+        """
+        in_flight = self._in_flight.get(service_config.name, 0) + delta
+        self._in_flight[service_config.name] = in_flight
+        
+        service = service_config.service_type
+        HTTP_POOL_IN_FLIGHT.labels(service=service).set(in_flight)
+        HTTP_POOL_SATURATION.labels(service=service).set(
+            in_flight / max(service_config.max_connections, 1)
+        )
+    
+    async def request(
+        self,
+        service_config: ServiceConfig,
+        method: str,
+        url: str,
+        **kwargs
+    ) -> Response:
+        """
+        Send a request over the service's pooled client.
+        
+        Under a request deadline, the call is cut off when the deadline
+        passes and the remaining budget is sent in the deadline header.
+        
+        Args:
+            service_config: Service configuration
+            method: HTTP method
+            url: Request URL
+            **kwargs: Additional arguments for the request
+        
+        Returns:
+            Response: HTTP response
+        
+        Raises:
+            DeadlineExceededError: If the request deadline passes first
+        """
+        client = self.get_client(service_config)
+        service = service_config.service_type
+        
+        # Watch the connection lifecycle to tell new connections from reused ones
+        opened_connection = False
+        
+        async def trace(event_name: str, info: dict) -> None:
+            nonlocal opened_connection
+            if event_name == "connection.connect_tcp.started":
+                opened_connection = True
+        
+        # Bound the call by the request deadline and pass the budget on
+        budget = deadline.remaining()
+        if budget is not None:
+            if budget <= 0:
+                raise DeadlineExceededError(
+                    "Request deadline exceeded",
+                    {"service": service_config.name}
+                )
+            kwargs["headers"] = {
+                **(kwargs.get("headers") or {}),
+                deadline.DEADLINE_HEADER: str(int(budget * 1000))
+            }
+        
+        self._record_in_flight(service_config, 1)
+        try:
+            response = await asyncio.wait_for(
+                client.request(
+                    method=method,
+                    url=url,
+                    extensions={"trace": trace},
+                    **kwargs
+                ),
+                budget
+            )
+        except httpx.PoolTimeout:
+            HTTP_POOL_TIMEOUTS.labels(service=service).inc()
+            raise
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError(
+                "Request deadline exceeded",
+                {"service": service_config.name, "budget": budget}
+            )
+        finally:
+            self._record_in_flight(service_config, -1)
+        
+        if opened_connection:
+            HTTP_POOL_CONNECTIONS_OPENED.labels(service=service).inc()
+        else:
+            HTTP_POOL_CONNECTIONS_REUSED.labels(service=service).inc()
+        
+        return response
+    
+    async def hedged_request(
+        self,
+        service_config: ServiceConfig,
+        operation: str,
+        method: str,
+        url: str,
+        **kwargs
+    ) -> Response:
+        """
+        Send a request, hedging it with a second copy if it is slow.
+        
+        With ``hedge_percentile`` set, a request that has not been answered
+        within that percentile of the operation's observed latency is sent
+        again, over another pooled connection and so usually to another
+        replica. The first successful response wins and the other request
+        is cancelled. Hedges are capped by the shared hedge budget, and
+        requests whose body cannot be sent twice, such as streamed files,
+        are never hedged.
+        
+        Args:
+            service_config: Service configuration
+            operation: Operation label of the request in SERVICE_LATENCY
+            method: HTTP method
+            url: Request URL
+            **kwargs: Additional arguments for the request
+        
+        Returns:
+            Response: HTTP response
+        """
+        if service_config.hedge_percentile is None or not _is_replayable(kwargs):
+            return await self.request(service_config, method, url, **kwargs)
+        
+        service = service_config.service_type
+        self.hedge_budget.record_request()
+        delay = self._hedge_delays.get(
+            service,
+            operation,
+            service_config.hedge_percentile,
+            service_config.hedge_min_samples,
+            service_config.hedge_min_delay
+        )
+        
+        primary = asyncio.ensure_future(self.request(service_config, method, url, **kwargs))
+        if delay is None:
+            return await primary
+        
+        # Give the first copy until the hedge delay to answer
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        if done:
+            return primary.result()
+        
+        if not self.hedge_budget.try_spend():
+            SERVICE_HEDGES_DENIED.labels(service=service).inc()
+            return await primary
+        
+        SERVICE_HEDGES.labels(service=service).inc()
+        logger.debug("Hedging slow request", service=service_config.name, url=url, delay=delay)
+        hedge = asyncio.ensure_future(self.request(service_config, method, url, **kwargs))
+        
+        # Take the first successful response; a failure waits for the other copy
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and task.result().status_code < 500:
+                        if task is hedge:
+                            SERVICE_HEDGE_WINS.labels(service=service).inc()
+                        return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        # Both copies failed: report the original request's outcome
+        return primary.result()
+
+
+def _is_replayable(kwargs: Dict) -> bool:
+    """
+    Check whether a request body can be sent more than once.
+    
+    Args:
+        kwargs: Request arguments
+    
+    Returns:
+        bool: False if the body is read from a file or stream
+    """
+    content = kwargs.get("content")
+    if content is not None and not isinstance(content, (bytes, str)):
+        return False
+    
+    for value in (kwargs.get("files") or {}).values():
+        file_content = value[1] if isinstance(value, tuple) else value
+        if not isinstance(file_content, (bytes, str)):
+            return False
+    
+    return True
+
+
+# Singleton instance
+_connection_pool = None
+
+
+def get_connection_pool() -> ConnectionPoolManager:
+    """
+    Get the connection pool manager instance.
+    
+    Returns:
+        ConnectionPoolManager: Connection pool manager instance
+    """
+    global _connection_pool
+    if _connection_pool is None:
+        _connection_pool = ConnectionPoolManager()
+    return _connection_pool
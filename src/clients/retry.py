@@ -0,0 +1,497 @@
+import asyncio
+import random
+import time
+from typing import Any, Dict, Optional, Type
+
+import httpx
+from httpx import Response
+
+from src.clients.budget import RequestBudget
+from src.clients.circuit_breaker import get_circuit_breaker
+from src.clients.concurrency import get_concurrency_limiter
+from src.clients.http_pool import ConnectionPoolManager
+from src.config import ServiceConfig
+from src.logging_setup import get_logger
+from src.utils import deadline
+from src.utils.errors import NeuralBabelError, ServiceError
+from src.utils.metrics import (
+    SERVICE_ERRORS,
+    SERVICE_LATENCY,
+    SERVICE_REQUESTS,
+    SERVICE_RETRIES,
+    SERVICE_RETRY_BUDGET_EXHAUSTED
+)
+
+logger = get_logger(__name__)
+
+
+class RetryBudget(RequestBudget):
+    """
+    Caps retries to a service at a fraction of its requests.
+    """
+
+
+class RetryPolicy:
+    """
+    Sends requests to a component service, retrying transient failures.
+    
+    Transport failures, such as timeouts, refused or reset connections and
+    protocol errors, and the status codes in
+    ``service_config.retry_status_codes`` are retried up to
+    ``service_config.retries`` times. Failures after the request may have
+    been sent are only retried if its body can be sent again. Each retry waits a random time between
+    zero and the exponential backoff (full jitter), so requests that failed
+    together do not retry together, and needs a token from the service's
+    retry budget. Retries that could not finish before the request deadline
+    are skipped.
+    
+    Every attempt first asks the service's circuit breaker, so requests to a
+    service that keeps failing fail at once instead of waiting to time out,
+    and then takes a slot from the service's adaptive concurrency limiter,
+    queueing or being shed when the service is at its limit.
+    """
+    
+    def __init__(
+        self,
+        service_config: ServiceConfig,
+        connection_pool: ConnectionPoolManager,
+        error_class: Type[ServiceError],
+        display_name: str
+    ):
+        """
+        Initialize the retry policy.
+        
+        Args:
+            service_config: Service configuration
+            connection_pool: Connection pool to send requests over
+            error_class: Stage-specific error raised when a request fails
+            display_name: Service name used in log and error messages
+        """
+        self.service_config = service_config
+        self.connection_pool = connection_pool
+        self.error_class = error_class
+        self.display_name = display_name
+        self.budget = get_retry_budget(service_config)
+        self.circuit_breaker = None
+        if service_config.circuit_breaker_enabled:
+            self.circuit_breaker = get_circuit_breaker(service_config)
+        self.concurrency_limiter = None
+        if service_config.concurrency_limit_enabled:
+            self.concurrency_limiter = get_concurrency_limiter(service_config)
+    
+    def backoff(self, retry_count: int) -> float:
+        """
+        Pick the wait before a retry.
+        
+        Args:
+            retry_count: Number of retries already made
+        
+        Returns:
+            float: Seconds to wait
+        """
+        cap = min(
+            self.service_config.retry_max_backoff,
+            self.service_config.backoff_factor * (2 ** retry_count)
+        )
+        return random.uniform(0, cap)
+    
+    async def request(self, method: str, url: str, operation: str, **kwargs) -> Response:
+        """
+        Send a request, retrying transient failures.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            operation: Operation label for metrics, the request path
+            **kwargs: Additional arguments for the request
+        
+        Returns:
+            Response: HTTP response with a status code below 400
+        
+        Raises:
+            ServiceError: The stage-specific error if the request fails
+        """
+        service = self.service_config.service_type
+        retry_count = 0
+        self.budget.record_request()
+        
+        while True:
+            # Fail fast while the circuit breaker is open
+            if self.circuit_breaker is not None and not self.circuit_breaker.allow():
+                if retry_count > 0:
+                    raise error
+                raise self._circuit_open_error(url)
+            
+            # Wait for a concurrency slot, queueing while the service is busy
+            if self.concurrency_limiter is not None and not await self._acquire_slot():
+                if retry_count > 0:
+                    raise error
+                raise self._overloaded_error(url)
+            
+            # Record start time
+            start_time = time.time()
+            
+            # Increment request counter
+            SERVICE_REQUESTS.labels(service=service, operation=operation).inc()
+            
+            try:
+                # Make request over the shared connection pool, hedging slow ones
+                response = await self.connection_pool.hedged_request(
+                    self.service_config,
+                    operation=operation,
+                    method=method,
+                    url=url,
+                    **kwargs
+                )
+            except asyncio.CancelledError:
+                self._release_circuit()
+                self._release_slot()
+                raise
+            except httpx.UnsupportedProtocol as e:
+                # A bad URL, not a failing service
+                self._release_circuit()
+                self._release_slot()
+                raise self._transport_error(e, "unsupported_protocol", operation, url, retry_count)
+            except httpx.TransportError as e:
+                self._record_circuit(failed=True)
+                self._release_slot(dropped=True)
+                reason = _transport_reason(e)
+                error = self._transport_error(e, reason, operation, url, retry_count)
+                
+                # Nothing was sent if the connection failed; otherwise the
+                # body must be sent again from the start
+                if not isinstance(e, httpx.ConnectError) and not _can_resend(kwargs):
+                    raise error
+            except NeuralBabelError as e:
+                # Not the service's fault, e.g. the request deadline ran out;
+                # raised as is so callers can tell what happened
+                self._release_circuit()
+                self._release_slot()
+                SERVICE_ERRORS.labels(
+                    service=service,
+                    operation=operation,
+                    error_type=type(e).__name__
+                ).inc()
+                raise
+            except Exception as e:
+                # An unexpected failure of the client itself
+                self._release_circuit()
+                self._release_slot()
+                
+                # Increment error counter
+                SERVICE_ERRORS.labels(
+                    service=service,
+                    operation=operation,
+                    error_type=type(e).__name__
+                ).inc()
+                
+                # Log error
+                logger.error(
+                    f"{self.display_name} service request failed",
+                    error=str(e),
+                    url=url,
+                    exc_info=True
+                )
+                
+                raise self.error_class(
+                    f"{self.display_name} service request failed: {str(e)}",
+                    None,
+                    {"error": str(e)}
+                )
+            else:
+                # Record latency
+                latency = time.time() - start_time
+                SERVICE_LATENCY.labels(service=service, operation=operation).observe(latency)
+                self._record_circuit(failed=response.status_code >= 500, latency=latency)
+                if response.status_code >= 500:
+                    self._release_slot(dropped=True)
+                else:
+                    self._release_slot(latency=latency)
+                
+                if response.status_code < 400:
+                    return response
+                
+                reason = f"http_{response.status_code}"
+                error = self._status_error(response, reason, operation, url)
+                if response.status_code not in self.service_config.retry_status_codes:
+                    raise error
+            
+            # Retry unless out of attempts, out of time or out of budget
+            backoff_time = self.backoff(retry_count)
+            if retry_count >= self.service_config.retries or not deadline.can_retry(backoff_time):
+                raise error
+            if not self.budget.try_spend():
+                SERVICE_RETRY_BUDGET_EXHAUSTED.labels(service=service).inc()
+                logger.warning(
+                    f"{self.display_name} retry budget exhausted",
+                    reason=reason,
+                    url=url
+                )
+                raise error
+            
+            retry_count += 1
+            SERVICE_RETRIES.labels(service=service, reason=reason).inc()
+            
+            # Log retry
+            logger.info(
+                f"Retrying {self.display_name} service request",
+                retry_count=retry_count,
+                reason=reason,
+                backoff_time=backoff_time,
+                url=url
+            )
+            
+            # Wait before retrying, then resend file bodies from the start
+            await asyncio.sleep(backoff_time)
+            _rewind_files(kwargs)
+    
+    def _record_circuit(self, failed: bool, latency: Optional[float] = None) -> None:
+        """
+        Report the outcome of an attempt to the circuit breaker.
+        
+        Args:
+            failed: Whether the attempt failed
+            latency: Attempt latency in seconds, if a response arrived
+        """
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(failed, latency)
+    
+    def _release_circuit(self) -> None:
+        """
+        Tell the circuit breaker an attempt ended without an outcome.
+        """
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.release()
+    
+    async def _acquire_slot(self) -> bool:
+        """
+        Take a concurrency slot, handing back a circuit breaker probe if the
+        request is shed or cancelled while waiting.
+        
+        Returns:
+            bool: True if the request got a slot
+        """
+        try:
+            acquired = await self.concurrency_limiter.acquire()
+        except asyncio.CancelledError:
+            self._release_circuit()
+            raise
+        if not acquired:
+            self._release_circuit()
+        return acquired
+    
+    def _release_slot(self, latency: Optional[float] = None, dropped: bool = False) -> None:
+        """
+        Give back a concurrency slot with the attempt's outcome.
+        
+        Args:
+            latency: Attempt latency in seconds, if it succeeded
+            dropped: Whether the attempt timed out, failed to connect or got
+                a 5xx response
+        """
+        if self.concurrency_limiter is not None:
+            self.concurrency_limiter.release(latency, dropped)
+    
+    def _overloaded_error(self, url: str) -> ServiceError:
+        """
+        Build the error for a request shed by the concurrency limiter.
+        
+        Args:
+            url: Request URL
+        
+        Returns:
+            ServiceError: Error to raise
+        """
+        limit = self.concurrency_limiter.limit
+        logger.debug(
+            f"{self.display_name} concurrency limit reached",
+            limit=limit,
+            url=url
+        )
+        return self.error_class(
+            f"{self.display_name} service overloaded: concurrency limit of {limit} reached",
+            None,
+            {"overloaded": True, "concurrency_limit": limit}
+        )
+    
+    def _circuit_open_error(self, url: str) -> ServiceError:
+        """
+        Build the error for a request refused by the circuit breaker.
+        
+        Args:
+            url: Request URL
+        
+        Returns:
+            ServiceError: Error to raise
+        """
+        retry_after = self.circuit_breaker.retry_after()
+        logger.debug(
+            f"{self.display_name} circuit breaker is open",
+            retry_after=retry_after,
+            url=url
+        )
+        return self.error_class(
+            f"{self.display_name} service unavailable: circuit breaker is open",
+            None,
+            {"circuit": self.circuit_breaker.state, "retry_after": retry_after}
+        )
+    
+    def _transport_error(
+        self,
+        error: Exception,
+        reason: str,
+        operation: str,
+        url: str,
+        retry_count: int
+    ) -> ServiceError:
+        """
+        Record a request that got no response and build its error.
+        
+        Args:
+            error: Transport exception
+            reason: Error type label
+            operation: Operation label
+            url: Request URL
+            retry_count: Number of retries already made
+        
+        Returns:
+            ServiceError: Error to raise if the request is not retried
+        """
+        # Increment error counter
+        SERVICE_ERRORS.labels(
+            service=self.service_config.service_type,
+            operation=operation,
+            error_type=reason
+        ).inc()
+        
+        # Log error
+        logger.warning(
+            f"{self.display_name} service request failed",
+            reason=reason,
+            error=str(error),
+            retry_count=retry_count,
+            max_retries=self.service_config.retries,
+            url=url
+        )
+        
+        failure = {"timeout": "timed out", "connect_error": "could not connect"}.get(reason, "failed")
+        return self.error_class(
+            f"{self.display_name} service request {failure} after {retry_count} retries: {str(error)}",
+            None,
+            {"error": str(error), "reason": reason}
+        )
+    
+    def _status_error(self, response: Response, reason: str, operation: str, url: str) -> ServiceError:
+        """
+        Record an error response and build its error.
+        
+        Args:
+            response: HTTP response with a status code of 400 or more
+            reason: Error type label
+            operation: Operation label
+            url: Request URL
+        
+        Returns:
+            ServiceError: Error to raise if the request is not retried
+        """
+        # Increment error counter
+        SERVICE_ERRORS.labels(
+            service=self.service_config.service_type,
+            operation=operation,
+            error_type=reason
+        ).inc()
+        
+        # Log error
+        logger.error(
+            f"{self.display_name} service request failed",
+            status_code=response.status_code,
+            response=response.text,
+            url=url
+        )
+        
+        return self.error_class(
+            f"{self.display_name} service request failed with status code {response.status_code}: {response.text}",
+            response.status_code,
+            {"response": response.text}
+        )
+
+
+def _transport_reason(error: httpx.TransportError) -> str:
+    """
+    Get the error type label of a transport failure.
+    
+    Args:
+        error: Transport exception
+    
+    Returns:
+        str: "timeout", "connect_error", "read_error", "write_error",
+        "protocol_error" or "transport_error"
+    """
+    if isinstance(error, httpx.TimeoutException):
+        return "timeout"
+    if isinstance(error, httpx.ConnectError):
+        return "connect_error"
+    if isinstance(error, httpx.ReadError):
+        return "read_error"
+    if isinstance(error, httpx.WriteError):
+        return "write_error"
+    if isinstance(error, httpx.ProtocolError):
+        return "protocol_error"
+    return "transport_error"
+
+
+def _can_resend(kwargs: Dict[str, Any]) -> bool:
+    """
+    Check whether a request body can be sent again after a failure.
+    
+    Args:
+        kwargs: Request arguments
+    
+    Returns:
+        bool: False if the body is a stream, or a file that cannot be
+        rewound
+    """
+    content = kwargs.get("content")
+    if content is not None and not isinstance(content, (bytes, str)):
+        return False
+    
+    for value in (kwargs.get("files") or {}).values():
+        file_content = value[1] if isinstance(value, tuple) else value
+        if not isinstance(file_content, (bytes, str)) and not hasattr(file_content, "seek"):
+            return False
+    
+    return True
+
+
+def _rewind_files(kwargs: Dict[str, Any]) -> None:
+    """
+    Seek file bodies back to the start so they can be sent again.
+    
+    Args:
+        kwargs: Request arguments
+    """
+    for value in (kwargs.get("files") or {}).values():
+        file_content = value[1] if isinstance(value, tuple) else value
+        if hasattr(file_content, "seek"):
+            file_content.seek(0)
+
+
+# Retry budgets, shared by all clients of a service
+_retry_budgets: Dict[str, RetryBudget] = {}
+
+
+def get_retry_budget(service_config: ServiceConfig) -> RetryBudget:
+    """
+    Get the retry budget of a service.
+    
+    Args:
+        service_config: Service configuration
+    
+    Returns:
+        RetryBudget: Retry budget instance
+    """
+    budget = _retry_budgets.get(service_config.name)
+    if budget is None:
+        budget = RetryBudget(service_config.retry_budget_ratio, service_config.retry_budget_burst)
+        _retry_budgets[service_config.name] = budget
+    return budget
@@ -1,15 +1,17 @@
 import asyncio
-import time
-from typing import Dict, Any, Optional
+from typing import List, Optional, Tuple, Union
 
-import httpx
 from httpx import Response
 
 from src.config import ServiceConfig
+from src.clients.batching import BATCH_UNSUPPORTED_STATUS_CODES, MicroBatcher
+from src.clients.http_pool import get_connection_pool
+from src.clients.retry import RetryPolicy
 from src.logging_setup import get_logger
 from src.orchestrator.service_discovery import get_service_discovery
-from src.utils.errors import TranslationError
-from src.utils.metrics import SERVICE_REQUESTS, SERVICE_ERRORS, SERVICE_LATENCY
+from src.utils.cache import TranslationCache
+from src.utils import json_codec
+from src.utils.errors import NeuralBabelError, TranslationError
 
 logger = get_logger(__name__)
 
@@ -19,15 +21,37 @@ class TranslationClient:
     Client for the Lexi-Shift translation service.
     """
     
-    def __init__(self, service_config: ServiceConfig):
+    def __init__(
+        self,
+        service_config: ServiceConfig,
+        cache: Optional[TranslationCache] = None,
+        batch_max_size: int = 1,
+        batch_window: float = 0.01
+    ):
         """
         Initialize the translation client.
         
         Args:
             service_config: Service configuration
+            cache: Translation cache. If None, every call goes to the service.
+            batch_max_size: Maximum number of texts per batched request.
+                Batching is disabled when this is 1.
+            batch_window: Maximum time in seconds a text waits for its batch
         """
         self.service_config = service_config
+        self.cache = cache
+        self._batcher = None
+        if batch_max_size > 1:
+            self._batcher = MicroBatcher(
+                "translation",
+                self._translate_batch,
+                max_batch_size=batch_max_size,
+                max_wait=batch_window,
+                error_class=TranslationError
+            )
         self.service_discovery = get_service_discovery()
+        self.connection_pool = get_connection_pool()
+        self.retry_policy = RetryPolicy(service_config, self.connection_pool, TranslationError, "Translation")
         self.base_url = None
     
     async def _get_base_url(self) -> str:
@@ -64,135 +88,8 @@ class TranslationClient:
         # Get base URL
         base_url = await self._get_base_url()
         
-        # Construct URL
-        url = f"{base_url}{path}"
-        
-        # Set timeout
-        timeout = httpx.Timeout(self.service_config.timeout)
-        
-        # Initialize retry count
-        retry_count = 0
-        
-        while True:
-            try:
-                # Record start time
-                start_time = time.time()
-                
-                # Increment request counter
-                SERVICE_REQUESTS.labels(
-                    service="translation",
-                    operation=path
-                ).inc()
-                
-                # Make request
-                async with httpx.AsyncClient(timeout=timeout) as client:
-                    response = await client.request(
-                        method=method,
-                        url=url,
-                        **kwargs
-                    )
-                
-                # Record latency
-                latency = time.time() - start_time
-                SERVICE_LATENCY.labels(
-                    service="translation",
-                    operation=path
-                ).observe(latency)
-                
-                # Check response
-                if response.status_code >= 400:
-                    # Increment error counter
-                    SERVICE_ERRORS.labels(
-                        service="translation",
-                        operation=path,
-                        error_type=f"http_{response.status_code}"
-                    ).inc()
-                    
-                    # Log error
-                    logger.error(
-                        "Translation service request failed",
-                        status_code=response.status_code,
-                        response=response.text,
-                        url=url
-                    )
-                    
-                    # Raise error
-                    raise TranslationError(
-                        f"Translation service request failed with status code {response.status_code}: {response.text}",
-                        response.status_code,
-                        {"response": response.text}
-                    )
-                
-                # Return response
-                return response
-            
-            except httpx.TimeoutException as e:
-                # Increment error counter
-                SERVICE_ERRORS.labels(
-                    service="translation",
-                    operation=path,
-                    error_type="timeout"
-                ).inc()
-                
-                # Log error
-                logger.warning(
-                    "Translation service request timed out",
-                    retry_count=retry_count,
-                    max_retries=self.service_config.retries,
-                    url=url
-                )
-                
-                # Check if we should retry
-                if retry_count < self.service_config.retries:
-                    # Increment retry count
-                    retry_count += 1
-                    
-                    # Calculate backoff time
-                    backoff_time = self.service_config.backoff_factor * (2 ** (retry_count - 1))
-                    
-                    # Log retry
-                    logger.info(
-                        "Retrying translation service request",
-                        retry_count=retry_count,
-                        backoff_time=backoff_time,
-                        url=url
-                    )
-                    
-                    # Wait before retrying
-                    await asyncio.sleep(backoff_time)
-                    
-                    # Continue to next retry
-                    continue
-                
-                # If we've exhausted retries, raise error
-                raise TranslationError(
-                    f"Translation service request timed out after {retry_count} retries: {str(e)}",
-                    None,
-                    {"error": str(e)}
-                )
-            
-            except Exception as e:
-                # Increment error counter
-                SERVICE_ERRORS.labels(
-                    service="translation",
-                    operation=path,
-                    error_type=type(e).__name__
-                ).inc()
-                
-                # Log error
-                logger.error(
-                    "Translation service request failed",
-                    error=str(e),
-                    url=url,
-                    exc_info=True
-                )
-                
-                # Raise error
-                raise TranslationError(
-                    f"Translation service request failed: {str(e)}",
-                    None,
-                    {"error": str(e)}
-                )
+        # Send with the shared retry policy
+        return await self.retry_policy.request(method, f"{base_url}{path}", path, **kwargs)
     
     async def translate(
         self, 
@@ -203,6 +100,50 @@ class TranslationClient:
         """
         Translate text from source language to target language.
         
+        Args:
+            text: Text to translate
+            source_lang: Source language code
+            target_lang: Target language code
+            
+        Returns:
+            str: Translated text
+            
+        Raises:
+            TranslationError: If translation fails
+        """
+        # Serve repeated phrases from the cache
+        if self.cache is not None:
+            cached_translation = self.cache.get_translation(text, source_lang, target_lang)
+            if cached_translation is not None:
+                logger.info(
+                    "Translation served from cache",
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                    text_length=len(text)
+                )
+                return cached_translation
+        
+        # Coalesce concurrent calls for the same language pair when batching
+        if self._batcher is not None:
+            translation = await self._batcher.submit((source_lang, target_lang), text)
+        else:
+            translation = await self._request_translation(text, source_lang, target_lang)
+        
+        # Cache the translation
+        if self.cache is not None and translation:
+            self.cache.set_translation(text, source_lang, target_lang, translation)
+        
+        return translation
+    
+    async def _request_translation(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str
+    ) -> str:
+        """
+        Translate a single text with its own request.
+        
         Args:
             text: Text to translate
             source_lang: Source language code
@@ -232,7 +173,7 @@ class TranslationClient:
             )
             
             # Parse response
-            result = response.json()
+            result = json_codec.loads(response.content)
             
             # Extract translation - try both field names
             translation = result.get("translated_text", result.get("translation", ""))
@@ -248,8 +189,8 @@ class TranslationClient:
             
             return translation
         
-        except TranslationError:
-            # Re-raise translation errors
+        except NeuralBabelError:
+            # Re-raise translation, deadline and overload errors unchanged
             raise
         
         except Exception as e:
@@ -275,6 +216,100 @@ class TranslationClient:
                 }
             )
     
+    async def _translate_batch(
+        self,
+        language_pair: Tuple[str, str],
+        texts: List[str]
+    ) -> List[Union[str, TranslationError]]:
+        """
+        Translate a batch of texts for one language pair in a single request.
+        
+        If the service has no batch endpoint or its response is malformed,
+        each text is sent with its own request instead. Any other failure,
+        such as a timeout, an open circuit breaker or an overloaded service,
+        fails every text, since splitting the batch would only multiply the
+        load on a struggling service.
+        
+        Args:
+            language_pair: Source and target language codes
+            texts: Texts to translate
+            
+        Returns:
+            List[Union[str, TranslationError]]: Translation or error for each text
+        """
+        source_lang, target_lang = language_pair
+        
+        # A batch of one is just a normal request
+        if len(texts) == 1:
+            try:
+                return [await self._request_translation(texts[0], source_lang, target_lang)]
+            except TranslationError as e:
+                return [e]
+        
+        items = None
+        try:
+            # Make batched request
+            response = await self._make_request(
+                method="POST",
+                path="/translate/batch",
+                json={
+                    "texts": texts,
+                    "options": {
+                        "source_lang": source_lang,
+                        "target_lang": target_lang
+                    }
+                }
+            )
+            items = json_codec.loads(response.content).get("translations")
+        except TranslationError as e:
+            if e.status_code not in BATCH_UNSUPPORTED_STATUS_CODES:
+                # One error per text, so marking one caller's does not
+                # mark the others
+                return [TranslationError(e.message, e.status_code, dict(e.details)) for _ in texts]
+        except (ValueError, AttributeError):
+            # Malformed response; fall back below
+            pass
+        
+        if not isinstance(items, list) or len(items) != len(texts):
+            logger.warning(
+                "Batched translation unavailable, translating texts individually",
+                source_lang=source_lang,
+                target_lang=target_lang,
+                batch_size=len(texts)
+            )
+            return await asyncio.gather(
+                *(self._request_translation(text, source_lang, target_lang) for text in texts),
+                return_exceptions=True
+            )
+        
+        # Split the results back out, keeping per-item errors separate
+        results: List[Union[str, TranslationError]] = []
+        for text, item in zip(texts, items):
+            if isinstance(item, dict) and item.get("error"):
+                results.append(TranslationError(
+                    f"Translation failed: {item['error']}",
+                    None,
+                    {
+                        "error": item["error"],
+                        "source_lang": source_lang,
+                        "target_lang": target_lang,
+                        "text_length": len(text)
+                    }
+                ))
+            elif isinstance(item, dict):
+                results.append(item.get("translated_text", item.get("translation", "")))
+            else:
+                results.append(item)
+        
+        logger.info(
+            "Batch translated successfully",
+            source_lang=source_lang,
+            target_lang=target_lang,
+            batch_size=len(texts)
+        )
+        
+        return results
+    
     async def check_health(self) -> bool:
         """
         Check if the translation service is healthy.
@@ -1,15 +1,17 @@
 import asyncio
-import time
-from typing import Dict, Any, Optional
+import base64
+from typing import Dict, Any, List, Optional, Tuple, Union
 
-import httpx
 from httpx import Response
 
 from src.config import ServiceConfig
+from src.clients.batching import BATCH_UNSUPPORTED_STATUS_CODES, MicroBatcher
+from src.clients.http_pool import get_connection_pool
+from src.clients.retry import RetryPolicy
 from src.logging_setup import get_logger
 from src.orchestrator.service_discovery import get_service_discovery
-from src.utils.errors import TTSError
-from src.utils.metrics import SERVICE_REQUESTS, SERVICE_ERRORS, SERVICE_LATENCY
+from src.utils import json_codec
+from src.utils.errors import NeuralBabelError, TTSError
 
 logger = get_logger(__name__)
 
@@ -19,15 +21,35 @@ class TTSClient:
     Client for the Vox-Raga TTS service.
     """
     
-    def __init__(self, service_config: ServiceConfig):
+    def __init__(
+        self,
+        service_config: ServiceConfig,
+        batch_max_size: int = 1,
+        batch_max_wait: float = 0.02
+    ):
         """
         Initialize the TTS client.
         
         Args:
             service_config: Service configuration
+            batch_max_size: Maximum number of texts per batched request.
+                Batching is disabled when this is 1.
+            batch_max_wait: Longest flush window in seconds, used under load
         """
         self.service_config = service_config
+        self._batcher = None
+        if batch_max_size > 1:
+            self._batcher = MicroBatcher(
+                "tts",
+                self._synthesize_batch,
+                max_batch_size=batch_max_size,
+                max_wait=batch_max_wait,
+                adaptive=True,
+                error_class=TTSError
+            )
         self.service_discovery = get_service_discovery()
+        self.connection_pool = get_connection_pool()
+        self.retry_policy = RetryPolicy(service_config, self.connection_pool, TTSError, "TTS")
         self.base_url = None
     
     async def _get_base_url(self) -> str:
@@ -54,145 +76,18 @@ class TTSClient:
             method: HTTP method
             path: Request path
             **kwargs: Additional arguments for the request
-            
+        
         Returns:
             Response: HTTP response
-            
+        
         Raises:
             TTSError: If the request fails
         """
         # Get base URL
         base_url = await self._get_base_url()
         
-        # Construct URL
-        url = f"{base_url}{path}"
-        
-        # Set timeout
-        timeout = httpx.Timeout(self.service_config.timeout)
-        
-        # Initialize retry count
-        retry_count = 0
-        
-        while True:
-            try:
-                # Record start time
-                start_time = time.time()
-                
-                # Increment request counter
-                SERVICE_REQUESTS.labels(
-                    service="tts",
-                    operation=path
-                ).inc()
-                
-                # Make request
-                async with httpx.AsyncClient(timeout=timeout) as client:
-                    response = await client.request(
-                        method=method,
-                        url=url,
-                        **kwargs
-                    )
-                
-                # Record latency
-                latency = time.time() - start_time
-                SERVICE_LATENCY.labels(
-                    service="tts",
-                    operation=path
-                ).observe(latency)
-                
-                # Check response
-                if response.status_code >= 400:
-                    # Increment error counter
-                    SERVICE_ERRORS.labels(
-                        service="tts",
-                        operation=path,
-                        error_type=f"http_{response.status_code}"
-                    ).inc()
-                    
-                    # Log error
-                    logger.error(
-                        "TTS service request failed",
-                        status_code=response.status_code,
-                        response=response.text,
-                        url=url
-                    )
-                    
-                    # Raise error
-                    raise TTSError(
-                        f"TTS service request failed with status code {response.status_code}: {response.text}",
-                        response.status_code,
-                        {"response": response.text}
-                    )
-                
-                # Return response
-                return response
-            
-            except httpx.TimeoutException as e:
-                # Increment error counter
-                SERVICE_ERRORS.labels(
-                    service="tts",
-                    operation=path,
-                    error_type="timeout"
-                ).inc()
-                
-                # Log error
-                logger.warning(
-                    "TTS service request timed out",
-                    retry_count=retry_count,
-                    max_retries=self.service_config.retries,
-                    url=url
-                )
-                
-                # Check if we should retry
-                if retry_count < self.service_config.retries:
-                    # Increment retry count
-                    retry_count += 1
-                    
-                    # Calculate backoff time
-                    backoff_time = self.service_config.backoff_factor * (2 ** (retry_count - 1))
-                    
-                    # Log retry
-                    logger.info(
-                        "Retrying TTS service request",
-                        retry_count=retry_count,
-                        backoff_time=backoff_time,
-                        url=url
-                    )
-                    
-                    # Wait before retrying
-                    await asyncio.sleep(backoff_time)
-                    
-                    # Continue to next retry
-                    continue
-                
-                # If we've exhausted retries, raise error
-                raise TTSError(
-                    f"TTS service request timed out after {retry_count} retries: {str(e)}",
-                    None,
-                    {"error": str(e)}
-                )
-            
-            except Exception as e:
-                # Increment error counter
-                SERVICE_ERRORS.labels(
-                    service="tts",
-                    operation=path,
-                    error_type=type(e).__name__
-                ).inc()
-                
-                # Log error
-                logger.error(
-                    "TTS service request failed",
-                    error=str(e),
-                    url=url,
-                    exc_info=True
-                )
-                
-                # Raise error
-                raise TTSError(
-                    f"TTS service request failed: {str(e)}",
-                    None,
-                    {"error": str(e)}
-                )
+        # Send with the shared retry policy
+        return await self.retry_policy.request(method, f"{base_url}{path}", path, **kwargs)
     
     async def synthesize(
         self, 
@@ -209,10 +104,38 @@ class TTSClient:
             language: Language code
             voice: Voice ID
             audio_format: Audio format
-            
+        
         Returns:
             bytes: Audio data
-            
+        
+        Raises:
+            TTSError: If synthesis fails
+        """
+        # Group concurrent jobs for the same voice when batching
+        if self._batcher is not None:
+            return await self._batcher.submit((language, voice, audio_format), text)
+        
+        return await self._request_synthesis(text, language, voice, audio_format)
+    
+    async def _request_synthesis(
+        self,
+        text: str,
+        language: str,
+        voice: str,
+        audio_format: str
+    ) -> bytes:
+        """
+        Synthesize a single text with its own request.
+        
+        Args:
+            text: Text to synthesize
+            language: Language code
+            voice: Voice ID
+            audio_format: Audio format
+        
+        Returns:
+            bytes: Audio data
+        
         Raises:
             TTSError: If synthesis fails
         """
@@ -247,8 +170,8 @@ class TTSClient:
             
             return audio_data
         
-        except TTSError:
-            # Re-raise TTS errors
+        except NeuralBabelError:
+            # Re-raise TTS, deadline and overload errors unchanged
             raise
         
         except Exception as e:
@@ -276,6 +199,124 @@ class TTSClient:
                 }
             )
     
+    async def _synthesize_batch(
+        self,
+        group: Tuple[str, str, str],
+        texts: List[str]
+    ) -> List[Union[bytes, TTSError]]:
+        """
+        Synthesize a batch of texts sharing a language, voice and format in a
+        single request.
+        
+        If the service has no batch endpoint or its response is malformed,
+        each text is sent with its own request instead. Any other failure,
+        such as a timeout, an open circuit breaker or an overloaded service,
+        fails every text, since splitting the batch would only multiply the
+        load on a struggling service.
+        
+        Args:
+            group: Language code, voice ID and audio format
+            texts: Texts to synthesize
+        
+        Returns:
+            List[Union[bytes, TTSError]]: Audio data or error for each text
+        """
+        language, voice, audio_format = group
+        
+        # A batch of one is just a normal request
+        if len(texts) == 1:
+            try:
+                return [await self._request_synthesis(texts[0], language, voice, audio_format)]
+            except TTSError as e:
+                return [e]
+        
+        try:
+            # Make batched request
+            response = await self._make_request(
+                method="POST",
+                path="/synthesize/batch",
+                json={
+                    "texts": texts,
+                    "language": language,
+                    "voice": voice,
+                    "audio_format": audio_format
+                }
+            )
+            items = json_codec.loads(response.content).get("results")
+            if not isinstance(items, list) or len(items) != len(texts):
+                raise ValueError("Batched synthesis response does not match the request")
+            
+            # Split the audio back out, keeping per-item errors separate
+            results: List[Union[bytes, TTSError]] = []
+            for text, item in zip(texts, items):
+                if item.get("error"):
+                    results.append(TTSError(
+                        f"Synthesis failed: {item['error']}",
+                        None,
+                        {
+                            "error": item["error"],
+                            "language": language,
+                            "voice": voice,
+                            "audio_format": audio_format,
+                            "text_length": len(text)
+                        }
+                    ))
+                else:
+                    results.append(base64.b64decode(item["audio"]))
+        except TTSError as e:
+            if e.status_code not in BATCH_UNSUPPORTED_STATUS_CODES:
+                # One error per text, so marking one caller's does not
+                # mark the others
+                return [TTSError(e.message, e.status_code, dict(e.details)) for _ in texts]
+            return await self._synthesize_individually(texts, language, voice, audio_format, str(e))
+        except (ValueError, KeyError, AttributeError, TypeError) as e:
+            # Malformed response
+            return await self._synthesize_individually(texts, language, voice, audio_format, str(e))
+        
+        logger.info(
+            "Batch synthesized successfully",
+            language=language,
+            voice=voice,
+            audio_format=audio_format,
+            batch_size=len(texts)
+        )
+        
+        return results
+    
+    async def _synthesize_individually(
+        self,
+        texts: List[str],
+        language: str,
+        voice: str,
+        audio_format: str,
+        reason: str
+    ) -> List[Union[bytes, TTSError]]:
+        """
+        Synthesize the texts of a batch the service could not take as one,
+        each with its own request.
+        
+        Args:
+            texts: Texts to synthesize
+            language: Language code
+            voice: Voice ID
+            audio_format: Audio format
+            reason: Why the batched request could not be used
+        
+        Returns:
+            List[Union[bytes, TTSError]]: Audio data or error for each text
+        """
+        logger.warning(
+            "Batched synthesis unavailable, synthesizing texts individually",
+            error=reason,
+            language=language,
+            voice=voice,
+            batch_size=len(texts)
+        )
+        return await asyncio.gather(
+            *(self._request_synthesis(text, language, voice, audio_format) for text in texts),
+            return_exceptions=True
+        )
+    
     async def check_health(self) -> bool:
         """
         Check if the TTS service is healthy.
@@ -1,4 +1,4 @@
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 import os
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings
@@ -13,6 +13,92 @@ class ServiceConfig(BaseModel):
     timeout: float = 30.0
     retries: int = 3
     backoff_factor: float = 0.5
+    retry_max_backoff: float = 10.0  # seconds
+    retry_status_codes: List[int] = [502, 503, 504]
+    # Retries allowed per request, and how many can be saved up
+    retry_budget_ratio: float = 0.2
+    retry_budget_burst: float = 10.0
+    # Per-phase timeouts; None falls back to `timeout`
+    connect_timeout: Optional[float] = None
+    read_timeout: Optional[float] = None
+    write_timeout: Optional[float] = None
+    pool_timeout: Optional[float] = None
+    # Connection pool
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0  # seconds
+    http2: bool = False
+    dns_cache_ttl: float = 60.0  # seconds
+    # Hedging: resend requests still unanswered at this latency percentile,
+    # e.g. 0.95; None disables it
+    hedge_percentile: Optional[float] = None
+    hedge_min_delay: float = 0.05  # seconds
+    hedge_min_samples: int = 100  # Latency observations needed before hedging
+    # Circuit breaker: open when the failure or slow-call rate over the
+    # rolling window reaches its threshold; a slow-call threshold of None
+    # ignores latency
+    circuit_breaker_enabled: bool = True
+    circuit_window: float = 30.0  # seconds
+    circuit_min_calls: int = 20  # Calls in the window before rates are checked
+    circuit_failure_rate: float = 0.5
+    circuit_slow_call_threshold: Optional[float] = None  # seconds
+    circuit_slow_call_rate: float = 0.5
+    circuit_open_duration: float = 10.0  # seconds
+    circuit_half_open_calls: int = 3  # Probe calls that must succeed to close
+    # Adaptive concurrency limit: grows while latency stays near the no-load
+    # baseline and shrinks as it rises; excess requests queue, then are shed
+    concurrency_limit_enabled: bool = False
+    concurrency_initial_limit: int = 20
+    concurrency_min_limit: int = 1
+    concurrency_max_limit: int = 100
+    concurrency_latency_tolerance: float = 1.5  # Latency over baseline treated as no load
+    concurrency_backoff_ratio: float = 0.9  # Limit kept after a failed request
+    concurrency_baseline_samples: int = 500  # Requests the baseline latency averages over
+    concurrency_max_queue: int = 100
+    concurrency_max_wait: float = 5.0  # seconds
+
+
+class LongAudioConfig(BaseModel):
+    """Configuration for chunked transcription of long recordings."""
+    enabled: bool = False
+    threshold_seconds: float = 60.0  # Recordings longer than this are chunked
+    window_seconds: float = 30.0
+    overlap_seconds: float = 1.0
+    concurrency: int = 4
+    # Per-language overrides of the fields above, e.g. {"hi": {"window_seconds": 20}}
+    language_overrides: Dict[str, Dict[str, float]] = {}
+    
+    def for_language(self, language: str) -> "LongAudioConfig":
+        """Get the configuration with any overrides for a language applied."""
+        overrides = self.language_overrides.get(language)
+        if not overrides:
+            return self
+        return self.model_copy(update=overrides)
+
+
+class TenantConfig(BaseModel):
+    """Configuration for per-tenant quotas and fair queuing."""
+    # Token buckets; a rate of 0 disables that limit
+    requests_per_second: float = 0.0
+    request_burst: float = 10.0
+    audio_seconds_per_second: float = 0.0
+    audio_seconds_burst: float = 600.0
+    weight: float = 1.0  # Share of the pipeline relative to other tenants
+    # Per-tenant overrides of the fields above, e.g. {"backfill": {"weight": 0.2}}
+    tenant_overrides: Dict[str, Dict[str, float]] = {}
+    # API keys accepted in X-API-Key, mapped to tenant IDs; once set, tenants
+    # can only be identified by key
+    api_keys: Dict[str, str] = {}
+    # Unconfigured tenant IDs accepted from X-Tenant-ID before further ones
+    # are counted as the default tenant
+    max_header_tenants: int = 100
+    
+    def for_tenant(self, tenant: str) -> "TenantConfig":
+        """Get the configuration with any overrides for a tenant applied."""
+        overrides = self.tenant_overrides.get(tenant)
+        if not overrides:
+            return self
+        return self.model_copy(update=overrides)
 
 
 class PipelineConfig(BaseModel):
@@ -27,8 +113,57 @@ class PipelineConfig(BaseModel):
         ("fr", "en"), ("de", "en"), ("hi", "en")
     ]
     enable_streaming: bool = False
+    # Utterance detection for the real-time WebSocket endpoint
+    stream_silence_threshold_db: float = -40.0
+    stream_min_silence_ms: int = 600
+    stream_max_utterance_seconds: float = 15.0
+    stream_max_queued_utterances: int = 4  # Utterances awaiting translation before the stream is closed
+    segment_pipeline: bool = False  # Translate and synthesize ASR segments concurrently
+    segment_concurrency: int = 4
+    translation_batch_max_size: int = 1  # 1 disables translation batching
+    translation_batch_window_ms: float = 10.0
+    tts_batch_max_size: int = 1  # 1 disables TTS batching
+    tts_batch_max_wait_ms: float = 20.0  # Flush window at full load; adapts down to 0 when idle
+    long_audio: LongAudioConfig = LongAudioConfig()
+    # Downmix and resample WAV uploads before ASR
+    audio_preprocessing: bool = False
+    preprocess_sample_rate: int = 16000
+    preprocess_flac: bool = False  # Needs the optional soundfile package
+    preprocess_workers: int = 2
+    # Trim silence before ASR; requests with no speech skip translation and TTS
+    vad_enabled: bool = False
+    vad_energy_margin_db: float = 10.0
+    vad_min_speech_ms: int = 150
+    vad_max_pause_ms: int = 1000
+    vad_padding_ms: int = 200
+    # Batch endpoint
+    batch_max_items: int = 256
+    batch_max_concurrency: int = 8
+    # Asynchronous jobs; if jobs_dir is None the job API is disabled
+    jobs_dir: Optional[str] = None
+    jobs_concurrency: int = 2
+    jobs_max_attempts: int = 3
+    jobs_retry_backoff: float = 5.0  # seconds before the first retry of a failed job; doubles per attempt
+    jobs_ttl: int = 86400  # seconds finished jobs are kept
+    jobs_poll_interval: float = 1.0  # seconds
+    # Admission control for /translate requests
+    admission_max_in_flight: int = 32
+    admission_max_queue: int = 64
+    admission_max_wait: float = 10.0  # seconds
+    tenants: TenantConfig = TenantConfig()
+    # Default deadline for /translate requests without an X-Request-Timeout-Ms
+    # header; 0 disables it. The time left is split across the stages by share
+    request_timeout: float = 120.0  # seconds
+    stage_budget_shares: Dict[str, float] = {"asr": 0.5, "translation": 0.2, "tts": 0.3}
+    # Hedged requests to all services, as a share of requests
+    hedge_budget_ratio: float = 0.05
+    hedge_budget_burst: float = 10.0
     cache_enabled: bool = True
     cache_ttl: int = 3600  # seconds
+    cache_max_bytes: int = 64 * 1024 * 1024
+    asr_cache_max_bytes: int = 64 * 1024 * 1024
+    tts_cache_dir: Optional[str] = None  # If None, TTS audio is not cached
+    tts_cache_max_bytes: int = 1024 * 1024 * 1024
 
 
 class Settings(BaseSettings):
@@ -54,11 +189,106 @@ class Settings(BaseSettings):
     service_timeout: float = 30.0
     service_retries: int = 3
     service_backoff_factor: float = 0.5
+    service_retry_max_backoff: float = 10.0  # seconds
+    service_retry_status_codes: List[int] = [502, 503, 504]
+    service_retry_budget_ratio: float = 0.2
+    service_retry_budget_burst: float = 10.0
+    service_connect_timeout: Optional[float] = None
+    service_read_timeout: Optional[float] = None
+    service_write_timeout: Optional[float] = None
+    service_pool_timeout: Optional[float] = None
+    
+    # Connection pool configuration
+    service_max_connections: int = 100
+    service_max_keepalive_connections: int = 20
+    service_keepalive_expiry: float = 30.0  # seconds
+    service_http2: bool = False
+    service_dns_cache_ttl: float = 60.0  # seconds
+    
+    # Request hedging; a percentile of None disables it for that service
+    asr_hedge_percentile: Optional[float] = None
+    translation_hedge_percentile: Optional[float] = None
+    tts_hedge_percentile: Optional[float] = None
+    service_hedge_min_delay: float = 0.05  # seconds
+    service_hedge_min_samples: int = 100
+    hedge_budget_ratio: float = 0.05
+    hedge_budget_burst: float = 10.0
+    
+    # Circuit breakers
+    service_circuit_breaker_enabled: bool = True
+    service_circuit_window: float = 30.0  # seconds
+    service_circuit_min_calls: int = 20
+    service_circuit_failure_rate: float = 0.5
+    service_circuit_slow_call_threshold: Optional[float] = None  # seconds
+    service_circuit_slow_call_rate: float = 0.5
+    service_circuit_open_duration: float = 10.0  # seconds
+    service_circuit_half_open_calls: int = 3
+    
+    # Adaptive concurrency limits
+    service_concurrency_limit_enabled: bool = False
+    service_concurrency_initial_limit: int = 20
+    service_concurrency_min_limit: int = 1
+    service_concurrency_max_limit: int = 100
+    service_concurrency_latency_tolerance: float = 1.5
+    service_concurrency_backoff_ratio: float = 0.9
+    service_concurrency_baseline_samples: int = 500
+    service_concurrency_max_queue: int = 100
+    service_concurrency_max_wait: float = 5.0  # seconds
     
     # Pipeline configuration
     enable_streaming: bool = False
+    stream_silence_threshold_db: float = -40.0
+    stream_min_silence_ms: int = 600
+    stream_max_utterance_seconds: float = 15.0
+    stream_max_queued_utterances: int = 4
+    segment_pipeline: bool = False
+    segment_concurrency: int = 4
+    translation_batch_max_size: int = 1
+    translation_batch_window_ms: float = 10.0
+    tts_batch_max_size: int = 1
+    tts_batch_max_wait_ms: float = 20.0
+    long_audio_enabled: bool = False
+    long_audio_threshold_seconds: float = 60.0
+    long_audio_window_seconds: float = 30.0
+    long_audio_overlap_seconds: float = 1.0
+    long_audio_concurrency: int = 4
+    long_audio_language_overrides: Dict[str, Dict[str, float]] = {}
+    audio_preprocessing: bool = False
+    preprocess_sample_rate: int = 16000
+    preprocess_flac: bool = False
+    preprocess_workers: int = 2
+    vad_enabled: bool = False
+    vad_energy_margin_db: float = 10.0
+    vad_min_speech_ms: int = 150
+    vad_max_pause_ms: int = 1000
+    vad_padding_ms: int = 200
+    batch_max_items: int = 256
+    batch_max_concurrency: int = 8
+    jobs_dir: Optional[str] = None
+    jobs_concurrency: int = 2
+    jobs_max_attempts: int = 3
+    jobs_retry_backoff: float = 5.0  # seconds
+    jobs_ttl: int = 86400  # seconds
+    jobs_poll_interval: float = 1.0  # seconds
+    admission_max_in_flight: int = 32
+    admission_max_queue: int = 64
+    admission_max_wait: float = 10.0  # seconds
+    tenant_requests_per_second: float = 0.0
+    tenant_request_burst: float = 10.0
+    tenant_audio_seconds_per_second: float = 0.0
+    tenant_audio_seconds_burst: float = 600.0
+    tenant_weight: float = 1.0
+    tenant_overrides: Dict[str, Dict[str, float]] = {}
+    tenant_api_keys: Dict[str, str] = {}
+    tenant_max_header_tenants: int = 100
+    request_timeout: float = 120.0  # seconds
+    stage_budget_shares: Dict[str, float] = {"asr": 0.5, "translation": 0.2, "tts": 0.3}
     cache_enabled: bool = True
     cache_ttl: int = 3600  # seconds
+    cache_max_bytes: int = 64 * 1024 * 1024
+    asr_cache_max_bytes: int = 64 * 1024 * 1024
+    tts_cache_dir: Optional[str] = None
+    tts_cache_max_bytes: int = 1024 * 1024 * 1024
     
     # Application configuration
     log_level: str = "INFO"
@@ -80,13 +310,49 @@ def get_pipeline_config(settings: Settings = None) -> PipelineConfig:
     
     Args:
         settings: Application settings. If None, will load from environment.
-        
+    
     Returns:
         PipelineConfig: Configuration for the translation pipeline.
     """
     if settings is None:
         settings = get_settings()
     
+    # Connection and retry options shared by all services
+    connection_options = {
+        "retry_max_backoff": settings.service_retry_max_backoff,
+        "retry_status_codes": settings.service_retry_status_codes,
+        "retry_budget_ratio": settings.service_retry_budget_ratio,
+        "retry_budget_burst": settings.service_retry_budget_burst,
+        "connect_timeout": settings.service_connect_timeout,
+        "read_timeout": settings.service_read_timeout,
+        "write_timeout": settings.service_write_timeout,
+        "pool_timeout": settings.service_pool_timeout,
+        "max_connections": settings.service_max_connections,
+        "max_keepalive_connections": settings.service_max_keepalive_connections,
+        "keepalive_expiry": settings.service_keepalive_expiry,
+        "http2": settings.service_http2,
+        "dns_cache_ttl": settings.service_dns_cache_ttl,
+        "hedge_min_delay": settings.service_hedge_min_delay,
+        "hedge_min_samples": settings.service_hedge_min_samples,
+        "circuit_breaker_enabled": settings.service_circuit_breaker_enabled,
+        "circuit_window": settings.service_circuit_window,
+        "circuit_min_calls": settings.service_circuit_min_calls,
+        "circuit_failure_rate": settings.service_circuit_failure_rate,
+        "circuit_slow_call_threshold": settings.service_circuit_slow_call_threshold,
+        "circuit_slow_call_rate": settings.service_circuit_slow_call_rate,
+        "circuit_open_duration": settings.service_circuit_open_duration,
+        "circuit_half_open_calls": settings.service_circuit_half_open_calls,
+        "concurrency_limit_enabled": settings.service_concurrency_limit_enabled,
+        "concurrency_initial_limit": settings.service_concurrency_initial_limit,
+        "concurrency_min_limit": settings.service_concurrency_min_limit,
+        "concurrency_max_limit": settings.service_concurrency_max_limit,
+        "concurrency_latency_tolerance": settings.service_concurrency_latency_tolerance,
+        "concurrency_backoff_ratio": settings.service_concurrency_backoff_ratio,
+        "concurrency_baseline_samples": settings.service_concurrency_baseline_samples,
+        "concurrency_max_queue": settings.service_concurrency_max_queue,
+        "concurrency_max_wait": settings.service_concurrency_max_wait
+    }
+    
     # Create service configurations
     asr_service = ServiceConfig(
         name=settings.asr_service_name,
@@ -95,7 +361,9 @@ def get_pipeline_config(settings: Settings = None) -> PipelineConfig:
         endpoint=settings.asr_service_endpoint,
         timeout=settings.service_timeout,
         retries=settings.service_retries,
-        backoff_factor=settings.service_backoff_factor
+        backoff_factor=settings.service_backoff_factor,
+        hedge_percentile=settings.asr_hedge_percentile,
+        **connection_options
     )
     
     translation_service = ServiceConfig(
@@ -105,7 +373,9 @@ def get_pipeline_config(settings: Settings = None) -> PipelineConfig:
         endpoint=settings.translation_service_endpoint,
         timeout=settings.service_timeout,
         retries=settings.service_retries,
-        backoff_factor=settings.service_backoff_factor
+        backoff_factor=settings.service_backoff_factor,
+        hedge_percentile=settings.translation_hedge_percentile,
+        **connection_options
     )
     
     tts_service = ServiceConfig(
@@ -115,7 +385,9 @@ def get_pipeline_config(settings: Settings = None) -> PipelineConfig:
         endpoint=settings.tts_service_endpoint,
         timeout=settings.service_timeout,
         retries=settings.service_retries,
-        backoff_factor=settings.service_backoff_factor
+        backoff_factor=settings.service_backoff_factor,
+        hedge_percentile=settings.tts_hedge_percentile,
+        **connection_options
     )
     
     # Create pipeline configuration
@@ -126,6 +398,62 @@ def get_pipeline_config(settings: Settings = None) -> PipelineConfig:
         default_source_lang=settings.default_source_lang,
         default_target_lang=settings.default_target_lang,
         enable_streaming=settings.enable_streaming,
+        stream_silence_threshold_db=settings.stream_silence_threshold_db,
+        stream_min_silence_ms=settings.stream_min_silence_ms,
+        stream_max_utterance_seconds=settings.stream_max_utterance_seconds,
+        stream_max_queued_utterances=settings.stream_max_queued_utterances,
+        segment_pipeline=settings.segment_pipeline,
+        segment_concurrency=settings.segment_concurrency,
+        translation_batch_max_size=settings.translation_batch_max_size,
+        translation_batch_window_ms=settings.translation_batch_window_ms,
+        tts_batch_max_size=settings.tts_batch_max_size,
+        tts_batch_max_wait_ms=settings.tts_batch_max_wait_ms,
+        long_audio=LongAudioConfig(
+            enabled=settings.long_audio_enabled,
+            threshold_seconds=settings.long_audio_threshold_seconds,
+            window_seconds=settings.long_audio_window_seconds,
+            overlap_seconds=settings.long_audio_overlap_seconds,
+            concurrency=settings.long_audio_concurrency,
+            language_overrides=settings.long_audio_language_overrides
+        ),
+        audio_preprocessing=settings.audio_preprocessing,
+        preprocess_sample_rate=settings.preprocess_sample_rate,
+        preprocess_flac=settings.preprocess_flac,
+        preprocess_workers=settings.preprocess_workers,
+        vad_enabled=settings.vad_enabled,
+        vad_energy_margin_db=settings.vad_energy_margin_db,
+        vad_min_speech_ms=settings.vad_min_speech_ms,
+        vad_max_pause_ms=settings.vad_max_pause_ms,
+        vad_padding_ms=settings.vad_padding_ms,
+        batch_max_items=settings.batch_max_items,
+        batch_max_concurrency=settings.batch_max_concurrency,
+        jobs_dir=settings.jobs_dir,
+        jobs_concurrency=settings.jobs_concurrency,
+        jobs_max_attempts=settings.jobs_max_attempts,
+        jobs_retry_backoff=settings.jobs_retry_backoff,
+        jobs_ttl=settings.jobs_ttl,
+        jobs_poll_interval=settings.jobs_poll_interval,
+        admission_max_in_flight=settings.admission_max_in_flight,
+        admission_max_queue=settings.admission_max_queue,
+        admission_max_wait=settings.admission_max_wait,
+        tenants=TenantConfig(
+            requests_per_second=settings.tenant_requests_per_second,
+            request_burst=settings.tenant_request_burst,
+            audio_seconds_per_second=settings.tenant_audio_seconds_per_second,
+            audio_seconds_burst=settings.tenant_audio_seconds_burst,
+            weight=settings.tenant_weight,
+            tenant_overrides=settings.tenant_overrides,
+            api_keys=settings.tenant_api_keys,
+            max_header_tenants=settings.tenant_max_header_tenants
+        ),
+        request_timeout=settings.request_timeout,
+        stage_budget_shares=settings.stage_budget_shares,
+        hedge_budget_ratio=settings.hedge_budget_ratio,
+        hedge_budget_burst=settings.hedge_budget_burst,
         cache_enabled=settings.cache_enabled,
-        cache_ttl=settings.cache_ttl
+        cache_ttl=settings.cache_ttl,
+        cache_max_bytes=settings.cache_max_bytes,
+        asr_cache_max_bytes=settings.asr_cache_max_bytes,
+        tts_cache_dir=settings.tts_cache_dir,
+        tts_cache_max_bytes=settings.tts_cache_max_bytes
     )
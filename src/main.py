@@ -1,11 +1,13 @@
 import os
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from prometheus_client import start_http_server
 
-from src.api.endpoints import router
-from src.config import get_settings
+from src.api.endpoints import job_manager, router
+from src.clients.hedging import HedgeBudget
+from src.clients.http_pool import get_connection_pool
+from src.config import get_settings, get_pipeline_config
 from src.logging_setup import configure_logging, RequestIdMiddleware, get_logger
 from src.utils.errors import NeuralBabelError
 
@@ -23,6 +25,7 @@ app = FastAPI(
     title="NeuralBabel",
     description="Speech-to-Speech Translation Pipeline Orchestrator",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -84,6 +87,21 @@ async def startup_event():
         default_target_lang=settings.default_target_lang,
         log_level=settings.log_level
     )
+    
+    # Open the shared per-service connection pools
+    pipeline_config = get_pipeline_config(settings)
+    await get_connection_pool().start(
+        [
+            pipeline_config.asr_service,
+            pipeline_config.translation_service,
+            pipeline_config.tts_service
+        ],
+        hedge_budget=HedgeBudget(pipeline_config.hedge_budget_ratio, pipeline_config.hedge_budget_burst)
+    )
+    
+    # Start draining the asynchronous job queue
+    if job_manager is not None:
+        await job_manager.start()
 
 
 # Shutdown event
@@ -93,6 +111,13 @@ async def shutdown_event():
     Shutdown event handler.
     """
     logger.info("Shutting down NeuralBabel service")
+    
+    # Stop the job workers; unfinished jobs resume on the next start
+    if job_manager is not None:
+        await job_manager.stop()
+    
+    # Close the shared connection pools
+    await get_connection_pool().close()
 
 
 # Root endpoint
@@ -0,0 +1,267 @@
+import asyncio
+import base64
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from src.logging_setup import get_logger
+from src.orchestrator.pipeline import TranslationPipeline
+from src.utils.admission import AdmissionController
+from src.utils.cache import hash_audio
+from src.utils.disk_cache import CachedAudioFile
+from src.utils.errors import NeuralBabelError, OverloadedError, PipelineError, error_status_code
+from src.utils.metrics import BATCH_ITEMS, BATCH_ITEMS_DEDUPLICATED
+from src.utils.spool import SpooledAudio
+from src.utils.tenancy import DEFAULT_TENANT, estimate_audio_seconds
+
+logger = get_logger(__name__)
+
+
+class BatchItem:
+    """
+    One clip of a batch translation request.
+    """
+    
+    def __init__(
+        self,
+        item_id: str,
+        audio_data: Union[bytes, SpooledAudio],
+        source_lang: str,
+        target_lang: str,
+        audio_format: str = "wav",
+        voice: str = "default"
+    ):
+        """
+        Initialize the batch item.
+        
+        Args:
+            item_id: Caller-chosen identifier echoed in the result
+            audio_data: Audio data, in memory or spooled to a file
+            source_lang: Source language code
+            target_lang: Target language code
+            audio_format: Format of input/output audio
+            voice: Voice ID for synthesis
+        """
+        self.item_id = item_id
+        self.audio_data = audio_data
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self.audio_format = audio_format
+        self.voice = voice
+
+
+class BatchTranslator:
+    """
+    Runs a batch of clips through the pipeline with bounded concurrency.
+    
+    Items with the same audio and parameters are translated once and the
+    result is shared. Items that differ only in target language still share
+    their transcription through the ASR client's cache and in-flight
+    deduplication.
+    
+    Given an admission controller, each distinct clip waits for admission
+    like a single request, so a large batch is queued fairly against other
+    tenants' traffic instead of bypassing it.
+    """
+    
+    def __init__(
+        self,
+        pipeline: TranslationPipeline,
+        max_concurrency: int,
+        admission: Optional[AdmissionController] = None,
+        tenant: str = DEFAULT_TENANT,
+        weight: float = 1.0
+    ):
+        """
+        Initialize the batch translator.
+        
+        Args:
+            pipeline: Translation pipeline
+            max_concurrency: Maximum number of clips translated at once
+            admission: Admission controller each clip goes through
+            tenant: Tenant the batch belongs to
+            weight: Tenant's admission weight
+        """
+        self.pipeline = pipeline
+        self.max_concurrency = max(1, max_concurrency)
+        self.admission = admission
+        self.tenant = tenant
+        self.weight = weight
+    
+    async def run(self, items: List[BatchItem]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Translate the items, yielding one result per item as it completes.
+        
+        Failures are reported per item; they never end the batch.
+        
+        Args:
+            items: Batch items
+        
+        Yields:
+            Dict[str, Any]: Item result, with ``index``, ``id`` and ``status``
+            of "ok", "no_speech" or "error"
+        """
+        supported_pairs = self.pipeline.config.supported_language_pairs
+        
+        # Group identical items so each distinct clip is translated once
+        groups: Dict[Tuple[str, str, str, str, str], List[int]] = {}
+        for index, item in enumerate(items):
+            if (item.source_lang, item.target_lang) not in supported_pairs:
+                yield self._result(
+                    index,
+                    item,
+                    {
+                        "status": "error",
+                        "error": f"Unsupported language pair: {item.source_lang} to {item.target_lang}",
+                        "status_code": 400
+                    }
+                )
+                continue
+            
+            key = (
+                await hash_audio(item.audio_data),
+                item.source_lang,
+                item.target_lang,
+                item.audio_format,
+                item.voice
+            )
+            groups.setdefault(key, []).append(index)
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def _run_group(indices: List[int]) -> Tuple[List[int], Dict[str, Any]]:
+            async with semaphore:
+                return indices, await self._translate_item(items[indices[0]])
+        
+        tasks = [asyncio.ensure_future(_run_group(indices)) for indices in groups.values()]
+        
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                indices, outcome = await next_done
+                
+                if len(indices) > 1:
+                    BATCH_ITEMS_DEDUPLICATED.inc(len(indices) - 1)
+                
+                for index in indices:
+                    yield self._result(index, items[index], outcome)
+        finally:
+            # Stop outstanding work if the consumer goes away
+            for task in tasks:
+                task.cancel()
+    
+    async def _translate_item(self, item: BatchItem) -> Dict[str, Any]:
+        """
+        Translate one clip once admission control lets it in, and describe
+        the outcome.
+        
+        Args:
+            item: Batch item
+        
+        Returns:
+            Dict[str, Any]: Outcome fields of the item result
+        """
+        if self.admission is None:
+            return await self._run_item(item)
+        
+        try:
+            await self.admission.acquire(
+                tenant=self.tenant,
+                cost=estimate_audio_seconds(item.audio_data, item.audio_format),
+                weight=self.weight
+            )
+        except OverloadedError as e:
+            return {
+                "status": "error",
+                "error": str(e),
+                "details": e.details,
+                "status_code": error_status_code(e)
+            }
+        
+        start_time = time.monotonic()
+        try:
+            return await self._run_item(item)
+        finally:
+            self.admission.release(time.monotonic() - start_time)
+    
+    async def _run_item(self, item: BatchItem) -> Dict[str, Any]:
+        """
+        Translate one clip and describe the outcome.
+        
+        Args:
+            item: Batch item
+        
+        Returns:
+            Dict[str, Any]: Outcome fields of the item result
+        """
+        start_time = time.time()
+        
+        try:
+            audio_output = await self.pipeline.translate_speech(
+                audio_data=item.audio_data,
+                source_lang=item.source_lang,
+                target_lang=item.target_lang,
+                audio_format=item.audio_format,
+                voice=item.voice
+            )
+            
+            if isinstance(audio_output, CachedAudioFile):
+                audio_output = await asyncio.to_thread(audio_output.read)
+        except PipelineError as e:
+            return {
+                "status": "error",
+                "error": str(e),
+                "stage": e.stage,
+                "details": e.details,
+                "status_code": error_status_code(e)
+            }
+        except NeuralBabelError as e:
+            # Raised outside a stage, such as a deadline passing while the
+            # clip waits for a micro-batch
+            return {
+                "status": "error",
+                "error": str(e),
+                "details": e.details,
+                "status_code": error_status_code(e)
+            }
+        except Exception as e:
+            logger.error(
+                "Unexpected error in batch item",
+                error=str(e),
+                item_id=item.item_id,
+                exc_info=True
+            )
+            return {
+                "status": "error",
+                "error": f"Unexpected error: {str(e)}",
+                "status_code": 500
+            }
+        
+        return {
+            "status": "ok" if audio_output else "no_speech",
+            "audio": base64.b64encode(audio_output).decode("ascii"),
+            "processing_time": time.time() - start_time
+        }
+    
+    @staticmethod
+    def _result(index: int, item: BatchItem, outcome: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the result line for an item.
+        
+        Args:
+            index: Position of the item in the batch
+            item: Batch item
+            outcome: Outcome fields of the item
+        
+        Returns:
+            Dict[str, Any]: Item result
+        """
+        BATCH_ITEMS.labels(status=outcome["status"]).inc()
+        
+        return {
+            "index": index,
+            "id": item.item_id,
+            "source_lang": item.source_lang,
+            "target_lang": item.target_lang,
+            "audio_format": item.audio_format,
+            **outcome
+        }
+
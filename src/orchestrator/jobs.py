@@ -0,0 +1,394 @@
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, BinaryIO, Dict, List, Optional
+
+from src.config import PipelineConfig
+from src.logging_setup import get_logger
+from src.orchestrator.pipeline import TranslationPipeline
+from src.utils.admission import AdmissionController
+from src.utils.disk_cache import CachedAudioFile
+from src.utils.errors import OverloadedError, PipelineError, error_status_code
+from src.utils.job_store import (
+    JOB_COMPLETED,
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    JobStore
+)
+from src.utils.metrics import JOB_DURATION, JOB_OLDEST_AGE, JOB_QUEUE_DEPTH, JOB_STAGE
+from src.utils.spool import SPOOL_CHUNK_SIZE, SpooledAudio
+from src.utils.tenancy import DEFAULT_TENANT, TenantLimiter, estimate_audio_seconds
+
+logger = get_logger(__name__)
+
+
+class JobManager:
+    """
+    Runs translation jobs from a durable queue with a pool of async workers.
+    
+    Jobs are accepted into a ``JobStore`` and picked up by
+    ``jobs_concurrency`` workers. Jobs interrupted by a restart are requeued
+    when the manager starts, and jobs that fail in a way that may pass are
+    requeued with exponential backoff, up to ``jobs_max_attempts`` attempts.
+    
+    Given an admission controller, each job run waits for admission like an
+    interactive request, queued fairly by tenant, so bulk work cannot
+    starve other tenants.
+    """
+    
+    def __init__(
+        self,
+        pipeline: TranslationPipeline,
+        config: PipelineConfig,
+        admission: Optional[AdmissionController] = None,
+        tenant_limiter: Optional[TenantLimiter] = None
+    ):
+        """
+        Initialize the job manager.
+        
+        Args:
+            pipeline: Translation pipeline
+            config: Pipeline configuration; ``jobs_dir`` must be set
+            admission: Admission controller job runs go through
+            tenant_limiter: Tenant limiter giving tenants their admission weight
+        """
+        self.pipeline = pipeline
+        self.config = config
+        self.admission = admission
+        self.tenant_limiter = tenant_limiter
+        self.store = JobStore(config.jobs_dir)
+        self._wakeup = asyncio.Event()
+        self._workers: List[asyncio.Task] = []
+        self._monitor: Optional[asyncio.Task] = None
+        self._stages: Dict[str, str] = {}
+    
+    async def start(self) -> None:
+        """
+        Requeue interrupted jobs and start the workers.
+        """
+        requeued = await asyncio.to_thread(self.store.recover, self.config.jobs_max_attempts)
+        if requeued:
+            logger.info("Requeued interrupted jobs", count=requeued)
+        
+        self._workers = [
+            asyncio.create_task(self._worker(index))
+            for index in range(self.config.jobs_concurrency)
+        ]
+        self._monitor = asyncio.create_task(self._monitor_queue())
+        
+        logger.info("Started job workers", concurrency=self.config.jobs_concurrency)
+    
+    async def stop(self) -> None:
+        """
+        Stop the workers. Jobs they were running stay marked running and
+        are requeued on the next start.
+        """
+        tasks = self._workers + ([self._monitor] if self._monitor else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        
+        self._workers = []
+        self._monitor = None
+        await asyncio.to_thread(self.store.close)
+    
+    async def submit(
+        self,
+        audio_file: BinaryIO,
+        source_lang: str,
+        target_lang: str,
+        audio_format: str = "wav",
+        voice: str = "default",
+        tenant: str = DEFAULT_TENANT
+    ) -> str:
+        """
+        Store the input audio and queue a job for it.
+        
+        Args:
+            audio_file: File to read the input audio from
+            source_lang: Source language code
+            target_lang: Target language code
+            audio_format: Format of input/output audio
+            voice: Voice ID for synthesis
+            tenant: Tenant submitting the job
+        
+        Returns:
+            str: Job ID
+        """
+        job_id = self.store.new_job_id()
+        
+        def _store() -> None:
+            with open(self.store.input_path(job_id), "wb") as f:
+                for chunk in iter(lambda: audio_file.read(SPOOL_CHUNK_SIZE), b""):
+                    f.write(chunk)
+            self.store.enqueue(job_id, source_lang, target_lang, audio_format, voice, tenant)
+        
+        await asyncio.to_thread(_store)
+        self._wakeup.set()
+        
+        logger.info("Queued job", job_id=job_id, source_lang=source_lang, target_lang=target_lang)
+        
+        return job_id
+    
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a job.
+        
+        Args:
+            job_id: Job ID
+        
+        Returns:
+            Optional[Dict[str, Any]]: Job, or None if unknown
+        """
+        return await asyncio.to_thread(self.store.get, job_id)
+    
+    def output_path(self, job: Dict[str, Any]) -> str:
+        """
+        Get the path of a completed job's translated audio.
+        
+        Args:
+            job: Job
+        
+        Returns:
+            str: File path
+        """
+        return self.store.output_path(job["id"], job["audio_format"])
+    
+    async def _worker(self, index: int) -> None:
+        """
+        Run queued jobs until cancelled.
+        
+        Args:
+            index: Worker number, for logging
+        """
+        while True:
+            job = await asyncio.to_thread(self.store.claim)
+            if job is None:
+                # Sleep until a job is submitted, polling in case another
+                # process shares the queue
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.config.jobs_poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            
+            logger.info("Running job", job_id=job["id"], worker=index, attempt=job["attempts"])
+            await self._run_job(job)
+    
+    async def _run_job(self, job: Dict[str, Any]) -> None:
+        """
+        Run one job through the pipeline and record its outcome.
+        
+        Args:
+            job: Claimed job
+        """
+        job_id = job["id"]
+        
+        async def on_stage(stage: str) -> None:
+            self._set_stage(job_id, stage)
+            await asyncio.to_thread(self.store.set_stage, job_id, stage)
+        
+        try:
+            audio_file = await asyncio.to_thread(open, self.store.input_path(job_id), "rb")
+            try:
+                audio_data = SpooledAudio(audio_file)
+                async with self._admitted(job, audio_data):
+                    audio_output = await self.pipeline.translate_speech(
+                        audio_data=audio_data,
+                        source_lang=job["source_lang"],
+                        target_lang=job["target_lang"],
+                        audio_format=job["audio_format"],
+                        voice=job["voice"],
+                        on_stage=on_stage
+                    )
+            finally:
+                audio_file.close()
+            
+            output_size = await asyncio.to_thread(self._write_output, job, audio_output)
+        except PipelineError as e:
+            await self._fail(job, str(e), e.stage, e.details, error_status_code(e))
+            return
+        except Exception as e:
+            logger.error("Unexpected error in job", job_id=job_id, error=str(e), exc_info=True)
+            await self._fail(job, f"Unexpected error: {str(e)}", None, None, error_status_code(e))
+            return
+        finally:
+            self._set_stage(job_id, None)
+        
+        await asyncio.to_thread(self.store.complete, job_id, output_size)
+        self._finish(job, JOB_COMPLETED)
+        logger.info("Job completed", job_id=job_id, output_size=output_size)
+    
+    async def _fail(
+        self,
+        job: Dict[str, Any],
+        error: str,
+        stage: Optional[str],
+        details: Optional[Dict[str, Any]],
+        status_code: int
+    ) -> None:
+        """
+        Requeue a failed job with backoff, or fail it for good.
+        
+        Failures that may pass, such as timeouts, open circuit breakers,
+        overloaded services and rate limits, are retried until the job has
+        had ``jobs_max_attempts`` attempts. Other client errors fail it at
+        once.
+        
+        Args:
+            job: Failed job
+            error: Error message
+            stage: Pipeline stage that failed
+            details: Additional error details
+            status_code: HTTP status code describing the failure
+        """
+        job_id = job["id"]
+        
+        retryable = status_code >= 500 or status_code == 429
+        if retryable and job["attempts"] < self.config.jobs_max_attempts:
+            delay = self.config.jobs_retry_backoff * 2 ** (job["attempts"] - 1)
+            await asyncio.to_thread(self.store.retry, job_id, delay, error, details)
+            logger.warning(
+                "Job failed, retrying",
+                job_id=job_id,
+                error=error,
+                stage=stage,
+                attempt=job["attempts"],
+                retry_in=delay
+            )
+            return
+        
+        await asyncio.to_thread(self.store.fail, job_id, error, stage, details)
+        self._finish(job, JOB_FAILED)
+        logger.error("Job failed", job_id=job_id, error=error, stage=stage, attempts=job["attempts"])
+    
+    @asynccontextmanager
+    async def _admitted(self, job: Dict[str, Any], audio_data: SpooledAudio) -> AsyncIterator[None]:
+        """
+        Hold an admission slot while a job runs.
+        
+        A job that is shed waits and tries again rather than failing, since
+        nobody is waiting on it interactively.
+        
+        Args:
+            job: Claimed job
+            audio_data: Input audio, to size the job
+        """
+        if self.admission is None:
+            yield
+            return
+        
+        tenant = job["tenant"]
+        cost = await asyncio.to_thread(estimate_audio_seconds, audio_data, job["audio_format"])
+        weight = self.tenant_limiter.weight(tenant) if self.tenant_limiter is not None else 1.0
+        
+        while True:
+            try:
+                await self.admission.acquire(tenant=tenant, cost=cost, weight=weight)
+                break
+            except OverloadedError as e:
+                await asyncio.sleep(max(e.retry_after, self.config.jobs_poll_interval))
+        
+        start_time = time.monotonic()
+        try:
+            yield
+        finally:
+            self.admission.release(time.monotonic() - start_time)
+    
+    def _write_output(self, job: Dict[str, Any], audio_output: Any) -> int:
+        """
+        Save a job's translated audio atomically. This does blocking file
+        I/O, so run it in a worker thread from async code.
+        
+        Args:
+            job: Job
+            audio_output: Translated audio, as bytes or a cached file
+        
+        Returns:
+            int: Size of the audio in bytes
+        """
+        if isinstance(audio_output, CachedAudioFile):
+            audio_output = audio_output.read()
+        
+        path = self.output_path(job)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(audio_output)
+        os.replace(temp_path, path)
+        
+        return len(audio_output)
+    
+    def _set_stage(self, job_id: str, stage: Optional[str]) -> None:
+        """
+        Move a job between stages in the stage gauge.
+        
+        Args:
+            job_id: Job ID
+            stage: New stage, or None when the job leaves the pipeline
+        """
+        previous = self._stages.pop(job_id, None)
+        if previous is not None:
+            JOB_STAGE.labels(stage=previous).dec()
+        if stage is not None:
+            self._stages[job_id] = stage
+            JOB_STAGE.labels(stage=stage).inc()
+    
+    def _finish(self, job: Dict[str, Any], status: str) -> None:
+        """
+        Record a finished job's duration.
+        
+        Args:
+            job: Job
+            status: Final status
+        """
+        JOB_DURATION.labels(status=status).observe(time.time() - job["created_at"])
+    
+    async def _monitor_queue(self) -> None:
+        """
+        Export queue depth and backlog age, and purge expired jobs, until
+        cancelled.
+        """
+        while True:
+            try:
+                stats = await asyncio.to_thread(self.store.stats)
+                for status in (JOB_QUEUED, JOB_RUNNING, JOB_COMPLETED, JOB_FAILED):
+                    JOB_QUEUE_DEPTH.labels(status=status).set(stats["counts"].get(status, 0))
+                JOB_OLDEST_AGE.set(stats["oldest_queued_age"])
+                
+                await asyncio.to_thread(self.store.purge, self.config.jobs_ttl)
+            except Exception as e:
+                logger.warning("Failed to refresh job queue metrics", error=str(e))
+            
+            await asyncio.sleep(self.config.jobs_poll_interval)
+
+
+# Singleton instance
+_job_manager = None
+
+
+def get_job_manager(
+    pipeline: TranslationPipeline,
+    config: PipelineConfig,
+    admission: Optional[AdmissionController] = None,
+    tenant_limiter: Optional[TenantLimiter] = None
+) -> Optional[JobManager]:
+    """
+    Get the job manager instance.
+    
+    Args:
+        pipeline: Translation pipeline
+        config: Pipeline configuration
+        admission: Admission controller job runs go through
+        tenant_limiter: Tenant limiter giving tenants their admission weight
+    
+    Returns:
+        Optional[JobManager]: Job manager instance, or None if jobs are not
+        configured
+    """
+    global _job_manager
+    if _job_manager is None and config.jobs_dir:
+        _job_manager = JobManager(pipeline, config, admission, tenant_limiter)
+    return _job_manager
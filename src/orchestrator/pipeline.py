@@ -1,20 +1,36 @@
 import asyncio
+import functools
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, AsyncIterator, Awaitable, Callable, List, Optional, Tuple, Union
 
 from src.config import PipelineConfig
 from src.clients.asr_client import ASRClient
+from src.clients.circuit_breaker import get_circuit_breaker
 from src.clients.translation_client import TranslationClient
 from src.clients.tts_client import TTSClient
 from src.logging_setup import get_logger
-from src.utils.errors import PipelineError, ASRError, TranslationError, TTSError
+from src.utils.audio import concatenate_wav, streaming_wav_header, wav_frames_view
+from src.utils.audio_preprocessing import get_preprocessing_executor, normalize_for_asr
+from src.utils.cache import TranscriptionCache, TranslationCache
+from src.utils.deadline import stage_budget
+from src.utils.disk_cache import CachedAudioFile, DiskAudioCache
+from src.utils.errors import NeuralBabelError, PipelineError, ValidationError
 from src.utils.metrics import (
+    AUDIO_PREPROCESSING_BYTES_SAVED,
+    AUDIO_PREPROCESSING_LATENCY,
+    AUDIO_SILENCE_TRIMMED,
+    AUDIO_NO_SPEECH,
+    PIPELINE_CANCELLED,
     PIPELINE_STAGE_LATENCY,
     PIPELINE_COMPLETION_RATE,
     TRANSLATION_REQUESTS,
     TRANSLATION_ERRORS,
-    TRANSLATION_LATENCY
+    TRANSLATION_LATENCY,
+    TRANSLATION_TIME_TO_FIRST_BYTE
 )
+from src.utils.spool import SpooledAudio
+from src.utils.text import split_sentences
+from src.utils.vad import TrimmedAudio, trim_silence
 
 logger = get_logger(__name__)
 
@@ -32,9 +48,44 @@ class TranslationPipeline:
             config: Pipeline configuration
         """
         self.config = config
-        self.asr_client = ASRClient(config.asr_service)
-        self.translation_client = TranslationClient(config.translation_service)
-        self.tts_client = TTSClient(config.tts_service)
+        
+        # Cache repeated uploads and phrases in-process when caching is enabled
+        self.transcription_cache = None
+        self.translation_cache = None
+        if config.cache_enabled:
+            self.transcription_cache = TranscriptionCache(
+                max_bytes=config.asr_cache_max_bytes,
+                ttl=config.cache_ttl
+            )
+            self.translation_cache = TranslationCache(
+                max_bytes=config.cache_max_bytes,
+                ttl=config.cache_ttl
+            )
+        
+        # Keep synthesized audio on disk when a cache directory is configured
+        self.tts_cache = None
+        if config.cache_enabled and config.tts_cache_dir:
+            self.tts_cache = DiskAudioCache(
+                directory=config.tts_cache_dir,
+                max_bytes=config.tts_cache_max_bytes
+            )
+        
+        self.asr_client = ASRClient(
+            config.asr_service,
+            cache=self.transcription_cache,
+            long_audio=config.long_audio
+        )
+        self.translation_client = TranslationClient(
+            config.translation_service,
+            cache=self.translation_cache,
+            batch_max_size=config.translation_batch_max_size,
+            batch_window=config.translation_batch_window_ms / 1000
+        )
+        self.tts_client = TTSClient(
+            config.tts_service,
+            batch_max_size=config.tts_batch_max_size,
+            batch_max_wait=config.tts_batch_max_wait_ms / 1000
+        )
     
     async def check_services_health(self) -> Dict[str, bool]:
         """
@@ -60,196 +111,622 @@ class TranslationPipeline:
             "tts": tts_health
         }
     
-    async def translate_speech(
-        self, 
-        audio_data: bytes,
-        source_lang: str,
-        target_lang: str,
-        audio_format: str = "wav",
-        voice: str = "default"
-    ) -> bytes:
+    def circuit_breaker_states(self) -> Dict[str, str]:
         """
-        Perform end-to-end speech translation.
+        Get the circuit breaker state of all services.
+        
+        Returns:
+            Dict[str, str]: Circuit breaker state of each service with a
+            breaker enabled
+        """
+        services = {
+            "asr": self.config.asr_service,
+            "translation": self.config.translation_service,
+            "tts": self.config.tts_service
+        }
+        return {
+            name: get_circuit_breaker(service_config).state
+            for name, service_config in services.items()
+            if service_config.circuit_breaker_enabled
+        }
+    
+    async def _preprocess_audio(self, audio_data: bytes, audio_format: str) -> Tuple[bytes, str]:
+        """
+        Downmix and resample WAV audio to what the ASR model consumes, in the
+        preprocessing worker pool.
         
         Args:
             audio_data: Raw audio bytes
-            source_lang: Source language code
-            target_lang: Target language code
-            audio_format: Format of input/output audio
-            voice: Voice ID for synthesis
-            
+            audio_format: Format of the audio
+        
         Returns:
-            bytes: Translated audio as bytes
-            
-        Raises:
-            PipelineError: If the pipeline fails
+            Tuple[bytes, str]: Audio to upload and its format
         """
-        # Record start time
+        if not self.config.audio_preprocessing or audio_format != "wav":
+            return audio_data, audio_format
+        
+        # Long-audio chunking splits WAV, so only compress when it is off
+        flac = self.config.preprocess_flac and not self.config.long_audio.enabled
+        
         start_time = time.time()
+        loop = asyncio.get_running_loop()
+        try:
+            processed_audio, processed_format = await loop.run_in_executor(
+                get_preprocessing_executor(self.config.preprocess_workers),
+                functools.partial(
+                    normalize_for_asr,
+                    audio_data,
+                    target_rate=self.config.preprocess_sample_rate,
+                    flac=flac
+                )
+            )
+        except ValidationError as e:
+            # Let the ASR service deal with audio we cannot decode
+            logger.warning("Audio preprocessing skipped", error=str(e))
+            return audio_data, audio_format
         
-        # Increment request counter
-        TRANSLATION_REQUESTS.labels(
-            source_lang=source_lang,
-            target_lang=target_lang
-        ).inc()
+        AUDIO_PREPROCESSING_LATENCY.observe(time.time() - start_time)
+        AUDIO_PREPROCESSING_BYTES_SAVED.inc(max(len(audio_data) - len(processed_audio), 0))
         
+        return processed_audio, processed_format
+    
+    async def _trim_silence(self, audio_data: bytes, audio_format: str) -> Optional[TrimmedAudio]:
+        """
+        Cut silence out of WAV audio in the preprocessing worker pool.
+        
+        Args:
+            audio_data: Raw audio bytes
+            audio_format: Format of the audio
+        
+        Returns:
+            Optional[TrimmedAudio]: Trimmed audio, or None if voice activity
+            detection is off or the audio could not be decoded
+        """
+        if not self.config.vad_enabled or audio_format != "wav":
+            return None
+        
+        loop = asyncio.get_running_loop()
         try:
-            # Step 1: Speech-to-Text
+            trimmed = await loop.run_in_executor(
+                get_preprocessing_executor(self.config.preprocess_workers),
+                functools.partial(
+                    trim_silence,
+                    audio_data,
+                    energy_margin_db=self.config.vad_energy_margin_db,
+                    min_speech_ms=self.config.vad_min_speech_ms,
+                    max_pause_ms=self.config.vad_max_pause_ms,
+                    padding_ms=self.config.vad_padding_ms
+                )
+            )
+        except ValidationError as e:
+            # Let the ASR service deal with audio we cannot decode
+            logger.warning("Silence trimming skipped", error=str(e))
+            return None
+        
+        AUDIO_SILENCE_TRIMMED.inc(trimmed.original_duration - trimmed.duration)
+        
+        logger.info(
+            "Silence trimmed",
+            spans=len(trimmed.spans),
+            original_duration=trimmed.original_duration,
+            trimmed_duration=trimmed.duration
+        )
+        
+        return trimmed
+    
+    async def _transcribe(
+        self,
+        audio_data: Union[bytes, SpooledAudio],
+        language: str,
+        audio_format: str,
+        with_segments: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Run the ASR stage.
+        
+        Args:
+            audio_data: Raw audio bytes, in memory or spooled to a file
+            language: Source language code
+            audio_format: Format of the audio
+            with_segments: Whether to request the full response with segments
+        
+        Returns:
+            Dict[str, Any]: ASR result with "text" and, if requested, "segments"
+        
+        Raises:
+            PipelineError: If transcription fails
+        """
+        # Silence trimming and preprocessing work on the whole recording
+        needs_bytes = self.config.vad_enabled or self.config.audio_preprocessing
+        if isinstance(audio_data, SpooledAudio) and needs_bytes and audio_format == "wav":
+            audio_data = await audio_data.read()
+        
+        # Cut silence so ASR only processes speech
+        trimmed = await self._trim_silence(audio_data, audio_format)
+        if trimmed is not None:
+            if not trimmed.has_speech:
+                AUDIO_NO_SPEECH.inc()
+                logger.info("No speech detected, skipping ASR", source_lang=language)
+                return {"text": "", "segments": []}
+            audio_data = trimmed.audio_data
+        
+        # Shrink the upload to 16 kHz mono when preprocessing is enabled
+        audio_data, audio_format = await self._preprocess_audio(audio_data, audio_format)
+        
+        logger.info(
+            "Starting ASR",
+            source_lang=language,
+            audio_format=audio_format,
+            audio_size=len(audio_data)
+        )
+        
+        asr_start_time = time.time()
+        
+        try:
+            with stage_budget("asr", self.config.stage_budget_shares):
+                if with_segments:
+                    result = await self.asr_client.transcribe_verbose(
+                        audio_data=audio_data,
+                        language=language,
+                        audio_format=audio_format
+                    )
+                else:
+                    transcription = await self.asr_client.transcribe(
+                        audio_data=audio_data,
+                        language=language,
+                        audio_format=audio_format
+                    )
+                    result = {"text": transcription}
+            
+            # Put segment timestamps back on the original timeline
+            if trimmed is not None and "segments" in result:
+                result = trimmed.remap_result(result)
+            
+            # Record ASR latency
+            asr_latency = time.time() - asr_start_time
+            PIPELINE_STAGE_LATENCY.labels(stage="asr").observe(asr_latency)
+            
             logger.info(
-                "Starting ASR",
-                source_lang=source_lang,
+                "ASR completed",
+                source_lang=language,
+                transcription_length=len(result.get("text", "")),
+                duration=asr_latency
+            )
+        except asyncio.CancelledError:
+            # The caller went away; the later stages are never run
+            PIPELINE_CANCELLED.labels(stage="asr").inc()
+            raise
+        except NeuralBabelError as e:
+            # Record error; calls cut short by the deadline land here too
+            TRANSLATION_ERRORS.labels(
+                type="asr_error",
+                stage="asr"
+            ).inc()
+            
+            # Log error
+            logger.error(
+                "ASR failed",
+                error=str(e),
+                source_lang=language,
                 audio_format=audio_format,
                 audio_size=len(audio_data)
             )
             
-            asr_start_time = time.time()
-            
-            try:
-                transcription = await self.asr_client.transcribe(
-                    audio_data=audio_data,
-                    language=source_lang,
-                    audio_format=audio_format
-                )
-                
-                # Record ASR latency
-                asr_latency = time.time() - asr_start_time
-                PIPELINE_STAGE_LATENCY.labels(stage="asr").observe(asr_latency)
-                
-                logger.info(
-                    "ASR completed",
-                    source_lang=source_lang,
-                    transcription_length=len(transcription),
-                    duration=asr_latency
-                )
-            except ASRError as e:
-                # Record error
-                TRANSLATION_ERRORS.labels(
-                    type="asr_error",
-                    stage="asr"
-                ).inc()
-                
-                # Log error
-                logger.error(
-                    "ASR failed",
-                    error=str(e),
+            # Raise pipeline error
+            raise PipelineError(
+                f"ASR failed: {str(e)}",
+                stage="asr",
+                details=e.details,
+                status_code=getattr(e, "status_code", None)
+            )
+        
+        return result
+    
+    async def _translate(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str
+    ) -> str:
+        """
+        Run the translation stage.
+        
+        Args:
+            text: Text to translate
+            source_lang: Source language code
+            target_lang: Target language code
+        
+        Returns:
+            str: Translated text
+        
+        Raises:
+            PipelineError: If translation fails
+        """
+        logger.info(
+            "Starting translation",
+            source_lang=source_lang,
+            target_lang=target_lang,
+            text_length=len(text)
+        )
+        
+        translation_start_time = time.time()
+        
+        try:
+            with stage_budget("translation", self.config.stage_budget_shares):
+                translation = await self.translation_client.translate(
+                    text=text,
                     source_lang=source_lang,
-                    audio_format=audio_format,
-                    audio_size=len(audio_data)
-                )
-                
-                # Raise pipeline error
-                raise PipelineError(
-                    f"ASR failed: {str(e)}",
-                    stage="asr",
-                    details=e.details
+                    target_lang=target_lang
                 )
             
-            # Step 2: Text Translation
+            # Record translation latency
+            translation_latency = time.time() - translation_start_time
+            PIPELINE_STAGE_LATENCY.labels(stage="translation").observe(translation_latency)
+            
             logger.info(
-                "Starting translation",
+                "Translation completed",
                 source_lang=source_lang,
                 target_lang=target_lang,
-                text_length=len(transcription)
+                text_length=len(text),
+                translation_length=len(translation),
+                duration=translation_latency
             )
+        except asyncio.CancelledError:
+            # The caller went away; the later stages are never run
+            PIPELINE_CANCELLED.labels(stage="translation").inc()
+            raise
+        except NeuralBabelError as e:
+            # Record error; calls cut short by the deadline land here too
+            TRANSLATION_ERRORS.labels(
+                type="translation_error",
+                stage="translation"
+            ).inc()
             
-            translation_start_time = time.time()
+            # Log error
+            logger.error(
+                "Translation failed",
+                error=str(e),
+                source_lang=source_lang,
+                target_lang=target_lang,
+                text_length=len(text)
+            )
             
-            try:
-                translation = await self.translation_client.translate(
-                    text=transcription,
-                    source_lang=source_lang,
-                    target_lang=target_lang
-                )
-                
-                # Record translation latency
-                translation_latency = time.time() - translation_start_time
-                PIPELINE_STAGE_LATENCY.labels(stage="translation").observe(translation_latency)
-                
+            # Raise pipeline error
+            raise PipelineError(
+                f"Translation failed: {str(e)}",
+                stage="translation",
+                details=e.details,
+                status_code=getattr(e, "status_code", None)
+            )
+        
+        return translation
+    
+    async def _synthesize(
+        self,
+        text: str,
+        language: str,
+        voice: str,
+        audio_format: str
+    ) -> Union[bytes, CachedAudioFile]:
+        """
+        Synthesize text to speech, serving repeated requests from the audio cache.
+        
+        Args:
+            text: Text to synthesize
+            language: Language code
+            voice: Voice ID for synthesis
+            audio_format: Output audio format
+        
+        Returns:
+            Union[bytes, CachedAudioFile]: Synthesized audio, or the cached file
+            holding it
+        
+        Raises:
+            PipelineError: If synthesis fails
+        """
+        logger.info(
+            "Starting TTS",
+            target_lang=language,
+            voice=voice,
+            audio_format=audio_format,
+            text_length=len(text)
+        )
+        
+        tts_start_time = time.time()
+        
+        # Check the audio cache
+        cache_key = None
+        if self.tts_cache is not None:
+            cache_key = self.tts_cache.make_key(text, language, voice, audio_format)
+            cached_audio = await asyncio.to_thread(self.tts_cache.get, cache_key)
+            if cached_audio is not None:
                 logger.info(
-                    "Translation completed",
-                    source_lang=source_lang,
-                    target_lang=target_lang,
-                    text_length=len(transcription),
-                    translation_length=len(translation),
-                    duration=translation_latency
-                )
-            except TranslationError as e:
-                # Record error
-                TRANSLATION_ERRORS.labels(
-                    type="translation_error",
-                    stage="translation"
-                ).inc()
-                
-                # Log error
-                logger.error(
-                    "Translation failed",
-                    error=str(e),
-                    source_lang=source_lang,
-                    target_lang=target_lang,
-                    text_length=len(transcription)
+                    "TTS served from cache",
+                    target_lang=language,
+                    voice=voice,
+                    audio_format=audio_format,
+                    audio_size=cached_audio.size
                 )
-                
-                # Raise pipeline error
-                raise PipelineError(
-                    f"Translation failed: {str(e)}",
-                    stage="translation",
-                    details=e.details
+                return cached_audio
+        
+        try:
+            with stage_budget("tts", self.config.stage_budget_shares):
+                audio_output = await self.tts_client.synthesize(
+                    text=text,
+                    language=language,
+                    voice=voice,
+                    audio_format=audio_format
                 )
             
-            # Step 3: Text-to-Speech
+            # Record TTS latency
+            tts_latency = time.time() - tts_start_time
+            PIPELINE_STAGE_LATENCY.labels(stage="tts").observe(tts_latency)
+            
             logger.info(
-                "Starting TTS",
-                target_lang=target_lang,
+                "TTS completed",
+                target_lang=language,
                 voice=voice,
                 audio_format=audio_format,
-                text_length=len(translation)
+                text_length=len(text),
+                audio_size=len(audio_output),
+                duration=tts_latency
             )
+        except asyncio.CancelledError:
+            # The caller went away; the later stages are never run
+            PIPELINE_CANCELLED.labels(stage="tts").inc()
+            raise
+        except NeuralBabelError as e:
+            # Record error; calls cut short by the deadline land here too
+            TRANSLATION_ERRORS.labels(
+                type="tts_error",
+                stage="tts"
+            ).inc()
             
-            tts_start_time = time.time()
+            # Log error
+            logger.error(
+                "TTS failed",
+                error=str(e),
+                target_lang=language,
+                voice=voice,
+                audio_format=audio_format,
+                text_length=len(text)
+            )
             
+            # Raise pipeline error
+            raise PipelineError(
+                f"TTS failed: {str(e)}",
+                stage="tts",
+                details=e.details,
+                status_code=getattr(e, "status_code", None)
+            )
+        
+        # Store the audio for next time; a failed write only costs the cache entry
+        if cache_key is not None:
             try:
-                audio_output = await self.tts_client.synthesize(
+                await asyncio.to_thread(self.tts_cache.put, cache_key, audio_format, audio_output)
+            except OSError as e:
+                logger.warning(
+                    "Failed to write TTS audio cache",
+                    error=str(e),
+                    directory=self.tts_cache.directory
+                )
+        
+        return audio_output
+    
+    async def _synthesize_bytes(
+        self,
+        text: str,
+        language: str,
+        voice: str,
+        audio_format: str
+    ) -> bytes:
+        """
+        Synthesize text to speech, always returning the audio in memory.
+        
+        Args:
+            text: Text to synthesize
+            language: Language code
+            voice: Voice ID for synthesis
+            audio_format: Output audio format
+        
+        Returns:
+            bytes: Synthesized audio
+        
+        Raises:
+            PipelineError: If synthesis fails
+        """
+        audio = await self._synthesize(
+            text=text,
+            language=language,
+            voice=voice,
+            audio_format=audio_format
+        )
+        
+        if isinstance(audio, CachedAudioFile):
+            return await asyncio.to_thread(audio.read)
+        
+        return audio
+    
+    async def _translate_segments(
+        self,
+        segments: List[Dict[str, Any]],
+        source_lang: str,
+        target_lang: str,
+        voice: str,
+        on_stage: Optional[Callable[[str], Awaitable[None]]] = None
+    ) -> bytes:
+        """
+        Translate and synthesize ASR segments concurrently and stitch the
+        audio back together in order.
+        
+        Each segment runs its own translation -> TTS chain as soon as it is
+        scheduled, bounded by ``segment_concurrency``, so end-to-end latency
+        approaches the longest chain rather than the sum of all of them.
+        The "tts" stage is reported once, when the first segment reaches it.
+        
+        Args:
+            segments: ASR segments with "text", "start" and "end"
+            source_lang: Source language code
+            target_lang: Target language code
+            voice: Voice ID for synthesis
+            on_stage: Progress callback
+        
+        Returns:
+            bytes: Stitched WAV audio
+        
+        Raises:
+            PipelineError: If any segment fails
+        """
+        semaphore = asyncio.Semaphore(self.config.segment_concurrency)
+        tts_reported = False
+        
+        async def _run_segment(segment: Dict[str, Any]) -> bytes:
+            nonlocal tts_reported
+            async with semaphore:
+                translation = await self._translate(
+                    text=segment["text"].strip(),
+                    source_lang=source_lang,
+                    target_lang=target_lang
+                )
+                if not tts_reported:
+                    tts_reported = True
+                    await self._report_stage(on_stage, "tts")
+                return await self._synthesize_bytes(
                     text=translation,
                     language=target_lang,
                     voice=voice,
-                    audio_format=audio_format
+                    audio_format="wav"
                 )
-                
-                # Record TTS latency
-                tts_latency = time.time() - tts_start_time
-                PIPELINE_STAGE_LATENCY.labels(stage="tts").observe(tts_latency)
-                
+        
+        tasks = [
+            asyncio.ensure_future(_run_segment(segment))
+            for segment in segments
+            if segment.get("text", "").strip()
+        ]
+        
+        try:
+            chunks = await asyncio.gather(*tasks)
+        except BaseException:
+            # Stop the remaining segment chains
+            for task in tasks:
+                task.cancel()
+            raise
+        
+        logger.info(
+            "Segment pipeline completed",
+            source_lang=source_lang,
+            target_lang=target_lang,
+            segments=len(chunks)
+        )
+        
+        try:
+            return concatenate_wav(chunks)
+        except ValidationError as e:
+            raise PipelineError(
+                f"Failed to stitch segment audio: {str(e)}",
+                stage="tts",
+                details=e.details
+            )
+    
+    @staticmethod
+    async def _report_stage(on_stage: Optional[Callable[[str], Awaitable[None]]], stage: str) -> None:
+        """
+        Report progress to the caller, if it asked for it.
+        
+        Args:
+            on_stage: Progress callback
+            stage: Stage being entered
+        """
+        if on_stage is not None:
+            await on_stage(stage)
+    
+    async def translate_speech(
+        self, 
+        audio_data: Union[bytes, SpooledAudio],
+        source_lang: str,
+        target_lang: str,
+        audio_format: str = "wav",
+        voice: str = "default",
+        on_stage: Optional[Callable[[str], Awaitable[None]]] = None
+    ) -> Union[bytes, CachedAudioFile]:
+        """
+        Perform end-to-end speech translation.
+        
+        Args:
+            audio_data: Raw audio bytes, in memory or spooled to a file
+            source_lang: Source language code
+            target_lang: Target language code
+            audio_format: Format of input/output audio
+            voice: Voice ID for synthesis
+            on_stage: Awaited with each stage name ("asr", "translation",
+                "tts") as the pipeline reaches it, to report progress
+        
+        Returns:
+            Union[bytes, CachedAudioFile]: Translated audio as bytes, or the
+            cached file holding it. The bytes are the TTS response body itself;
+            nothing in the pipeline mutates or copies them, and ownership
+            passes to the caller
+        
+        Raises:
+            PipelineError: If the pipeline fails
+        """
+        # Record start time
+        start_time = time.time()
+        
+        # Increment request counter
+        TRANSLATION_REQUESTS.labels(
+            source_lang=source_lang,
+            target_lang=target_lang
+        ).inc()
+        
+        try:
+            # Segment mode needs the ASR segments and stitchable WAV output
+            use_segments = self.config.segment_pipeline and audio_format == "wav"
+            
+            # Step 1: Speech-to-Text
+            await self._report_stage(on_stage, "asr")
+            asr_result = await self._transcribe(
+                audio_data=audio_data,
+                language=source_lang,
+                audio_format=audio_format,
+                with_segments=use_segments
+            )
+            
+            segments = asr_result.get("segments") or []
+            if not asr_result.get("text", "").strip():
+                # Nothing was said, so there is nothing to translate or speak
                 logger.info(
-                    "TTS completed",
-                    target_lang=target_lang,
-                    voice=voice,
-                    audio_format=audio_format,
-                    text_length=len(translation),
-                    audio_size=len(audio_output),
-                    duration=tts_latency
+                    "No speech in input, skipping translation and TTS",
+                    source_lang=source_lang,
+                    target_lang=target_lang
                 )
-            except TTSError as e:
-                # Record error
-                TRANSLATION_ERRORS.labels(
-                    type="tts_error",
-                    stage="tts"
-                ).inc()
-                
-                # Log error
-                logger.error(
-                    "TTS failed",
-                    error=str(e),
+                audio_output = b""
+            elif use_segments and len(segments) > 1:
+                # Steps 2 and 3 per segment, pipelined
+                await self._report_stage(on_stage, "translation")
+                audio_output = await self._translate_segments(
+                    segments=segments,
+                    source_lang=source_lang,
                     target_lang=target_lang,
                     voice=voice,
-                    audio_format=audio_format,
-                    text_length=len(translation)
+                    on_stage=on_stage
+                )
+            else:
+                # Step 2: Text Translation
+                await self._report_stage(on_stage, "translation")
+                translation = await self._translate(
+                    text=asr_result.get("text", ""),
+                    source_lang=source_lang,
+                    target_lang=target_lang
                 )
                 
-                # Raise pipeline error
-                raise PipelineError(
-                    f"TTS failed: {str(e)}",
-                    stage="tts",
-                    details=e.details
+                # Step 3: Text-to-Speech
+                await self._report_stage(on_stage, "tts")
+                audio_output = await self._synthesize(
+                    text=translation,
+                    language=target_lang,
+                    voice=voice,
+                    audio_format=audio_format
                 )
             
             # Record total latency
@@ -275,12 +752,12 @@ class TranslationPipeline:
             )
             
             return audio_output
-            
+        
         except PipelineError:
             # Re-raise pipeline errors
             PIPELINE_COMPLETION_RATE.labels(status="failure").inc()
             raise
-            
+        
         except Exception as e:
             # Record error
             TRANSLATION_ERRORS.labels(
@@ -308,6 +785,269 @@ class TranslationPipeline:
                 stage="pipeline",
                 details={"error": str(e)}
             )
+    
+    async def translate_speech_stream(
+        self, 
+        audio_data: Union[bytes, SpooledAudio],
+        source_lang: str,
+        target_lang: str,
+        audio_format: str = "wav",
+        voice: str = "default"
+    ) -> AsyncIterator[bytes]:
+        """
+        Perform speech translation, streaming the output sentence by sentence.
+        
+        ASR and translation run before this returns, so their failures raise
+        here. The returned iterator then synthesizes the translated sentences
+        concurrently and yields their audio in order, so the first sentence is
+        sent while later ones are still being produced. WAV output is sent
+        with a streaming header followed by raw PCM frames; other formats are
+        sent as back-to-back encoded chunks.
+        
+        Args:
+            audio_data: Raw audio bytes, in memory or spooled to a file
+            source_lang: Source language code
+            target_lang: Target language code
+            audio_format: Format of input/output audio
+            voice: Voice ID for synthesis
+        
+        Returns:
+            AsyncIterator[bytes]: Translated audio chunks
+        
+        Raises:
+            PipelineError: If ASR or translation fails
+        """
+        # Record start time
+        start_time = time.time()
+        
+        # Increment request counter
+        TRANSLATION_REQUESTS.labels(
+            source_lang=source_lang,
+            target_lang=target_lang
+        ).inc()
+        
+        try:
+            # Step 1: Speech-to-Text
+            asr_result = await self._transcribe(
+                audio_data=audio_data,
+                language=source_lang,
+                audio_format=audio_format
+            )
+            
+            # Step 2: Text Translation, unless nothing was said
+            translation = ""
+            if asr_result.get("text", "").strip():
+                translation = await self._translate(
+                    text=asr_result.get("text", ""),
+                    source_lang=source_lang,
+                    target_lang=target_lang
+                )
+        except PipelineError:
+            PIPELINE_COMPLETION_RATE.labels(status="failure").inc()
+            raise
+        
+        # Step 3: Text-to-Speech, streamed per sentence
+        sentences = []
+        if translation:
+            sentences = split_sentences(translation) or [translation]
+        
+        return self._stream_sentences(
+            sentences=sentences,
+            source_lang=source_lang,
+            target_lang=target_lang,
+            audio_format=audio_format,
+            voice=voice,
+            start_time=start_time
+        )
+    
+    async def _stream_sentences(
+        self,
+        sentences: List[str],
+        source_lang: str,
+        target_lang: str,
+        audio_format: str,
+        voice: str,
+        start_time: float
+    ) -> AsyncIterator[bytes]:
+        """
+        Synthesize sentences concurrently and yield their audio in order.
+        
+        Args:
+            sentences: Translated sentences
+            source_lang: Source language code
+            target_lang: Target language code
+            audio_format: Output audio format
+            voice: Voice ID for synthesis
+            start_time: Time the request started
+        
+        Yields:
+            bytes: Audio chunks
+        """
+        semaphore = asyncio.Semaphore(self.config.segment_concurrency)
+        
+        async def _run_sentence(sentence: str) -> bytes:
+            async with semaphore:
+                return await self._synthesize_bytes(
+                    text=sentence,
+                    language=target_lang,
+                    voice=voice,
+                    audio_format=audio_format
+                )
+        
+        tasks = [asyncio.ensure_future(_run_sentence(sentence)) for sentence in sentences]
+        wav_format = None
+        header = b""
+        output_size = 0
+        
+        try:
+            for index, task in enumerate(tasks):
+                audio = await task
+                
+                if audio_format == "wav":
+                    # Strip each sentence's header; one streaming header leads the output
+                    try:
+                        sentence_format, frames = wav_frames_view(audio)
+                    except ValidationError as e:
+                        raise PipelineError(str(e), stage="tts", details=e.details)
+                    
+                    # ASGI bodies must be bytes, so the frames are copied
+                    # once here and not again on the way out
+                    chunk = frames.tobytes()
+                    
+                    if wav_format is None:
+                        wav_format = sentence_format
+                        header = streaming_wav_header(wav_format)
+                    elif sentence_format != wav_format:
+                        raise PipelineError(
+                            "TTS returned sentences with different audio formats",
+                            stage="tts",
+                            details={"expected": wav_format, "actual": sentence_format}
+                        )
+                else:
+                    chunk = audio
+                
+                if index == 0:
+                    TRANSLATION_TIME_TO_FIRST_BYTE.labels(
+                        source_lang=source_lang,
+                        target_lang=target_lang
+                    ).observe(time.time() - start_time)
+                
+                # Send the header on its own rather than copying it onto the frames
+                if header:
+                    output_size += len(header)
+                    yield header
+                    header = b""
+                
+                output_size += len(chunk)
+                yield chunk
+            
+            # Record total latency
+            total_latency = time.time() - start_time
+            TRANSLATION_LATENCY.labels(
+                source_lang=source_lang,
+                target_lang=target_lang
+            ).observe(total_latency)
+            
+            # Record success
+            PIPELINE_COMPLETION_RATE.labels(status="success").inc()
+            
+            logger.info(
+                "Streaming translation completed successfully",
+                source_lang=source_lang,
+                target_lang=target_lang,
+                audio_format=audio_format,
+                voice=voice,
+                sentences=len(sentences),
+                output_audio_size=output_size,
+                total_duration=total_latency
+            )
+        except PipelineError as e:
+            PIPELINE_COMPLETION_RATE.labels(status="failure").inc()
+            logger.error(
+                "Streaming translation failed",
+                error=str(e),
+                stage=e.stage,
+                source_lang=source_lang,
+                target_lang=target_lang
+            )
+            raise
+        finally:
+            # Stop synthesizing sentences nobody will receive
+            for task in tasks:
+                task.cancel()
+    
+    async def translate_utterance(
+        self,
+        audio_data: bytes,
+        source_lang: str,
+        target_lang: str,
+        voice: str = "default"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Translate one utterance of a live stream, yielding each stage's
+        result as soon as it is available.
+        
+        Args:
+            audio_data: Utterance as WAV audio
+            source_lang: Source language code
+            target_lang: Target language code
+            voice: Voice ID for synthesis
+        
+        Yields:
+            Dict[str, Any]: A "transcript" event, then "translation" and
+            "audio" events unless the utterance had no recognizable speech
+        
+        Raises:
+            PipelineError: If any stage fails
+        """
+        # Record start time
+        start_time = time.time()
+        
+        # Increment request counter
+        TRANSLATION_REQUESTS.labels(
+            source_lang=source_lang,
+            target_lang=target_lang
+        ).inc()
+        
+        try:
+            # Step 1: Speech-to-Text
+            asr_result = await self._transcribe(
+                audio_data=audio_data,
+                language=source_lang,
+                audio_format="wav"
+            )
+            transcript = asr_result.get("text", "").strip()
+            yield {"type": "transcript", "text": transcript}
+            
+            if transcript:
+                # Step 2: Text Translation
+                translation = await self._translate(
+                    text=transcript,
+                    source_lang=source_lang,
+                    target_lang=target_lang
+                )
+                yield {"type": "translation", "text": translation}
+                
+                # Step 3: Text-to-Speech
+                audio_output = await self._synthesize_bytes(
+                    text=translation,
+                    language=target_lang,
+                    voice=voice,
+                    audio_format="wav"
+                )
+                yield {"type": "audio", "audio": audio_output}
+            
+            # Record total latency
+            TRANSLATION_LATENCY.labels(
+                source_lang=source_lang,
+                target_lang=target_lang
+            ).observe(time.time() - start_time)
+            
+            # Record success
+            PIPELINE_COMPLETION_RATE.labels(status="success").inc()
+        except PipelineError:
+            PIPELINE_COMPLETION_RATE.labels(status="failure").inc()
+            raise
 
 
 # Singleton instance
@@ -320,7 +1060,7 @@ def get_pipeline(config: PipelineConfig) -> TranslationPipeline:
     
     Args:
         config: Pipeline configuration
-        
+    
     Returns:
         TranslationPipeline: Translation pipeline instance
     """
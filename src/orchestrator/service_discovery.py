@@ -78,7 +78,7 @@ class ServiceDiscovery:
         Returns:
             bool: True if the service is healthy, False otherwise
         """
-        import httpx
+        from src.clients.http_pool import get_connection_pool
         
         # Get service URL
         service_url = self.get_service_url(service_config)
@@ -87,9 +87,9 @@ class ServiceDiscovery:
         health_url = f"{service_url}/health"
         
         try:
-            # Make request
-            async with httpx.AsyncClient() as client:
-                response = await client.get(health_url, timeout=2.0)
+            # Make request over the service's pooled client
+            client = get_connection_pool().get_client(service_config)
+            response = await client.get(health_url, timeout=2.0)
             
             # Check response
             is_healthy = response.status_code == 200
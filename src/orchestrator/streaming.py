@@ -0,0 +1,210 @@
+from typing import List, Optional
+
+import numpy as np
+
+from src.logging_setup import get_logger
+from src.utils.errors import ValidationError
+
+logger = get_logger(__name__)
+
+# Full-scale amplitude of 16-bit PCM
+PCM16_FULL_SCALE = 32768.0
+
+# Sample rates accepted for live input, the ones Opus can decode to
+SUPPORTED_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)
+
+
+class UtteranceSegmenter:
+    """
+    Cuts a live stream of 16-bit mono PCM into utterances.
+    
+    Audio is analysed in short frames; a frame counts as speech when its RMS
+    level is above ``silence_threshold_db`` (dBFS). An utterance ends after
+    ``min_silence_ms`` of consecutive silence, or is cut once it reaches
+    ``max_utterance_seconds``.
+    """
+    
+    def __init__(
+        self,
+        sample_rate: int,
+        frame_ms: int = 30,
+        silence_threshold_db: float = -40.0,
+        min_silence_ms: int = 600,
+        min_speech_ms: int = 200,
+        max_utterance_seconds: float = 15.0,
+        pre_roll_ms: int = 150
+    ):
+        """
+        Initialize the segmenter.
+        
+        Args:
+            sample_rate: Sample rate of the incoming PCM
+            frame_ms: Analysis frame length in milliseconds
+            silence_threshold_db: RMS level in dBFS below which a frame is silence
+            min_silence_ms: Silence that ends an utterance
+            min_speech_ms: Speech shorter than this is discarded as noise
+            max_utterance_seconds: Maximum utterance length before a forced cut
+            pre_roll_ms: Audio kept from before speech onset
+        """
+        self.sample_rate = sample_rate
+        self.frame_samples = max(1, sample_rate * frame_ms // 1000)
+        self.frame_bytes = self.frame_samples * 2
+        self.threshold = PCM16_FULL_SCALE * 10 ** (silence_threshold_db / 20)
+        self.min_silence_frames = max(1, min_silence_ms // frame_ms)
+        self.min_speech_frames = max(1, min_speech_ms // frame_ms)
+        self.max_utterance_frames = max(1, int(max_utterance_seconds * 1000) // frame_ms)
+        self.pre_roll_frames = pre_roll_ms // frame_ms
+        
+        self._pending = b""
+        self._pre_roll: List[bytes] = []
+        self._utterance: List[bytes] = []
+        self._speech_frames = 0
+        self._silence_run = 0
+    
+    def feed(self, pcm: bytes) -> List[bytes]:
+        """
+        Add PCM audio and collect any utterances it completes.
+        
+        Args:
+            pcm: 16-bit little-endian mono PCM
+        
+        Returns:
+            List[bytes]: Completed utterances as PCM
+        """
+        data = self._pending + pcm
+        frame_count = len(data) // self.frame_bytes
+        self._pending = data[frame_count * self.frame_bytes:]
+        
+        if frame_count == 0:
+            return []
+        
+        # Frame levels for the whole chunk at once
+        samples = np.frombuffer(data, dtype="<i2", count=frame_count * self.frame_samples)
+        frames = samples.reshape(frame_count, self.frame_samples).astype(np.float32)
+        rms = np.sqrt(np.mean(frames * frames, axis=1))
+        is_speech = rms >= self.threshold
+        
+        utterances = []
+        for index in range(frame_count):
+            frame = data[index * self.frame_bytes:(index + 1) * self.frame_bytes]
+            utterance = self._process_frame(frame, bool(is_speech[index]))
+            if utterance is not None:
+                utterances.append(utterance)
+        
+        return utterances
+    
+    def flush(self) -> Optional[bytes]:
+        """
+        End the stream and return the utterance in progress, if any.
+        
+        Returns:
+            Optional[bytes]: Final utterance as PCM
+        """
+        utterance = self._finish()
+        self._pending = b""
+        self._pre_roll = []
+        return utterance
+    
+    def _process_frame(self, frame: bytes, is_speech: bool) -> Optional[bytes]:
+        """
+        Advance the segmenter by one frame.
+        
+        Args:
+            frame: PCM frame
+            is_speech: Whether the frame is above the silence threshold
+        
+        Returns:
+            Optional[bytes]: Completed utterance, if this frame ends one
+        """
+        if not self._utterance:
+            if not is_speech:
+                # Keep a little audio from before speech onset
+                self._pre_roll.append(frame)
+                if len(self._pre_roll) > self.pre_roll_frames:
+                    self._pre_roll.pop(0)
+                return None
+            
+            # Speech onset
+            self._utterance = self._pre_roll + [frame]
+            self._pre_roll = []
+            self._speech_frames = 1
+            self._silence_run = 0
+            return None
+        
+        self._utterance.append(frame)
+        if is_speech:
+            self._speech_frames += 1
+            self._silence_run = 0
+        else:
+            self._silence_run += 1
+        
+        if self._silence_run >= self.min_silence_frames or len(self._utterance) >= self.max_utterance_frames:
+            return self._finish()
+        
+        return None
+    
+    def _finish(self) -> Optional[bytes]:
+        """
+        Close the utterance in progress.
+        
+        Returns:
+            Optional[bytes]: Utterance PCM, or None if it was too short to be speech
+        """
+        frames = self._utterance
+        speech_frames = self._speech_frames
+        self._utterance = []
+        self._speech_frames = 0
+        self._silence_run = 0
+        
+        if speech_frames < self.min_speech_frames:
+            return None
+        
+        return b"".join(frames)
+
+
+class OpusDecoder:
+    """
+    Decodes Opus packets to 16-bit mono PCM.
+    
+    Requires the optional ``opuslib`` package.
+    """
+    
+    # Largest Opus frame is 120 ms
+    MAX_FRAME_MS = 120
+    
+    def __init__(self, sample_rate: int):
+        """
+        Initialize the decoder.
+        
+        Args:
+            sample_rate: Output sample rate (8000, 12000, 16000, 24000 or 48000)
+        
+        Raises:
+            ValidationError: If opuslib is not installed
+        """
+        try:
+            import opuslib
+        except ImportError:
+            raise ValidationError("Opus input requires the opuslib package")
+        
+        self.sample_rate = sample_rate
+        self._decoder = opuslib.Decoder(sample_rate, 1)
+    
+    def decode(self, packet: bytes) -> bytes:
+        """
+        Decode one Opus packet.
+        
+        Args:
+            packet: Opus packet
+        
+        Returns:
+            bytes: 16-bit mono PCM
+        
+        Raises:
+            ValidationError: If the packet cannot be decoded
+        """
+        frame_size = self.sample_rate * self.MAX_FRAME_MS // 1000
+        try:
+            return self._decoder.decode(packet, frame_size)
+        except Exception as e:
+            raise ValidationError(f"Invalid Opus packet: {str(e)}")
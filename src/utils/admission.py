@@ -0,0 +1,283 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from src.logging_setup import get_logger
+from src.utils import deadline
+from src.utils.errors import OverloadedError
+from src.utils.metrics import (
+    ADMISSION_IN_FLIGHT,
+    ADMISSION_QUEUED,
+    ADMISSION_QUEUE_WAIT,
+    ADMISSION_SHED,
+    TENANT_QUEUE_WAIT
+)
+
+logger = get_logger(__name__)
+
+# Weight of the newest sample in the service time average
+SERVICE_TIME_EWMA_WEIGHT = 0.2
+
+# Credit a tenant of weight 1 earns per fair queuing round
+FAIR_QUEUE_QUANTUM = 10.0
+
+# Floor on tenant weights, so every tenant eventually earns credit
+MIN_TENANT_WEIGHT = 0.01
+
+
+class AdmissionController:
+    """
+    Limits concurrent requests and queues a bounded number of the rest.
+    
+    Requests beyond ``max_in_flight`` wait in per-tenant FIFO queues, and
+    freed slots go to tenants by deficit round robin: each round a tenant
+    earns ``FAIR_QUEUE_QUANTUM`` times its weight in credit, and a request
+    is admitted once its tenant has credit for its cost. A tenant with many
+    queued requests therefore cannot starve one with few.
+    
+    A request is shed with ``OverloadedError`` straight away if the queue is
+    full or its estimated wait exceeds ``max_wait``, and after ``max_wait``
+    if it is still queued. A request deadline shorter than ``max_wait``
+    takes its place. The wait estimate comes from a moving average of how
+    long admitted requests take.
+    """
+    
+    def __init__(self, max_in_flight: int, max_queue: int, max_wait: float):
+        """
+        Initialize the admission controller.
+        
+        Args:
+            max_in_flight: Maximum number of requests processed at once
+            max_queue: Maximum number of requests waiting for admission
+            max_wait: Longest time in seconds a request may wait for admission
+        """
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self._in_flight = 0
+        self._queued = 0
+        self._queues: Dict[str, Deque[Tuple[asyncio.Future, float]]] = {}
+        self._active: Deque[str] = deque()
+        self._deficits: Dict[str, float] = {}
+        self._weights: Dict[str, float] = {}
+        self._service_time: Optional[float] = None
+    
+    @property
+    def in_flight(self) -> int:
+        """
+        Number of admitted requests.
+        """
+        return self._in_flight
+    
+    @property
+    def queued(self) -> int:
+        """
+        Number of requests waiting for admission.
+        """
+        return self._queued
+    
+    def estimated_wait(self, position: int) -> float:
+        """
+        Estimate how long a request at a queue position will wait.
+        
+        Args:
+            position: 1-based position in the queue
+        
+        Returns:
+            float: Estimated wait in seconds
+        """
+        if self._service_time is None:
+            return 0.0
+        return math.ceil(position / self.max_in_flight) * self._service_time
+    
+    async def acquire(self, tenant: str = "default", cost: float = 1.0, weight: float = 1.0) -> None:
+        """
+        Wait for admission.
+        
+        Args:
+            tenant: Tenant the request belongs to
+            cost: Size of the request, in the unit fair queuing shares out
+            weight: Tenant's share relative to other tenants
+        
+        Raises:
+            OverloadedError: If the request is shed
+        """
+        if self._in_flight < self.max_in_flight and not self._queued:
+            self._admit()
+            TENANT_QUEUE_WAIT.labels(tenant=tenant).observe(0)
+            return
+        
+        position = self._queued + 1
+        if position > self.max_queue:
+            self._shed("queue_full", position)
+        
+        # Never wait past the request's own deadline
+        max_wait = self.max_wait
+        left = deadline.remaining()
+        if left is not None:
+            max_wait = min(max_wait, left)
+        
+        if self.estimated_wait(position) > max_wait:
+            self._shed("deadline", position)
+        
+        waiter = asyncio.get_running_loop().create_future()
+        self._enqueue(tenant, waiter, cost, weight)
+        start_time = time.monotonic()
+        
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), max_wait)
+        except asyncio.TimeoutError:
+            self._abandon(tenant, waiter)
+            self._shed("timeout", self._queued + 1)
+        except asyncio.CancelledError:
+            self._abandon(tenant, waiter)
+            raise
+        finally:
+            wait = time.monotonic() - start_time
+            ADMISSION_QUEUE_WAIT.observe(wait)
+            TENANT_QUEUE_WAIT.labels(tenant=tenant).observe(wait)
+    
+    def release(self, service_time: Optional[float] = None) -> None:
+        """
+        Give up an admission slot, handing it to the next queued request.
+        
+        Args:
+            service_time: How long the request held its slot, to refine the
+                wait estimate
+        """
+        if service_time is not None:
+            if self._service_time is None:
+                self._service_time = service_time
+            else:
+                self._service_time += SERVICE_TIME_EWMA_WEIGHT * (service_time - self._service_time)
+        
+        waiter = self._next_waiter()
+        if waiter is not None:
+            # The slot passes straight to the waiter
+            waiter.set_result(None)
+            return
+        
+        self._in_flight -= 1
+        ADMISSION_IN_FLIGHT.set(self._in_flight)
+    
+    def _admit(self) -> None:
+        """
+        Take a free slot.
+        """
+        self._in_flight += 1
+        ADMISSION_IN_FLIGHT.set(self._in_flight)
+    
+    def _enqueue(self, tenant: str, waiter: asyncio.Future, cost: float, weight: float) -> None:
+        """
+        Add a waiter to its tenant's queue.
+        
+        Args:
+            tenant: Tenant ID
+            waiter: Waiter future
+            cost: Cost of the request
+            weight: Tenant's weight
+        """
+        queue = self._queues.get(tenant)
+        if queue is None:
+            queue = self._queues[tenant] = deque()
+            self._active.append(tenant)
+            self._deficits[tenant] = 0.0
+        
+        queue.append((waiter, cost))
+        self._weights[tenant] = max(weight, MIN_TENANT_WEIGHT)
+        self._queued += 1
+        ADMISSION_QUEUED.set(self._queued)
+    
+    def _next_waiter(self) -> Optional[asyncio.Future]:
+        """
+        Pick the next waiter by deficit round robin and remove it.
+        
+        Returns:
+            Optional[asyncio.Future]: Waiter, or None if nobody is waiting
+        """
+        while self._active:
+            tenant = self._active[0]
+            queue = self._queues[tenant]
+            waiter, cost = queue[0]
+            
+            if self._deficits[tenant] < cost:
+                # Not enough credit yet: top up and move to the next tenant
+                self._deficits[tenant] += FAIR_QUEUE_QUANTUM * self._weights[tenant]
+                self._active.rotate(-1)
+                continue
+            
+            self._deficits[tenant] -= cost
+            self._remove(tenant, waiter)
+            return waiter
+        
+        return None
+    
+    def _remove(self, tenant: str, waiter: asyncio.Future) -> None:
+        """
+        Take a waiter out of its tenant's queue.
+        
+        Args:
+            tenant: Tenant ID
+            waiter: Waiter future
+        """
+        queue = self._queues[tenant]
+        for index, (queued_waiter, _) in enumerate(queue):
+            if queued_waiter is waiter:
+                del queue[index]
+                break
+        
+        # Idle tenants leave the round and lose their credit
+        if not queue:
+            del self._queues[tenant]
+            del self._deficits[tenant]
+            del self._weights[tenant]
+            self._active.remove(tenant)
+        
+        self._queued -= 1
+        ADMISSION_QUEUED.set(self._queued)
+    
+    def _abandon(self, tenant: str, waiter: asyncio.Future) -> None:
+        """
+        Withdraw a waiter that gave up, passing on a slot it was handed.
+        
+        Args:
+            tenant: Tenant ID
+            waiter: Waiter future
+        """
+        if waiter.done():
+            # Handed a slot just as it gave up
+            self.release()
+            return
+        
+        waiter.cancel()
+        self._remove(tenant, waiter)
+    
+    def _shed(self, reason: str, position: int) -> None:
+        """
+        Reject a request.
+        
+        Args:
+            reason: Why the request is shed
+            position: Queue position the request would have had
+        
+        Raises:
+            OverloadedError: Always
+        """
+        ADMISSION_SHED.labels(reason=reason).inc()
+        
+        retry_after = max(1.0, self.estimated_wait(position))
+        logger.warning(
+            "Shedding request",
+            reason=reason,
+            in_flight=self._in_flight,
+            queued=self._queued,
+            retry_after=retry_after
+        )
+        
+        raise OverloadedError(
+            "Service is overloaded",
+            retry_after=retry_after,
+            details={"reason": reason}
+        )
@@ -0,0 +1,214 @@
+import io
+import struct
+import wave
+from typing import List, Tuple
+
+from src.utils.errors import ValidationError
+
+
+# (channels, sample width in bytes, frame rate)
+WavFormat = Tuple[int, int, int]
+
+
+def read_wav(audio_data: bytes) -> Tuple[WavFormat, bytes]:
+    """
+    Split WAV audio into its format and raw PCM frames.
+    
+    Args:
+        audio_data: WAV audio
+    
+    Returns:
+        Tuple[WavFormat, bytes]: Format and PCM frames
+    
+    Raises:
+        ValidationError: If the audio is not valid PCM WAV
+    """
+    try:
+        with wave.open(io.BytesIO(audio_data), "rb") as reader:
+            wav_format = (reader.getnchannels(), reader.getsampwidth(), reader.getframerate())
+            frames = reader.readframes(reader.getnframes())
+    except (wave.Error, EOFError) as e:
+        raise ValidationError(f"Invalid WAV audio: {str(e)}")
+    
+    return wav_format, frames
+
+
+def write_wav(wav_format: WavFormat, frames: bytes) -> bytes:
+    """
+    Wrap raw PCM frames in a WAV container.
+    
+    Args:
+        wav_format: Format of the frames
+        frames: PCM frames
+    
+    Returns:
+        bytes: WAV audio
+    """
+    channels, sample_width, frame_rate = wav_format
+    
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as writer:
+        writer.setnchannels(channels)
+        writer.setsampwidth(sample_width)
+        writer.setframerate(frame_rate)
+        writer.writeframes(frames)
+    
+    return buffer.getvalue()
+
+
+def wav_frames_view(audio_data: bytes) -> Tuple[WavFormat, memoryview]:
+    """
+    Locate the PCM frames of WAV audio without copying them.
+    
+    Args:
+        audio_data: WAV audio
+    
+    Returns:
+        Tuple[WavFormat, memoryview]: Format, and a read-only view of the
+        frames that shares memory with ``audio_data``
+    
+    Raises:
+        ValidationError: If the audio is not valid PCM WAV
+    """
+    if len(audio_data) < 12 or audio_data[:4] != b"RIFF" or audio_data[8:12] != b"WAVE":
+        raise ValidationError("Invalid WAV audio: missing RIFF header")
+    
+    # Walk the chunks up to the data chunk
+    wav_format = None
+    offset = 12
+    while offset + 8 <= len(audio_data):
+        chunk_id, chunk_size = struct.unpack_from("<4sI", audio_data, offset)
+        offset += 8
+        
+        if chunk_id == b"fmt ":
+            audio_format, channels, frame_rate, _, _, bits = struct.unpack_from("<HHIIHH", audio_data, offset)
+            if audio_format != 1:
+                raise ValidationError(f"Invalid WAV audio: unsupported format {audio_format}")
+            wav_format = (channels, bits // 8, frame_rate)
+        elif chunk_id == b"data":
+            if wav_format is None:
+                raise ValidationError("Invalid WAV audio: data chunk before fmt chunk")
+            end = min(offset + chunk_size, len(audio_data))
+            return wav_format, memoryview(audio_data)[offset:end].toreadonly()
+        
+        # Chunks are padded to an even size
+        offset += chunk_size + (chunk_size & 1)
+    
+    raise ValidationError("Invalid WAV audio: missing data chunk")
+
+
+def concatenate_wav(chunks: List[bytes]) -> bytes:
+    """
+    Join WAV chunks of the same format into a single WAV.
+    
+    The frames are copied once, straight into the result.
+    
+    Args:
+        chunks: WAV audio chunks, in playback order
+    
+    Returns:
+        bytes: Combined WAV audio
+    
+    Raises:
+        ValidationError: If the chunks are invalid or their formats differ
+    """
+    if not chunks:
+        raise ValidationError("No WAV chunks to concatenate")
+    
+    wav_format = None
+    frames = []
+    for chunk in chunks:
+        chunk_format, chunk_frames = wav_frames_view(chunk)
+        if wav_format is None:
+            wav_format = chunk_format
+        elif chunk_format != wav_format:
+            raise ValidationError(
+                "Cannot concatenate WAV chunks with different formats",
+                {"expected": wav_format, "actual": chunk_format}
+            )
+        frames.append(chunk_frames)
+    
+    data_size = sum(len(chunk_frames) for chunk_frames in frames)
+    return b"".join([wav_header(wav_format, data_size)] + frames)
+
+
+def wav_header(wav_format: WavFormat, data_size: int) -> bytes:
+    """
+    Build a WAV header for PCM frames of a known size.
+    
+    Args:
+        wav_format: Format of the PCM frames that will follow
+        data_size: Size of the PCM frames in bytes
+    
+    Returns:
+        bytes: 44-byte WAV header
+    """
+    return _pcm_wav_header(wav_format, 36 + data_size, data_size)
+
+
+def streaming_wav_header(wav_format: WavFormat) -> bytes:
+    """
+    Build a WAV header for audio whose length is not known up front.
+    
+    The RIFF and data chunk sizes are set to 0xFFFFFFFF, which players treat
+    as "read until end of stream".
+    
+    Args:
+        wav_format: Format of the PCM frames that will follow
+    
+    Returns:
+        bytes: 44-byte WAV header
+    """
+    return _pcm_wav_header(wav_format, 0xFFFFFFFF, 0xFFFFFFFF)
+
+
+def _pcm_wav_header(wav_format: WavFormat, riff_size: int, data_size: int) -> bytes:
+    """
+    Build a canonical 44-byte PCM WAV header.
+    
+    Args:
+        wav_format: Format of the PCM frames
+        riff_size: Value of the RIFF chunk size field
+        data_size: Value of the data chunk size field
+    
+    Returns:
+        bytes: WAV header
+    """
+    channels, sample_width, frame_rate = wav_format
+    block_align = channels * sample_width
+    
+    return (
+        struct.pack("<4sI4s", b"RIFF", riff_size, b"WAVE")
+        + struct.pack(
+            "<4sIHHIIHH",
+            b"fmt ",
+            16,
+            1,  # PCM
+            channels,
+            frame_rate,
+            frame_rate * block_align,
+            block_align,
+            sample_width * 8
+        )
+        + struct.pack("<4sI", b"data", data_size)
+    )
+
+
+def wav_duration(audio_data: bytes) -> float:
+    """
+    Get the duration of WAV audio from its header.
+    
+    Args:
+        audio_data: WAV audio
+    
+    Returns:
+        float: Duration in seconds
+    
+    Raises:
+        ValidationError: If the audio is not valid PCM WAV
+    """
+    try:
+        with wave.open(io.BytesIO(audio_data), "rb") as reader:
+            return reader.getnframes() / reader.getframerate()
+    except (wave.Error, EOFError) as e:
+        raise ValidationError(f"Invalid WAV audio: {str(e)}")
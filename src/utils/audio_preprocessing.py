@@ -0,0 +1,237 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+from math import gcd
+from typing import Optional, Tuple
+
+import numpy as np
+
+from src.logging_setup import get_logger
+from src.utils.audio import read_wav, write_wav
+from src.utils.errors import ValidationError
+
+logger = get_logger(__name__)
+
+# Sample rate Whisper models operate at
+ASR_SAMPLE_RATE = 16000
+
+# Anti-aliasing filter: sinc zero crossings on each side, Kaiser window beta
+# and cutoff as a fraction of the lower Nyquist frequency
+FILTER_ZERO_CROSSINGS = 16
+FILTER_KAISER_BETA = 8.6
+FILTER_ROLLOFF = 0.9
+
+# Output samples computed per vectorized block when resampling
+RESAMPLE_BLOCK_SIZE = 16384
+
+
+def _flac_available() -> bool:
+    """
+    Check whether the optional FLAC encoder is installed.
+    
+    Returns:
+        bool: True if the soundfile package can be imported
+    """
+    try:
+        import soundfile  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def pcm_to_float(frames: bytes, channels: int, sample_width: int) -> np.ndarray:
+    """
+    Decode interleaved PCM to floating point samples in [-1, 1).
+    
+    Args:
+        frames: PCM frames
+        channels: Number of channels
+        sample_width: Sample width in bytes (1, 2, 3 or 4)
+    
+    Returns:
+        np.ndarray: Samples with shape (frames, channels)
+    
+    Raises:
+        ValidationError: If the sample width is not supported
+    """
+    if sample_width == 1:
+        # 8-bit WAV is unsigned
+        samples = (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128) / 128
+    elif sample_width == 2:
+        samples = np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768
+    elif sample_width == 3:
+        # Widen 24-bit samples to 32 bits, keeping the sign in the top byte
+        raw = np.frombuffer(frames, dtype=np.uint8).reshape(-1, 3)
+        padded = np.zeros((raw.shape[0], 4), dtype=np.uint8)
+        padded[:, 1:] = raw
+        samples = padded.view("<i4").ravel().astype(np.float32) / 2147483648
+    elif sample_width == 4:
+        samples = np.frombuffer(frames, dtype="<i4").astype(np.float32) / 2147483648
+    else:
+        raise ValidationError(f"Unsupported WAV sample width: {sample_width} bytes")
+    
+    return samples.reshape(-1, channels)
+
+
+def _lowpass_filter(up: int, down: int) -> np.ndarray:
+    """
+    Design the anti-aliasing filter for rational resampling.
+    
+    Args:
+        up: Upsampling factor
+        down: Downsampling factor
+    
+    Returns:
+        np.ndarray: Kaiser-windowed sinc filter at the upsampled rate, with a
+        length that is a multiple of ``up``
+    """
+    # Cutoff in cycles per sample at the upsampled rate, below the lower of
+    # the input and output Nyquist frequencies
+    cutoff = FILTER_ROLLOFF * 0.5 / max(up, down)
+    taps_per_phase = -(-2 * FILTER_ZERO_CROSSINGS * max(up, down) // up)
+    length = taps_per_phase * up
+    
+    # Center on a whole sample so the delay can be compensated exactly
+    n = np.arange(length) - (length - 1) // 2
+    taps = 2 * cutoff * np.sinc(2 * cutoff * n) * np.kaiser(length, FILTER_KAISER_BETA)
+    
+    # Zero-stuffing divides the signal level by `up`, so the filter restores it
+    return (taps * up).astype(np.float32)
+
+
+def resample(samples: np.ndarray, source_rate: int, target_rate: int) -> np.ndarray:
+    """
+    Resample mono audio with a polyphase anti-aliasing filter.
+    
+    Args:
+        samples: Mono samples
+        source_rate: Input sample rate
+        target_rate: Output sample rate
+    
+    Returns:
+        np.ndarray: Resampled mono samples
+    """
+    if source_rate == target_rate or samples.size == 0:
+        return samples
+    
+    divisor = gcd(source_rate, target_rate)
+    up = target_rate // divisor
+    down = source_rate // divisor
+    
+    # Split the filter into one branch per output phase
+    taps = _lowpass_filter(up, down)
+    taps_per_phase = len(taps) // up
+    phases = taps.reshape(taps_per_phase, up).T
+    delay = (len(taps) - 1) // 2
+    
+    # Pad so every tap reads a valid (possibly zero) input sample
+    padded = np.concatenate([
+        np.zeros(taps_per_phase, dtype=np.float32),
+        samples.astype(np.float32),
+        np.zeros(taps_per_phase, dtype=np.float32)
+    ])
+    tap_offsets = np.arange(taps_per_phase)
+    
+    output_length = len(samples) * up // down
+    output = np.empty(output_length, dtype=np.float32)
+    for block_start in range(0, output_length, RESAMPLE_BLOCK_SIZE):
+        n = np.arange(block_start, min(block_start + RESAMPLE_BLOCK_SIZE, output_length))
+        
+        # Position of each output sample on the upsampled grid, delay-compensated
+        position = n * down + delay
+        phase = position % up
+        index = (position // up)[:, None] - tap_offsets[None, :] + taps_per_phase
+        index = np.clip(index, 0, len(padded) - 1)
+        
+        output[block_start:block_start + len(n)] = np.einsum(
+            "ij,ij->i",
+            padded[index],
+            phases[phase]
+        )
+    
+    return output
+
+
+def _encode_flac(samples: np.ndarray, sample_rate: int) -> bytes:
+    """
+    Encode 16-bit mono samples as FLAC.
+    
+    Args:
+        samples: 16-bit mono samples
+        sample_rate: Sample rate
+    
+    Returns:
+        bytes: FLAC audio
+    """
+    import soundfile
+    
+    buffer = io.BytesIO()
+    soundfile.write(buffer, samples, sample_rate, format="FLAC", subtype="PCM_16")
+    return buffer.getvalue()
+
+
+def normalize_for_asr(
+    audio_data: bytes,
+    target_rate: int = ASR_SAMPLE_RATE,
+    flac: bool = False
+) -> Tuple[bytes, str]:
+    """
+    Convert WAV audio to 16-bit mono at the ASR sample rate.
+    
+    This is CPU-bound; run it in the preprocessing executor from async code.
+    
+    Args:
+        audio_data: WAV audio
+        target_rate: Output sample rate
+        flac: Encode the result as FLAC if the encoder is installed
+    
+    Returns:
+        Tuple[bytes, str]: Normalized audio and its format ("wav" or "flac")
+    
+    Raises:
+        ValidationError: If the audio is not PCM WAV
+    """
+    (channels, sample_width, frame_rate), frames = read_wav(audio_data)
+    
+    use_flac = flac and _flac_available()
+    if flac and not use_flac:
+        logger.warning("FLAC encoding requested but the soundfile package is not installed")
+    
+    # Nothing to do for audio that is already in the target format
+    if (channels, sample_width, frame_rate) == (1, 2, target_rate) and not use_flac:
+        return audio_data, "wav"
+    
+    # Downmix, resample and requantize
+    mono = pcm_to_float(frames, channels, sample_width).mean(axis=1)
+    resampled = resample(mono, frame_rate, target_rate)
+    pcm = np.clip(np.round(resampled * 32768), -32768, 32767).astype("<i2")
+    
+    if use_flac:
+        return _encode_flac(pcm, target_rate), "flac"
+    
+    return write_wav((1, 2, target_rate), pcm.tobytes()), "wav"
+
+
+# Singleton instance
+_preprocessing_executor = None
+
+
+def get_preprocessing_executor(max_workers: Optional[int] = None) -> ThreadPoolExecutor:
+    """
+    Get the worker pool for audio preprocessing.
+    
+    NumPy releases the GIL inside its array operations, so threads run
+    preprocessing in parallel without blocking the event loop.
+    
+    Args:
+        max_workers: Number of worker threads, used on first call
+    
+    Returns:
+        ThreadPoolExecutor: Preprocessing executor
+    """
+    global _preprocessing_executor
+    if _preprocessing_executor is None:
+        _preprocessing_executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="audio-preprocess"
+        )
+    return _preprocessing_executor
@@ -0,0 +1,351 @@
+import asyncio
+import contextvars
+import hashlib
+import json
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, Union
+
+from src.utils import deadline
+from src.utils.errors import DeadlineExceededError
+from src.utils.metrics import CACHE_HITS, CACHE_MISSES, CACHE_SIZE
+from src.utils.spool import SpooledAudio
+from src.utils.text import normalize_text
+
+# Audio larger than this is hashed in a worker thread
+HASH_OFFLOAD_THRESHOLD = 1024 * 1024
+
+
+async def hash_audio(audio_data: Union[bytes, SpooledAudio]) -> str:
+    """
+    Compute a fast content hash of audio data.
+    
+    Large inputs are hashed in a worker thread so the event loop is not
+    blocked; hashlib releases the GIL while digesting.
+    
+    Args:
+        audio_data: Audio data, in memory or spooled to a file
+        
+    Returns:
+        str: Hex digest of the audio
+    """
+    if isinstance(audio_data, SpooledAudio):
+        return await audio_data.digest()
+    
+    def _digest() -> str:
+        return hashlib.blake2b(audio_data, digest_size=16).hexdigest()
+    
+    if len(audio_data) >= HASH_OFFLOAD_THRESHOLD:
+        return await asyncio.to_thread(_digest)
+    return _digest()
+
+
+class LRUCache:
+    """
+    In-process cache with per-entry TTL and a total size bound in bytes.
+    
+    When the size bound is exceeded, least recently used entries are evicted.
+    """
+    
+    def __init__(self, name: str, max_bytes: int, ttl: float):
+        """
+        Initialize the cache.
+        
+        Args:
+            name: Cache name, used as the metrics label
+            max_bytes: Maximum total size of cached entries in bytes
+            ttl: Time in seconds an entry stays valid
+        """
+        self.name = name
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, int, Any]]" = OrderedDict()
+        self._size_bytes = 0
+    
+    @property
+    def size_bytes(self) -> int:
+        """
+        Total size of cached entries in bytes.
+        """
+        return self._size_bytes
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Optional[Any]: Cached value, or None on a miss or expired entry
+        """
+        entry = self._entries.get(key)
+        
+        if entry is not None and entry[0] <= time.monotonic():
+            # Drop the expired entry
+            self._remove(key)
+            entry = None
+        
+        if entry is None:
+            CACHE_MISSES.labels(cache=self.name).inc()
+            return None
+        
+        # Mark as most recently used
+        self._entries.move_to_end(key)
+        CACHE_HITS.labels(cache=self.name).inc()
+        
+        return entry[2]
+    
+    def set(self, key: Hashable, value: Any, size: int) -> None:
+        """
+        Store a value.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+            size: Size of the entry in bytes
+        """
+        # Entries larger than the whole cache are never stored
+        if size > self.max_bytes:
+            return
+        
+        if key in self._entries:
+            self._remove(key)
+        
+        self._entries[key] = (time.monotonic() + self.ttl, size, value)
+        self._size_bytes += size
+        
+        # Evict least recently used entries until we fit
+        while self._size_bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+        
+        CACHE_SIZE.labels(cache=self.name).set(self._size_bytes)
+    
+    def clear(self) -> None:
+        """
+        Drop all cached entries.
+        """
+        self._entries.clear()
+        self._size_bytes = 0
+        CACHE_SIZE.labels(cache=self.name).set(0)
+    
+    def _remove(self, key: Hashable) -> None:
+        """
+        Remove an entry and release its size.
+        
+        Args:
+            key: Cache key
+        """
+        _, size, _ = self._entries.pop(key)
+        self._size_bytes -= size
+        CACHE_SIZE.labels(cache=self.name).set(self._size_bytes)
+
+
+class TranslationCache(LRUCache):
+    """
+    Cache of translations keyed on normalized text and language pair.
+    """
+    
+    def __init__(self, max_bytes: int, ttl: float):
+        """
+        Initialize the translation cache.
+        
+        Args:
+            max_bytes: Maximum total size of cached entries in bytes
+            ttl: Time in seconds a translation stays valid
+        """
+        super().__init__("translation", max_bytes, ttl)
+    
+    @staticmethod
+    def make_key(text: str, source_lang: str, target_lang: str) -> Tuple[str, str, str]:
+        """
+        Build the cache key for a translation.
+        
+        Args:
+            text: Source text
+            source_lang: Source language code
+            target_lang: Target language code
+        
+        Returns:
+            Tuple[str, str, str]: Cache key
+        """
+        return (normalize_text(text), source_lang, target_lang)
+    
+    def get_translation(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """
+        Get a cached translation.
+        
+        Args:
+            text: Source text
+            source_lang: Source language code
+            target_lang: Target language code
+        
+        Returns:
+            Optional[str]: Cached translation, or None on a miss
+        """
+        return self.get(self.make_key(text, source_lang, target_lang))
+    
+    def set_translation(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        translation: str
+    ) -> None:
+        """
+        Store a translation.
+        
+        Args:
+            text: Source text
+            source_lang: Source language code
+            target_lang: Target language code
+            translation: Translated text
+        """
+        key = self.make_key(text, source_lang, target_lang)
+        size = sys.getsizeof(key[0]) + sys.getsizeof(translation)
+        self.set(key, translation, size)
+
+
+class TranscriptionCache(LRUCache):
+    """
+    Cache of full ASR results keyed on an audio content hash and language.
+    """
+    
+    def __init__(self, max_bytes: int, ttl: float):
+        """
+        Initialize the transcription cache.
+        
+        Args:
+            max_bytes: Maximum total size of cached entries in bytes
+            ttl: Time in seconds a transcription stays valid
+        """
+        super().__init__("asr", max_bytes, ttl)
+    
+    @staticmethod
+    async def make_key(
+        audio_data: Union[bytes, SpooledAudio],
+        language: str,
+        audio_format: str
+    ) -> Tuple[str, str, str]:
+        """
+        Build the cache key for a transcription.
+        
+        Args:
+            audio_data: Audio data, in memory or spooled to a file
+            language: Language code
+            audio_format: Audio format
+            
+        Returns:
+            Tuple[str, str, str]: Cache key
+        """
+        return (await hash_audio(audio_data), language, audio_format)
+    
+    def set_result(self, key: Tuple[str, str, str], result: Dict[str, Any]) -> None:
+        """
+        Store an ASR result.
+        
+        Args:
+            key: Cache key
+            result: Full ASR response, including segments
+        """
+        size = len(json.dumps(result))
+        self.set(key, result, size)
+
+
+class _SharedCall:
+    """
+    A call in flight and the callers waiting for it.
+    """
+    
+    def __init__(self, task: asyncio.Task, context: contextvars.Context, call_deadline: Optional[float]):
+        self.task = task
+        self.context = context
+        self.deadline = call_deadline
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls with the same key into one in-flight call.
+    
+    The shared call runs as its own task, detached from the caller that
+    started it: it gets a fresh context and runs under the latest of its
+    waiters' deadlines, or none if any waiter has none. One waiter going
+    away or running out of time does not cancel it for the others; it is
+    cancelled only once every waiter has gone. Work that needs the caller's
+    resources, such as an upload, must hold its own copy of them.
+    """
+    
+    def __init__(self):
+        """
+        Initialize the single-flight group.
+        """
+        self._calls: Dict[Hashable, _SharedCall] = {}
+    
+    def __len__(self) -> int:
+        return len(self._calls)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._calls
+    
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``func`` unless a call with the same key is already in flight, in
+        which case wait for and share its result.
+        
+        Args:
+            key: Call key
+            func: Coroutine function performing the call
+            
+        Returns:
+            Any: Result of the shared call
+        
+        Raises:
+            DeadlineExceededError: If this caller's deadline passes first
+        """
+        caller_deadline = deadline.current()
+        call = self._calls.get(key)
+        if call is None:
+            context = contextvars.Context()
+            context.run(deadline.set_deadline_at, caller_deadline)
+            task = asyncio.get_running_loop().create_task(func(), context=context)
+            call = _SharedCall(task, context, caller_deadline)
+            task.add_done_callback(lambda _: self._forget(key, call))
+            self._calls[key] = call
+        elif call.deadline is not None:
+            # Extend the shared call to the most patient waiter's deadline
+            call.deadline = None if caller_deadline is None else max(call.deadline, caller_deadline)
+            call.context.run(deadline.set_deadline_at, call.deadline)
+        
+        call.waiters += 1
+        try:
+            left = deadline.remaining()
+            if left is None:
+                return await asyncio.shield(call.task)
+            try:
+                return await asyncio.wait_for(asyncio.shield(call.task), max(left, 0.0))
+            except asyncio.TimeoutError:
+                if call.task.done():
+                    raise
+                raise DeadlineExceededError("Shared call deadline exceeded", {"key": str(key)})
+        finally:
+            # Cancel the shared call once nobody is waiting for it
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                call.task.cancel()
+    
+    def _forget(self, key: Hashable, call: _SharedCall) -> None:
+        """
+        Drop a finished call, unless a newer call has taken its key.
+        
+        Args:
+            key: Call key
+            call: Finished call
+        """
+        if self._calls.get(key) is call:
+            del self._calls[key]
@@ -0,0 +1,129 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+from src.utils.errors import NeuralBabelError
+
+# Header carrying the remaining budget, in milliseconds, in and out
+DEADLINE_HEADER = "X-Request-Timeout-Ms"
+
+# Order of the pipeline stages the budget is split across
+STAGE_ORDER = ("asr", "translation", "tts")
+
+# Shortest time worth starting another attempt with, in seconds
+MIN_ATTEMPT_TIME = 0.05
+
+# Absolute deadline of the current request on the monotonic clock
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+def set_deadline(timeout: float) -> None:
+    """
+    Set the deadline of the current request.
+    
+    The deadline applies to the current task and everything it starts.
+    
+    Args:
+        timeout: Seconds from now
+    """
+    _deadline.set(time.monotonic() + timeout)
+
+
+def set_deadline_at(deadline: Optional[float]) -> None:
+    """
+    Set the deadline of the current context to a point in time.
+    
+    Args:
+        deadline: Deadline on the monotonic clock, or None for no deadline
+    """
+    _deadline.set(deadline)
+
+
+def current() -> Optional[float]:
+    """
+    Get the deadline of the current request.
+    
+    Returns:
+        Optional[float]: Deadline on the monotonic clock, or None if there is
+        no deadline
+    """
+    return _deadline.get()
+
+
+def remaining() -> Optional[float]:
+    """
+    Get the time left before the current deadline.
+    
+    Returns:
+        Optional[float]: Seconds left (negative once passed), or None if
+        there is no deadline
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def expired() -> bool:
+    """
+    Check whether the current deadline has passed.
+    
+    Returns:
+        bool: True if there is a deadline and it has passed
+    """
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def can_retry(backoff: float) -> bool:
+    """
+    Check whether a retry after ``backoff`` seconds can still finish in time.
+    
+    Args:
+        backoff: Delay before the retry
+    
+    Returns:
+        bool: True if there is no deadline or time is left for another attempt
+    """
+    left = remaining()
+    return left is None or left > backoff + MIN_ATTEMPT_TIME
+
+
+@contextmanager
+def stage_budget(stage: str, shares: Dict[str, float]) -> Iterator[Optional[float]]:
+    """
+    Narrow the deadline to one pipeline stage's share of the time left.
+    
+    The stage gets its share relative to itself and the stages after it,
+    so time saved by earlier stages carries over to later ones. Errors
+    raised once the stage's budget is spent are marked with
+    ``details["deadline_exceeded"]``.
+    
+    Args:
+        stage: Stage name, one of ``STAGE_ORDER``
+        shares: Relative share of the budget per stage
+    
+    Yields:
+        Optional[float]: The stage's budget in seconds, or None if there is
+        no deadline
+    """
+    left = remaining()
+    if left is None:
+        yield None
+        return
+    
+    later_stages = STAGE_ORDER[STAGE_ORDER.index(stage):]
+    total = sum(shares.get(name, 0.0) for name in later_stages)
+    fraction = shares.get(stage, 0.0) / total if total > 0 else 1.0
+    budget = max(left, 0.0) * fraction
+    
+    token = _deadline.set(time.monotonic() + budget)
+    try:
+        yield budget
+    except NeuralBabelError as e:
+        if expired():
+            e.details["deadline_exceeded"] = True
+        raise
+    finally:
+        _deadline.reset(token)
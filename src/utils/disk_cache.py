@@ -0,0 +1,272 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import BinaryIO, Optional
+
+from src.logging_setup import get_logger
+from src.utils.metrics import CACHE_HITS, CACHE_MISSES, CACHE_SIZE
+
+logger = get_logger(__name__)
+
+class CachedAudioFile:
+    """
+    Audio held in the disk cache, to be served straight from its file.
+    
+    Audio looked up in the cache comes with its file already open, so it
+    stays readable if a concurrent write evicts and deletes the file.
+    """
+    
+    def __init__(self, path: str, size: int, file: Optional[BinaryIO] = None):
+        """
+        Initialize the cached audio file.
+        
+        Args:
+            path: Path of the audio file
+            size: Size of the audio file in bytes
+            file: The audio file, already open; opened on first read if not
+                given
+        """
+        self.path = path
+        self.size = size
+        self.file = file
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def read(self) -> bytes:
+        """
+        Read the whole file and close it. This does blocking file I/O, so run
+        it in a worker thread from async code.
+        
+        Returns:
+            bytes: Audio data
+        """
+        with self.open() as f:
+            f.seek(0)
+            return f.read()
+    
+    def close(self) -> None:
+        """
+        Close the file if it is open.
+        """
+        if self.file is not None:
+            self.file.close()
+    
+    def open(self) -> BinaryIO:
+        """
+        Get the open file, opening it if needed. Opening does blocking file
+        I/O, so run it in a worker thread from async code.
+        
+        Returns:
+            BinaryIO: Open file
+        """
+        if self.file is None:
+            self.file = open(self.path, "rb")
+        return self.file
+
+
+class DiskAudioCache:
+    """
+    Content-addressed, size-bounded on-disk cache of synthesized audio.
+    
+    Files are stored as ``<directory>/<key[:2]>/<key>.<audio_format>``. The
+    index lives in memory and is rebuilt from file metadata on startup;
+    file modification times track recency so LRU order survives restarts.
+    """
+    
+    TEMP_SUFFIX = ".tmp"
+    
+    def __init__(self, directory: str, max_bytes: int):
+        """
+        Initialize the disk cache and rebuild its index.
+        
+        Args:
+            directory: Cache directory
+            max_bytes: Maximum total size of cached files in bytes
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._index: "OrderedDict[str, tuple[str, int]]" = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+        
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+    
+    @property
+    def size_bytes(self) -> int:
+        """
+        Total size of cached files in bytes.
+        """
+        return self._size_bytes
+    
+    def __len__(self) -> int:
+        return len(self._index)
+    
+    @staticmethod
+    def make_key(text: str, language: str, voice: str, audio_format: str) -> str:
+        """
+        Build the content address for a synthesis request.
+        
+        Args:
+            text: Text to synthesize
+            language: Language code
+            voice: Voice ID
+            audio_format: Audio format
+        
+        Returns:
+            str: Hex digest identifying the audio
+        """
+        payload = json.dumps([text, language, voice, audio_format], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def _path_for(self, key: str, audio_format: str) -> str:
+        """
+        Get the file path for a cache key.
+        
+        Args:
+            key: Cache key
+            audio_format: Audio format, used as the file extension
+        
+        Returns:
+            str: File path
+        """
+        return os.path.join(self.directory, key[:2], f"{key}.{audio_format}")
+    
+    def _load_index(self) -> None:
+        """
+        Rebuild the index from the files on disk, oldest first.
+        """
+        entries = []
+        
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if not entry.is_file():
+                    continue
+                
+                # Remove writes interrupted by a crash
+                if entry.name.endswith(self.TEMP_SUFFIX):
+                    os.unlink(entry.path)
+                    continue
+                
+                stat = entry.stat()
+                key = entry.name.split(".", 1)[0]
+                entries.append((stat.st_mtime, key, entry.path, stat.st_size))
+        
+        entries.sort()
+        for _, key, path, size in entries:
+            self._index[key] = (path, size)
+            self._size_bytes += size
+        
+        CACHE_SIZE.labels(cache="tts").set(self._size_bytes)
+        
+        logger.info(
+            "Loaded TTS audio cache index",
+            directory=self.directory,
+            entries=len(self._index),
+            size_bytes=self._size_bytes
+        )
+    
+    def get(self, key: str) -> Optional[CachedAudioFile]:
+        """
+        Look up cached audio and open its file. This does blocking file I/O,
+        so run it in a worker thread from async code.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Optional[CachedAudioFile]: Cached audio file, or None on a miss
+        """
+        file = None
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is not None:
+                path, size = entry
+                try:
+                    # Open under the lock, before any eviction can delete it
+                    file = open(path, "rb")
+                    # Persist recency so LRU order survives a restart
+                    os.utime(file.fileno())
+                    self._index.move_to_end(key)
+                except FileNotFoundError:
+                    # File was removed behind our back
+                    self._remove(key)
+                    entry = None
+        
+        if entry is None:
+            CACHE_MISSES.labels(cache="tts").inc()
+            return None
+        
+        CACHE_HITS.labels(cache="tts").inc()
+        return CachedAudioFile(path, size, file)
+    
+    def put(self, key: str, audio_format: str, audio_data: bytes) -> Optional[CachedAudioFile]:
+        """
+        Store audio atomically. This does blocking file I/O, so run it in a
+        worker thread from async code.
+        
+        Args:
+            key: Cache key
+            audio_format: Audio format
+            audio_data: Audio data
+        
+        Returns:
+            Optional[CachedAudioFile]: Cached audio file, or None if the audio
+            is too large to cache
+        """
+        size = len(audio_data)
+        if size > self.max_bytes:
+            return None
+        
+        path = self._path_for(key, audio_format)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        
+        # Write to a temporary file and rename it into place
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=self.TEMP_SUFFIX)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(audio_data)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+        
+        with self._lock:
+            if key in self._index:
+                self._size_bytes -= self._index.pop(key)[1]
+            self._index[key] = (path, size)
+            self._size_bytes += size
+            self._evict()
+            CACHE_SIZE.labels(cache="tts").set(self._size_bytes)
+        
+        return CachedAudioFile(path, size)
+    
+    def _evict(self) -> None:
+        """
+        Delete least recently used files until the cache fits its bound.
+        """
+        while self._size_bytes > self.max_bytes and self._index:
+            oldest_key, (path, _) = next(iter(self._index.items()))
+            self._remove(oldest_key)
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+    
+    def _remove(self, key: str) -> None:
+        """
+        Remove an entry from the index.
+        
+        Args:
+            key: Cache key
+        """
+        _, size = self._index.pop(key)
+        self._size_bytes -= size
+        CACHE_SIZE.labels(cache="tts").set(self._size_bytes)
@@ -68,9 +68,11 @@ class PipelineError(NeuralBabelError):
         self, 
         message: str, 
         stage: Optional[str] = None, 
-        details: Optional[Dict[str, Any]] = None
+        details: Optional[Dict[str, Any]] = None,
+        status_code: Optional[int] = None
     ):
         self.stage = stage
+        self.status_code = status_code
         super().__init__(message, details)
 
 
@@ -97,3 +99,57 @@ class ServiceDiscoveryError(NeuralBabelError):
         self.service_name = service_name
         self.namespace = namespace
         super().__init__(message, details)
+
+
+class OverloadedError(NeuralBabelError):
+    """Exception raised when a request is shed because the service is overloaded."""
+    
+    def __init__(
+        self, 
+        message: str, 
+        retry_after: float, 
+        details: Optional[Dict[str, Any]] = None
+    ):
+        self.retry_after = retry_after
+        super().__init__(message, details)
+
+
+class RateLimitError(OverloadedError):
+    """Exception raised when a tenant exceeds its quota."""
+    pass
+
+
+class DeadlineExceededError(NeuralBabelError):
+    """Exception raised when a request runs out of time before a call completes."""
+    
+    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
+        super().__init__(message, {**(details or {}), "deadline_exceeded": True})
+
+
+def error_status_code(error: Exception) -> int:
+    """
+    Get the HTTP status code that describes a failed request.
+    
+    Running out of time is a gateway timeout, a quota breach is a 429, and
+    a service that is shedding load or behind an open circuit breaker is
+    unavailable rather than failing.
+    
+    Args:
+        error: Error that failed the request
+    
+    Returns:
+        int: HTTP status code
+    """
+    details = getattr(error, "details", None) or {}
+    
+    if isinstance(error, DeadlineExceededError) or details.get("deadline_exceeded"):
+        return 504
+    if isinstance(error, RateLimitError):
+        return 429
+    if isinstance(error, OverloadedError) or details.get("circuit") == "open" or details.get("overloaded"):
+        return 503
+    
+    status_code = getattr(error, "status_code", None)
+    if isinstance(status_code, int) and 400 <= status_code < 600:
+        return status_code
+    return 500
@@ -0,0 +1,358 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+from src.logging_setup import get_logger
+from src.utils.tenancy import DEFAULT_TENANT
+
+logger = get_logger(__name__)
+
+# Job states
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    stage TEXT,
+    source_lang TEXT NOT NULL,
+    target_lang TEXT NOT NULL,
+    audio_format TEXT NOT NULL,
+    voice TEXT NOT NULL,
+    tenant TEXT NOT NULL DEFAULT 'default',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL,
+    error TEXT,
+    details TEXT,
+    output_size INTEGER,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at);
+"""
+
+# Columns added since the first schema, with their definitions
+_ADDED_COLUMNS = {
+    "tenant": "TEXT NOT NULL DEFAULT 'default'",
+    "available_at": "REAL"
+}
+
+
+class JobStore:
+    """
+    Durable job queue in a SQLite database in WAL mode.
+    
+    Job rows live in ``<directory>/jobs.db``; input and output audio are
+    kept next to it as ``<directory>/audio/<id>.input`` and
+    ``<directory>/audio/<id>.<audio_format>``. All methods do blocking I/O,
+    so run them in a worker thread from async code.
+    """
+    
+    def __init__(self, directory: str):
+        """
+        Initialize the job store, creating the database if needed.
+        
+        Args:
+            directory: Directory holding the database and job audio
+        """
+        self.directory = directory
+        self.audio_directory = os.path.join(directory, "audio")
+        os.makedirs(self.audio_directory, exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            os.path.join(directory, "jobs.db"),
+            check_same_thread=False,
+            isolation_level=None
+        )
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._migrate()
+    
+    def _migrate(self) -> None:
+        """
+        Add columns missing from a database created by an older version.
+        """
+        columns = {row["name"] for row in self._db.execute("PRAGMA table_info(jobs)")}
+        for name, definition in _ADDED_COLUMNS.items():
+            if name not in columns:
+                self._db.execute(f"ALTER TABLE jobs ADD COLUMN {name} {definition}")
+    
+    def input_path(self, job_id: str) -> str:
+        """
+        Get the path of a job's input audio.
+        
+        Args:
+            job_id: Job ID
+        
+        Returns:
+            str: File path
+        """
+        return os.path.join(self.audio_directory, f"{job_id}.input")
+    
+    def output_path(self, job_id: str, audio_format: str) -> str:
+        """
+        Get the path of a job's translated audio.
+        
+        Args:
+            job_id: Job ID
+            audio_format: Audio format, used as the file extension
+        
+        Returns:
+            str: File path
+        """
+        return os.path.join(self.audio_directory, f"{job_id}.{audio_format}")
+    
+    @staticmethod
+    def new_job_id() -> str:
+        """
+        Generate a job ID.
+        
+        Returns:
+            str: Job ID
+        """
+        return uuid.uuid4().hex
+    
+    def enqueue(
+        self,
+        job_id: str,
+        source_lang: str,
+        target_lang: str,
+        audio_format: str,
+        voice: str,
+        tenant: str = DEFAULT_TENANT
+    ) -> None:
+        """
+        Add a job whose input audio is already at ``input_path(job_id)``.
+        
+        Args:
+            job_id: Job ID
+            source_lang: Source language code
+            target_lang: Target language code
+            audio_format: Format of input/output audio
+            voice: Voice ID for synthesis
+            tenant: Tenant that submitted the job
+        """
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO jobs (id, status, source_lang, target_lang, audio_format, voice, tenant, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (job_id, JOB_QUEUED, source_lang, target_lang, audio_format, voice, tenant, time.time())
+            )
+    
+    def claim(self) -> Optional[Dict[str, Any]]:
+        """
+        Take the oldest queued job that is due and mark it running.
+        
+        Returns:
+            Optional[Dict[str, Any]]: Claimed job, or None if no job is due
+        """
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "UPDATE jobs SET status = ?, stage = NULL, attempts = attempts + 1, started_at = ? "
+                "WHERE id = (SELECT id FROM jobs WHERE status = ? AND COALESCE(available_at, 0) <= ? "
+                "ORDER BY created_at LIMIT 1) "
+                "RETURNING *",
+                (JOB_RUNNING, now, JOB_QUEUED, now)
+            ).fetchone()
+        return _row_to_job(row)
+    
+    def retry(
+        self,
+        job_id: str,
+        delay: float,
+        error: str,
+        details: Optional[Dict[str, Any]]
+    ) -> None:
+        """
+        Put a job that failed back in the queue, to be claimed again after a
+        delay. The error is kept so the job shows why it is waiting.
+        
+        Args:
+            job_id: Job ID
+            delay: Seconds before the job may be claimed again
+            error: Error message
+            details: Additional error details
+        """
+        with self._lock:
+            self._db.execute(
+                "UPDATE jobs SET status = ?, stage = NULL, error = ?, details = ?, available_at = ? "
+                "WHERE id = ?",
+                (JOB_QUEUED, error, json.dumps(details or {}), time.time() + delay, job_id)
+            )
+    
+    def set_stage(self, job_id: str, stage: str) -> None:
+        """
+        Record the pipeline stage a running job has reached.
+        
+        Args:
+            job_id: Job ID
+            stage: Pipeline stage
+        """
+        with self._lock:
+            self._db.execute("UPDATE jobs SET stage = ? WHERE id = ?", (stage, job_id))
+    
+    def complete(self, job_id: str, output_size: int) -> None:
+        """
+        Mark a job completed; its audio is at ``output_path``.
+        
+        Args:
+            job_id: Job ID
+            output_size: Size of the translated audio in bytes
+        """
+        with self._lock:
+            self._db.execute(
+                "UPDATE jobs SET status = ?, stage = NULL, output_size = ?, finished_at = ? WHERE id = ?",
+                (JOB_COMPLETED, output_size, time.time(), job_id)
+            )
+        self._remove_file(self.input_path(job_id))
+    
+    def fail(self, job_id: str, error: str, stage: Optional[str], details: Optional[Dict[str, Any]]) -> None:
+        """
+        Mark a job failed.
+        
+        Args:
+            job_id: Job ID
+            error: Error message
+            stage: Pipeline stage that failed
+            details: Additional error details
+        """
+        with self._lock:
+            self._db.execute(
+                "UPDATE jobs SET status = ?, stage = ?, error = ?, details = ?, finished_at = ? WHERE id = ?",
+                (JOB_FAILED, stage, error, json.dumps(details or {}), time.time(), job_id)
+            )
+        self._remove_file(self.input_path(job_id))
+    
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a job.
+        
+        Args:
+            job_id: Job ID
+        
+        Returns:
+            Optional[Dict[str, Any]]: Job, or None if unknown
+        """
+        with self._lock:
+            row = self._db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return _row_to_job(row)
+    
+    def recover(self, max_attempts: int) -> int:
+        """
+        Requeue jobs left running by a previous process.
+        
+        Jobs that have already been tried ``max_attempts`` times are failed
+        instead, so a job that crashes the process cannot loop forever.
+        
+        Args:
+            max_attempts: Maximum number of attempts per job
+        
+        Returns:
+            int: Number of jobs requeued
+        """
+        with self._lock:
+            abandoned = self._db.execute(
+                "SELECT id FROM jobs WHERE status = ? AND attempts >= ?",
+                (JOB_RUNNING, max_attempts)
+            ).fetchall()
+            requeued = self._db.execute(
+                "UPDATE jobs SET status = ?, stage = NULL WHERE status = ? AND attempts < ?",
+                (JOB_QUEUED, JOB_RUNNING, max_attempts)
+            ).rowcount
+        
+        for row in abandoned:
+            self.fail(row["id"], "Job was interrupted too many times", None, {"attempts": max_attempts})
+        
+        return requeued
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get queue depth by state and the age of the oldest queued job.
+        
+        Returns:
+            Dict[str, Any]: ``counts`` by status and ``oldest_queued_age`` in
+            seconds (0 when nothing is queued)
+        """
+        with self._lock:
+            counts = dict(self._db.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+            oldest = self._db.execute(
+                "SELECT MIN(created_at) FROM jobs WHERE status = ?",
+                (JOB_QUEUED,)
+            ).fetchone()[0]
+        
+        return {
+            "counts": counts,
+            "oldest_queued_age": time.time() - oldest if oldest is not None else 0.0
+        }
+    
+    def purge(self, older_than: float) -> int:
+        """
+        Delete finished jobs and their audio.
+        
+        Args:
+            older_than: Age in seconds after which finished jobs are deleted
+        
+        Returns:
+            int: Number of jobs deleted
+        """
+        cutoff = time.time() - older_than
+        with self._lock:
+            rows = self._db.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND finished_at < ? RETURNING id, audio_format",
+                (JOB_COMPLETED, JOB_FAILED, cutoff)
+            ).fetchall()
+        
+        for row in rows:
+            self._remove_file(self.output_path(row["id"], row["audio_format"]))
+        
+        return len(rows)
+    
+    def close(self) -> None:
+        """
+        Close the database.
+        """
+        with self._lock:
+            self._db.close()
+    
+    @staticmethod
+    def _remove_file(path: str) -> None:
+        """
+        Delete a file if it exists.
+        
+        Args:
+            path: File path
+        """
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+def _row_to_job(row: Optional[sqlite3.Row]) -> Optional[Dict[str, Any]]:
+    """
+    Convert a database row to a job.
+    
+    Args:
+        row: Database row
+    
+    Returns:
+        Optional[Dict[str, Any]]: Job, or None for a missing row
+    """
+    if row is None:
+        return None
+    
+    job = dict(row)
+    job["details"] = json.loads(job["details"]) if job["details"] else None
+    return job
@@ -0,0 +1,32 @@
+from typing import Any, Union
+
+import orjson
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to JSON.
+    
+    Args:
+        obj: Object to serialize
+    
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    Parse JSON.
+    
+    Args:
+        data: JSON document
+    
+    Returns:
+        Any: Parsed object
+    
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    return orjson.loads(data)
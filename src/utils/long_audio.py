@@ -0,0 +1,147 @@
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from src.utils.audio import read_wav, write_wav
+from src.utils.errors import ValidationError
+
+# Length of the frames scanned for a quiet cut point
+CUT_FRAME_SECONDS = 0.02
+
+
+def split_wav_on_silence(
+    audio_data: bytes,
+    window_seconds: float,
+    overlap_seconds: float
+) -> List[Tuple[float, float, bytes]]:
+    """
+    Split WAV audio into overlapping windows, cutting at quiet points.
+    
+    Each window is cut at the quietest frame in its last quarter, so cuts
+    tend to fall in pauses rather than mid-word. The next window starts
+    ``overlap_seconds`` before the cut.
+    
+    Args:
+        audio_data: 16-bit PCM WAV audio
+        window_seconds: Maximum window length in seconds
+        overlap_seconds: Overlap between consecutive windows in seconds
+    
+    Returns:
+        List[Tuple[float, float, bytes]]: Start and end of each window in
+        seconds, and the window as WAV audio
+    
+    Raises:
+        ValidationError: If the audio is not 16-bit PCM WAV or the overlap
+            is not shorter than the window
+    """
+    wav_format, frames = read_wav(audio_data)
+    channels, sample_width, frame_rate = wav_format
+    if sample_width != 2:
+        raise ValidationError("Long-audio chunking requires 16-bit PCM WAV")
+    if overlap_seconds >= window_seconds:
+        raise ValidationError("Long-audio overlap must be shorter than the window")
+    
+    samples = np.frombuffer(frames, dtype="<i2").reshape(-1, channels)
+    total = samples.shape[0]
+    window = int(window_seconds * frame_rate)
+    overlap = int(overlap_seconds * frame_rate)
+    
+    if total <= window:
+        return [(0.0, total / frame_rate, audio_data)]
+    
+    # Energy of the downmixed signal per frame
+    frame = max(1, int(CUT_FRAME_SECONDS * frame_rate))
+    frame_count = total // frame
+    mono = samples[:frame_count * frame].astype(np.float32).mean(axis=1)
+    energy = np.square(mono.reshape(frame_count, frame)).mean(axis=1)
+    
+    bounds = []
+    start = 0
+    while start + window < total:
+        end = start + window
+        
+        # Cut at the quietest frame in the last quarter of the window,
+        # always past the overlap so every window makes progress
+        first = (max(start + overlap + 1, end - window // 4) + frame - 1) // frame
+        last = end // frame
+        cut = end
+        if last > first:
+            cut = (first + int(np.argmin(energy[first:last]))) * frame
+        
+        bounds.append((start, cut))
+        start = cut - overlap
+    bounds.append((start, total))
+    
+    bytes_per_frame = channels * sample_width
+    return [
+        (
+            start / frame_rate,
+            end / frame_rate,
+            write_wav(wav_format, frames[start * bytes_per_frame:end * bytes_per_frame])
+        )
+        for start, end in bounds
+    ]
+
+
+def merge_transcriptions(windows: List[Tuple[float, float, Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Stitch the transcriptions of overlapping windows into one.
+    
+    Segment timestamps are shifted to the full recording. Within each
+    overlap, segments are kept from the earlier window up to the middle of
+    the overlap and from the later window after it, so overlapping speech
+    is not transcribed twice.
+    
+    Args:
+        windows: Start and end of each window in seconds, and its ASR
+            response, in order
+    
+    Returns:
+        Dict[str, Any]: ASR response with "text" and "segments" for the
+        whole recording
+    """
+    segments = []
+    texts = []
+    
+    for index, (offset, end, result) in enumerate(windows):
+        # This window owns the time between the middles of its overlaps
+        keep_from = float("-inf")
+        if index > 0:
+            keep_from = (offset + windows[index - 1][1]) / 2
+        keep_until = float("inf")
+        if index < len(windows) - 1:
+            keep_until = (windows[index + 1][0] + end) / 2
+        
+        window_segments = result.get("segments") or []
+        if not window_segments:
+            # Without timestamps the whole window text is kept
+            text = result.get("text", "").strip()
+            if text:
+                texts.append(text)
+            continue
+        
+        for segment in window_segments:
+            start_time = segment.get("start", 0.0) + offset
+            end_time = segment.get("end", 0.0) + offset
+            midpoint = (start_time + end_time) / 2
+            if not keep_from <= midpoint < keep_until:
+                continue
+            
+            segments.append({
+                **segment,
+                "id": len(segments),
+                "start": start_time,
+                "end": end_time
+            })
+            text = segment.get("text", "").strip()
+            if text:
+                texts.append(text)
+    
+    merged = {
+        "text": " ".join(texts),
+        "segments": segments
+    }
+    if windows and "language" in windows[0][2]:
+        merged["language"] = windows[0][2]["language"]
+    
+    return merged
@@ -21,6 +21,13 @@ TRANSLATION_LATENCY = Histogram(
     buckets=(0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 120.0)
 )
 
+TRANSLATION_TIME_TO_FIRST_BYTE = Histogram(
+    "translation_time_to_first_byte_seconds",
+    "Time from request start to the first streamed audio byte in seconds",
+    ["source_lang", "target_lang"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0)
+)
+
 # Service metrics
 SERVICE_REQUESTS = Counter(
     "service_requests_total",
@@ -41,6 +48,107 @@ SERVICE_LATENCY = Histogram(
     buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
 )
 
+SERVICE_RETRIES = Counter(
+    "service_retries_total",
+    "Total number of service request retries by reason",
+    ["service", "reason"]
+)
+
+SERVICE_RETRY_BUDGET_EXHAUSTED = Counter(
+    "service_retry_budget_exhausted_total",
+    "Total number of failed requests not retried because the retry budget was exhausted",
+    ["service"]
+)
+
+# Request hedging metrics
+SERVICE_HEDGES = Counter(
+    "service_hedges_total",
+    "Total number of hedged copies sent for slow service requests",
+    ["service"]
+)
+
+SERVICE_HEDGE_WINS = Counter(
+    "service_hedge_wins_total",
+    "Total number of hedged copies that answered before the original request",
+    ["service"]
+)
+
+SERVICE_HEDGES_DENIED = Counter(
+    "service_hedges_denied_total",
+    "Total number of hedges not sent because the hedge budget was exhausted",
+    ["service"]
+)
+
+# Circuit breaker metrics
+CIRCUIT_BREAKER_STATE = Gauge(
+    "circuit_breaker_state",
+    "Circuit breaker state per service (0 closed, 1 half-open, 2 open)",
+    ["service"]
+)
+
+CIRCUIT_BREAKER_REJECTED = Counter(
+    "circuit_breaker_rejected_total",
+    "Total number of service requests refused because the circuit breaker was open",
+    ["service"]
+)
+
+# Adaptive concurrency metrics
+SERVICE_CONCURRENCY_LIMIT = Gauge(
+    "service_concurrency_limit",
+    "Current adaptive limit on concurrent requests per service",
+    ["service"]
+)
+
+SERVICE_IN_FLIGHT = Gauge(
+    "service_in_flight",
+    "Number of requests to a service currently holding a concurrency slot",
+    ["service"]
+)
+
+SERVICE_QUEUE_WAIT = Histogram(
+    "service_queue_wait_seconds",
+    "Time requests waited for a service concurrency slot in seconds",
+    ["service"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+
+SERVICE_CONCURRENCY_SHED = Counter(
+    "service_concurrency_shed_total",
+    "Total number of service requests shed by the concurrency limiter",
+    ["service", "reason"]
+)
+
+# Connection pool metrics
+HTTP_POOL_IN_FLIGHT = Gauge(
+    "http_pool_in_flight_requests",
+    "Number of in-flight requests on a service connection pool",
+    ["service"]
+)
+
+HTTP_POOL_SATURATION = Gauge(
+    "http_pool_saturation_ratio",
+    "In-flight requests as a fraction of the pool's max connections",
+    ["service"]
+)
+
+HTTP_POOL_CONNECTIONS_OPENED = Counter(
+    "http_pool_connections_opened_total",
+    "Total number of requests that had to open a new connection",
+    ["service"]
+)
+
+HTTP_POOL_CONNECTIONS_REUSED = Counter(
+    "http_pool_connections_reused_total",
+    "Total number of requests served over an existing pooled connection",
+    ["service"]
+)
+
+HTTP_POOL_TIMEOUTS = Counter(
+    "http_pool_timeouts_total",
+    "Total number of requests that timed out waiting for a pooled connection",
+    ["service"]
+)
+
 # Pipeline metrics
 PIPELINE_STAGE_LATENCY = Histogram(
     "pipeline_stage_latency_seconds",
@@ -55,6 +163,12 @@ PIPELINE_COMPLETION_RATE = Counter(
     ["status"]  # "success" or "failure"
 )
 
+PIPELINE_CANCELLED = Counter(
+    "pipeline_cancelled_total",
+    "Total number of requests cancelled mid-pipeline, e.g. on client disconnect, by the stage they were in",
+    ["stage"]
+)
+
 # System metrics
 SYSTEM_MEMORY_USAGE = Gauge(
     "system_memory_usage_bytes",
@@ -69,15 +183,141 @@ SYSTEM_CPU_USAGE = Gauge(
 # Cache metrics
 CACHE_HITS = Counter(
     "cache_hits_total",
-    "Total number of cache hits"
+    "Total number of cache hits",
+    ["cache"]
 )
 
 CACHE_MISSES = Counter(
     "cache_misses_total",
-    "Total number of cache misses"
+    "Total number of cache misses",
+    ["cache"]
 )
 
 CACHE_SIZE = Gauge(
     "cache_size_bytes",
-    "Cache size in bytes"
+    "Cache size in bytes",
+    ["cache"]
+)
+
+# Request batching metrics
+BATCH_SIZE = Histogram(
+    "batch_size",
+    "Number of items sent in one batched service request",
+    ["service"],
+    buckets=(1, 2, 4, 8, 16, 32, 64)
+)
+
+BATCH_QUEUE_WAIT = Histogram(
+    "batch_queue_wait_seconds",
+    "Time an item waited for its batch to be sent in seconds",
+    ["service"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+)
+
+BATCH_WINDOW = Gauge(
+    "batch_flush_window_seconds",
+    "Current adaptive flush window of the batcher in seconds",
+    ["service"]
+)
+
+# Audio preprocessing metrics
+AUDIO_PREPROCESSING_LATENCY = Histogram(
+    "audio_preprocessing_latency_seconds",
+    "Time to normalize uploaded audio before ASR in seconds",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
+
+AUDIO_PREPROCESSING_BYTES_SAVED = Counter(
+    "audio_preprocessing_bytes_saved_total",
+    "Total bytes removed from ASR uploads by audio preprocessing"
+)
+
+AUDIO_SILENCE_TRIMMED = Counter(
+    "audio_silence_trimmed_seconds_total",
+    "Total seconds of silence removed from uploads before ASR"
+)
+
+AUDIO_NO_SPEECH = Counter(
+    "audio_no_speech_total",
+    "Total number of uploads in which no speech was detected"
+)
+
+# Batch endpoint metrics
+BATCH_ITEMS = Counter(
+    "batch_translation_items_total",
+    "Total number of items processed by the batch translation endpoint",
+    ["status"]
+)
+
+BATCH_ITEMS_DEDUPLICATED = Counter(
+    "batch_translation_items_deduplicated_total",
+    "Total number of batch items served from an identical item in the same batch"
+)
+
+# Asynchronous job metrics
+JOB_QUEUE_DEPTH = Gauge(
+    "job_queue_depth",
+    "Number of translation jobs by state",
+    ["status"]
+)
+
+JOB_OLDEST_AGE = Gauge(
+    "job_queue_oldest_age_seconds",
+    "Age of the oldest queued translation job in seconds"
+)
+
+JOB_STAGE = Gauge(
+    "job_stage_active",
+    "Number of running translation jobs in each pipeline stage",
+    ["stage"]
+)
+
+JOB_DURATION = Histogram(
+    "job_duration_seconds",
+    "Time from job submission to completion in seconds",
+    ["status"],
+    buckets=(1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0)
+)
+
+# Admission control metrics
+ADMISSION_IN_FLIGHT = Gauge(
+    "admission_in_flight",
+    "Number of admitted requests currently being processed"
+)
+
+ADMISSION_QUEUED = Gauge(
+    "admission_queued",
+    "Number of requests waiting for admission"
+)
+
+ADMISSION_SHED = Counter(
+    "admission_shed_total",
+    "Total number of requests rejected by admission control",
+    ["reason"]
+)
+
+ADMISSION_QUEUE_WAIT = Histogram(
+    "admission_queue_wait_seconds",
+    "Time requests waited for admission in seconds",
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+
+# Tenant metrics
+TENANT_REQUESTS = Counter(
+    "tenant_requests_total",
+    "Total number of translation requests by tenant and outcome",
+    ["tenant", "outcome"]
+)
+
+TENANT_AUDIO_SECONDS = Counter(
+    "tenant_audio_seconds_total",
+    "Total seconds of input audio admitted per tenant",
+    ["tenant"]
+)
+
+TENANT_QUEUE_WAIT = Histogram(
+    "tenant_queue_wait_seconds",
+    "Time requests waited for admission per tenant in seconds",
+    ["tenant"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
 )
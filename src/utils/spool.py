@@ -0,0 +1,145 @@
+import asyncio
+import hashlib
+import io
+import os
+import tempfile
+from typing import AsyncIterator, BinaryIO
+
+# Chunk size for reading spooled audio
+SPOOL_CHUNK_SIZE = 64 * 1024
+
+# Uploads larger than this are spooled to disk
+SPOOL_MAX_MEMORY = 1024 * 1024
+
+
+class SpooledAudio:
+    """
+    Uploaded audio held in a (spooled) temporary file rather than in memory.
+    
+    The file belongs to the request that received it and is closed with the
+    request; consumers rewind it with ``open()`` and must not close it.
+    Blocking reads of the whole file run in a worker thread.
+    """
+    
+    def __init__(self, file: BinaryIO):
+        """
+        Initialize the spooled audio.
+        
+        Args:
+            file: Seekable file holding the audio
+        """
+        self.file = file
+        self.file.seek(0, os.SEEK_END)
+        self.size = self.file.tell()
+        self.file.seek(0)
+        self._digest = None
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def open(self) -> BinaryIO:
+        """
+        Rewind the file for reading from the start.
+        
+        Returns:
+            BinaryIO: The audio file
+        """
+        self.file.seek(0)
+        return self.file
+    
+    def head(self, size: int) -> bytes:
+        """
+        Read the start of the audio, e.g. to inspect its header.
+        
+        Args:
+            size: Maximum number of bytes to read
+        
+        Returns:
+            bytes: Leading bytes of the audio
+        """
+        return self.open().read(size)
+    
+    def clone(self) -> "SpooledAudio":
+        """
+        Get a handle on the same audio that stays readable after this one is
+        closed, for work that can outlive the request owning the file.
+        
+        Small audio is copied into memory; larger audio, which is spooled to
+        disk, gets a duplicate file descriptor. The caller owns the clone and
+        closes it with ``close()``.
+        
+        Returns:
+            SpooledAudio: Independent handle on the audio
+        """
+        if self.size <= SPOOL_MAX_MEMORY:
+            file = io.BytesIO(self.head(self.size))
+        else:
+            file = os.fdopen(os.dup(self.file.fileno()), "rb")
+        
+        clone = SpooledAudio(file)
+        clone._digest = self._digest
+        return clone
+    
+    def close(self) -> None:
+        """
+        Close the file. Only the owner of the audio may do this.
+        """
+        self.file.close()
+    
+    async def read(self) -> bytes:
+        """
+        Load the whole audio into memory, for stages that need it all.
+        
+        Returns:
+            bytes: Audio data
+        """
+        return await asyncio.to_thread(lambda: self.open().read())
+    
+    async def digest(self) -> str:
+        """
+        Compute the content hash of the audio chunk by chunk.
+        
+        Matches ``hash_audio`` on the same bytes.
+        
+        Returns:
+            str: Hex digest of the audio
+        """
+        if self._digest is None:
+            def _digest() -> str:
+                hasher = hashlib.blake2b(digest_size=16)
+                file = self.open()
+                for chunk in iter(lambda: file.read(SPOOL_CHUNK_SIZE), b""):
+                    hasher.update(chunk)
+                return hasher.hexdigest()
+            
+            self._digest = await asyncio.to_thread(_digest)
+        return self._digest
+
+
+async def spool_stream(chunks: AsyncIterator[bytes], max_memory: int = SPOOL_MAX_MEMORY) -> SpooledAudio:
+    """
+    Write a streamed body to a spooled temporary file, hashing it on the way.
+    
+    The caller owns the returned file and must close it when done.
+    
+    Args:
+        chunks: Body chunks
+        max_memory: Size above which the body moves from memory to disk
+    
+    Returns:
+        SpooledAudio: The spooled body
+    """
+    file = tempfile.SpooledTemporaryFile(max_size=max_memory)
+    hasher = hashlib.blake2b(digest_size=16)
+    
+    try:
+        async for chunk in chunks:
+            file.write(chunk)
+            hasher.update(chunk)
+    except BaseException:
+        file.close()
+        raise
+    
+    audio = SpooledAudio(file)
+    audio._digest = hasher.hexdigest()
+    return audio
@@ -0,0 +1,218 @@
+import time
+from typing import Dict, Optional, Set, Tuple, Union
+
+from src.config import TenantConfig
+from src.utils.audio import wav_duration
+from src.utils.errors import RateLimitError, ValidationError
+from src.utils.metrics import TENANT_REQUESTS
+from src.utils.spool import SpooledAudio
+
+# Tenant used when a request does not identify one
+DEFAULT_TENANT = "default"
+
+# Bytes read from a spooled upload to find its duration
+WAV_HEADER_PROBE_SIZE = 64 * 1024
+
+# Bitrate assumed for compressed formats whose duration is not parsed
+COMPRESSED_BYTES_PER_SECOND = 16000
+
+
+class TokenBucket:
+    """
+    Token bucket that refills at a fixed rate up to its capacity.
+    
+    A request may cost more than is left in the bucket, as long as the
+    bucket holds enough to cover it (or is full, for costs above the
+    capacity); the balance then goes negative and is paid back over time,
+    so large requests are delayed rather than refused forever.
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize the bucket full.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+    
+    def wait_time(self, cost: float) -> float:
+        """
+        Get how long until a request of the given cost can be served.
+        
+        Args:
+            cost: Number of tokens the request needs
+        
+        Returns:
+            float: Seconds to wait, or 0 if the tokens are available now
+        """
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        
+        needed = min(cost, self.capacity)
+        if self._tokens >= needed:
+            return 0.0
+        return (needed - self._tokens) / self.rate
+    
+    def consume(self, cost: float) -> None:
+        """
+        Take tokens for a request that ``wait_time`` has cleared.
+        
+        Args:
+            cost: Number of tokens to take
+        """
+        self._tokens -= cost
+    
+    def refund(self, cost: float) -> None:
+        """
+        Give back tokens taken for a request that never ran.
+        
+        Args:
+            cost: Number of tokens to give back
+        """
+        self._tokens = min(self.capacity, self._tokens + cost)
+
+
+class TenantLimiter:
+    """
+    Enforces per-tenant request and audio-seconds quotas.
+    """
+    
+    def __init__(self, config: TenantConfig):
+        """
+        Initialize the limiter.
+        
+        Args:
+            config: Tenant configuration
+        """
+        self.config = config
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._known_tenants = set(config.tenant_overrides) | set(config.api_keys.values())
+        self._header_tenants: Set[str] = set()
+    
+    def resolve_tenant(self, tenant_id: Optional[str], api_key: Optional[str]) -> Optional[str]:
+        """
+        Identify the tenant of a request.
+        
+        An API key takes precedence over the tenant header. Once API keys
+        are configured the header is ignored, so requests without a key run
+        as the default tenant. Otherwise tenant IDs from the header are
+        accepted if configured, and unconfigured ones only up to
+        ``max_header_tenants`` of them, which bounds the quota buckets and
+        metric labels kept per tenant.
+        
+        Args:
+            tenant_id: Value of the X-Tenant-ID header
+            api_key: Value of the X-API-Key header
+        
+        Returns:
+            Optional[str]: Tenant ID, or None if the API key is unknown
+        """
+        if api_key is not None:
+            return self.config.api_keys.get(api_key)
+        if self.config.api_keys or not tenant_id:
+            return DEFAULT_TENANT
+        
+        if tenant_id in self._known_tenants or tenant_id in self._header_tenants:
+            return tenant_id
+        if len(self._header_tenants) < self.config.max_header_tenants:
+            self._header_tenants.add(tenant_id)
+            return tenant_id
+        return DEFAULT_TENANT
+    
+    def weight(self, tenant: str) -> float:
+        """
+        Get a tenant's fair-queuing weight.
+        
+        Args:
+            tenant: Tenant ID
+        
+        Returns:
+            float: Weight
+        """
+        return self.config.for_tenant(tenant).weight
+    
+    def check(self, tenant: str, audio_seconds: float, requests: float = 1.0) -> None:
+        """
+        Charge a request against the tenant's quotas.
+        
+        Args:
+            tenant: Tenant ID
+            audio_seconds: Duration of the request's input audio
+            requests: Number of requests to charge, e.g. the items of a batch
+        
+        Raises:
+            RateLimitError: If a quota is exhausted
+        """
+        config = self.config.for_tenant(tenant)
+        limits = (
+            ("requests", config.requests_per_second, config.request_burst, requests),
+            ("audio_seconds", config.audio_seconds_per_second, config.audio_seconds_burst, audio_seconds)
+        )
+        
+        # Only charge the buckets if every quota has room
+        charges = []
+        for name, rate, capacity, cost in limits:
+            if rate <= 0:
+                continue
+            
+            bucket = self._buckets.get((tenant, name))
+            if bucket is None:
+                bucket = TokenBucket(rate, capacity)
+                self._buckets[(tenant, name)] = bucket
+            
+            wait = bucket.wait_time(cost)
+            if wait > 0:
+                TENANT_REQUESTS.labels(tenant=tenant, outcome="rate_limited").inc()
+                raise RateLimitError(
+                    f"Tenant {tenant} exceeded its {name} quota",
+                    retry_after=wait,
+                    details={"reason": "rate_limit", "quota": name, "tenant": tenant}
+                )
+            charges.append((bucket, cost))
+        
+        for bucket, cost in charges:
+            bucket.consume(cost)
+    
+    def refund(self, tenant: str, audio_seconds: float, requests: float = 1.0) -> None:
+        """
+        Give back what ``check`` charged for a request that was then shed.
+        
+        Args:
+            tenant: Tenant ID
+            audio_seconds: Duration of the request's input audio
+            requests: Number of requests charged
+        """
+        for name, cost in (("requests", requests), ("audio_seconds", audio_seconds)):
+            bucket = self._buckets.get((tenant, name))
+            if bucket is not None:
+                bucket.refund(cost)
+
+
+def estimate_audio_seconds(audio_data: Union[bytes, SpooledAudio], audio_format: str) -> float:
+    """
+    Estimate the duration of uploaded audio for quota accounting.
+    
+    WAV durations come from the header; other formats are estimated from
+    their size.
+    
+    Args:
+        audio_data: Audio data, in memory or spooled to a file
+        audio_format: Audio format
+    
+    Returns:
+        float: Duration in seconds
+    """
+    if audio_format == "wav":
+        header = audio_data.head(WAV_HEADER_PROBE_SIZE) if isinstance(audio_data, SpooledAudio) else audio_data
+        try:
+            return wav_duration(header)
+        except ValidationError:
+            pass
+    
+    return len(audio_data) / COMPRESSED_BYTES_PER_SECOND
@@ -0,0 +1,47 @@
+import re
+import unicodedata
+from typing import List
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text so trivially different transcripts compare equal.
+    
+    Applies Unicode NFC, collapses runs of whitespace and strips
+    surrounding whitespace and trailing punctuation.
+    
+    Args:
+        text: Text to normalize
+        
+    Returns:
+        str: Normalized text
+    """
+    # Compose Unicode characters
+    text = unicodedata.normalize("NFC", text)
+    
+    # Collapse whitespace
+    text = " ".join(text.split())
+    
+    # Strip trailing punctuation
+    end = len(text)
+    while end > 0 and unicodedata.category(text[end - 1]).startswith("P"):
+        end -= 1
+    
+    return text[:end].rstrip()
+
+
+# Sentence-final punctuation followed by whitespace, covering Latin, CJK and Devanagari scripts
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?。！？।])\s+")
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences.
+    
+    Args:
+        text: Text to split
+        
+    Returns:
+        List[str]: Non-empty sentences, in order
+    """
+    return [sentence.strip() for sentence in _SENTENCE_BOUNDARY.split(text) if sentence.strip()]
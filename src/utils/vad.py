@@ -0,0 +1,198 @@
+import bisect
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from src.utils.audio import read_wav, write_wav
+from src.utils.audio_preprocessing import pcm_to_float
+
+# Analysis frame length
+VAD_FRAME_SECONDS = 0.03
+
+# Frequency band holding most speech energy
+SPEECH_BAND_HZ = (300.0, 3400.0)
+
+# Frames must hold at least this share of their energy in the speech band
+MIN_SPEECH_BAND_RATIO = 0.3
+
+# Frames quieter than this are never speech, in dBFS
+ABSOLUTE_THRESHOLD_DB = -55.0
+
+# Frames this far below the loudest frame are never speech, in dB
+MAX_DYNAMIC_RANGE_DB = 30.0
+
+
+class TrimmedAudio:
+    """
+    Audio with silence removed, and the mapping back to the original timeline.
+    """
+    
+    def __init__(
+        self,
+        audio_data: bytes,
+        spans: List[Tuple[float, float]],
+        original_duration: float
+    ):
+        """
+        Initialize the trimmed audio.
+        
+        Args:
+            audio_data: Trimmed WAV audio
+            spans: Start and end in seconds of each kept span of the
+                original audio, in order
+            original_duration: Duration of the original audio in seconds
+        """
+        self.audio_data = audio_data
+        self.spans = spans
+        self.original_duration = original_duration
+        
+        # Start of each span on the trimmed timeline
+        self._trimmed_starts = []
+        position = 0.0
+        for start, end in spans:
+            self._trimmed_starts.append(position)
+            position += end - start
+        self.duration = position
+    
+    @property
+    def has_speech(self) -> bool:
+        """
+        Whether any speech was found.
+        """
+        return bool(self.spans)
+    
+    def to_original(self, time: float) -> float:
+        """
+        Map a time on the trimmed timeline to the original audio.
+        
+        Args:
+            time: Time in the trimmed audio in seconds
+        
+        Returns:
+            float: Time in the original audio in seconds
+        """
+        if not self.spans:
+            return time
+        
+        index = max(bisect.bisect_right(self._trimmed_starts, time) - 1, 0)
+        start, end = self.spans[index]
+        return min(start + time - self._trimmed_starts[index], end)
+    
+    def remap_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Map segment timestamps of an ASR response back to the original audio.
+        
+        Args:
+            result: ASR response for the trimmed audio
+        
+        Returns:
+            Dict[str, Any]: Copy of the response with remapped segments
+        """
+        segments = [
+            {
+                **segment,
+                "start": self.to_original(segment.get("start", 0.0)),
+                "end": self.to_original(segment.get("end", 0.0))
+            }
+            for segment in result.get("segments") or []
+        ]
+        return {**result, "segments": segments}
+
+
+def detect_speech_frames(samples: np.ndarray, sample_rate: int, energy_margin_db: float) -> np.ndarray:
+    """
+    Classify fixed-length frames of mono audio as speech or silence.
+    
+    A frame is speech when it is louder than the estimated noise floor by
+    ``energy_margin_db`` and enough of its energy lies in the speech band.
+    
+    Args:
+        samples: Mono samples in [-1, 1)
+        sample_rate: Sample rate
+        energy_margin_db: Required level above the noise floor in dB
+    
+    Returns:
+        np.ndarray: Boolean speech flag per frame
+    """
+    frame = max(1, int(VAD_FRAME_SECONDS * sample_rate))
+    frame_count = len(samples) // frame
+    if frame_count == 0:
+        return np.zeros(0, dtype=bool)
+    frames = samples[:frame_count * frame].reshape(frame_count, frame)
+    
+    # Energy per frame, against a noise floor taken from the quietest frames
+    energy_db = 10 * np.log10(np.mean(np.square(frames), axis=1) + 1e-10)
+    noise_floor = np.percentile(energy_db, 10)
+    threshold = max(
+        ABSOLUTE_THRESHOLD_DB,
+        min(noise_floor + energy_margin_db, energy_db.max() - MAX_DYNAMIC_RANGE_DB)
+    )
+    
+    # Share of each frame's spectral energy within the speech band
+    spectrum = np.square(np.abs(np.fft.rfft(frames * np.hanning(frame), axis=1)))
+    frequencies = np.fft.rfftfreq(frame, 1 / sample_rate)
+    in_band = (frequencies >= SPEECH_BAND_HZ[0]) & (frequencies <= SPEECH_BAND_HZ[1])
+    band_ratio = spectrum[:, in_band].sum(axis=1) / (spectrum.sum(axis=1) + 1e-10)
+    
+    return (energy_db > threshold) & (band_ratio >= MIN_SPEECH_BAND_RATIO)
+
+
+def trim_silence(
+    audio_data: bytes,
+    energy_margin_db: float = 10.0,
+    min_speech_ms: int = 150,
+    max_pause_ms: int = 1000,
+    padding_ms: int = 200
+) -> TrimmedAudio:
+    """
+    Remove leading and trailing silence and long pauses from WAV audio.
+    
+    This is CPU-bound; run it in the preprocessing executor from async code.
+    
+    Args:
+        audio_data: PCM WAV audio
+        energy_margin_db: Required level above the noise floor in dB
+        min_speech_ms: Speech shorter than this is treated as noise
+        max_pause_ms: Pauses longer than this are cut down to the padding
+        padding_ms: Audio kept around each stretch of speech
+    
+    Returns:
+        TrimmedAudio: Trimmed audio; without spans if there was no speech
+    
+    Raises:
+        ValidationError: If the audio is not PCM WAV
+    """
+    wav_format, frames = read_wav(audio_data)
+    channels, sample_width, sample_rate = wav_format
+    samples = pcm_to_float(frames, channels, sample_width).mean(axis=1)
+    
+    is_speech = detect_speech_frames(samples, sample_rate, energy_margin_db)
+    
+    # Find runs of speech frames
+    edges = np.diff(np.concatenate([[False], is_speech, [False]]).astype(np.int8))
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1)
+    
+    # Drop clicks, pad the rest, and join runs separated by short pauses
+    frame_seconds = max(1, int(VAD_FRAME_SECONDS * sample_rate)) / sample_rate
+    duration = len(samples) / sample_rate
+    spans: List[Tuple[float, float]] = []
+    for run_start, run_end in zip(run_starts, run_ends):
+        if (run_end - run_start) * frame_seconds * 1000 < min_speech_ms:
+            continue
+        
+        start = max(float(run_start) * frame_seconds - padding_ms / 1000, 0.0)
+        end = min(float(run_end) * frame_seconds + padding_ms / 1000, duration)
+        if spans and start - spans[-1][1] <= max_pause_ms / 1000:
+            spans[-1] = (spans[-1][0], end)
+        else:
+            spans.append((start, end))
+    
+    # Keep only the spans
+    bytes_per_frame = channels * sample_width
+    kept = b"".join(
+        frames[int(start * sample_rate) * bytes_per_frame:int(end * sample_rate) * bytes_per_frame]
+        for start, end in spans
+    )
+    
+    return TrimmedAudio(write_wav(wav_format, kept), spans, duration)
@@ -1,7 +1,17 @@
+import asyncio
+import json
+import os
 import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import BackgroundTasks, Request, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from fastapi.testclient import TestClient
 
+from src.api.endpoints import admission_controller, run_until_disconnect, translate_speech_internal
+from src.api.responses import OpenFileResponse
 from src.main import app
+from src.utils.disk_cache import DiskAudioCache
+from src.utils.errors import DeadlineExceededError, OverloadedError, PipelineError
 
 
 # Create test client
@@ -62,3 +72,427 @@ def test_languages_endpoint():
     assert "default_source_lang" in response.json()
     assert "default_target_lang" in response.json()
     assert isinstance(response.json()["language_pairs"], list)
+
+
+@patch("src.api.endpoints.pipeline")
+def test_translate_stream(mock_pipeline):
+    """Test that the translate endpoint streams audio chunks when requested."""
+    async def audio_chunks():
+        yield b"first"
+        yield b"second"
+    
+    # Set up mocks
+    mock_pipeline.translate_speech_stream = AsyncMock(return_value=audio_chunks())
+    
+    # Test streaming translation
+    response = client.post(
+        "/translate",
+        files={"audio": ("audio.wav", b"mock_audio_data", "audio/wav")},
+        data={"source_lang": "en", "target_lang": "fr", "stream": "true"}
+    )
+    
+    # Check results
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "audio/wav"
+    assert response.content == b"firstsecond"
+    mock_pipeline.translate_speech_stream.assert_called_once()
+    mock_pipeline.translate_speech.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("src.api.endpoints.run_translation")
+async def test_stream_releases_admission_on_early_disconnect(mock_run_translation):
+    """Test that a stream closed before it starts still gives back its admission slot."""
+    closed = asyncio.Event()
+    
+    async def audio_chunks():
+        try:
+            yield b"first"
+        finally:
+            closed.set()
+    
+    # Set up mocks
+    chunks = audio_chunks()
+    await chunks.asend(None)
+    mock_run_translation.return_value = StreamingResponse(chunks)
+    background_tasks = BackgroundTasks()
+    
+    # The client disconnects before the body is sent; only the background
+    # tasks run
+    await translate_speech_internal(
+        audio_data=b"mock_audio_data",
+        source_lang="en",
+        target_lang="fr",
+        audio_format="wav",
+        voice="default",
+        stream=True,
+        background_tasks=background_tasks
+    )
+    assert admission_controller.in_flight == 1
+    await background_tasks()
+    
+    # Check results
+    assert admission_controller.in_flight == 0
+    assert closed.is_set()
+
+
+@pytest.mark.asyncio
+async def test_run_until_disconnect_cancels_work():
+    """Test that work is cancelled once the client disconnects."""
+    async def receive():
+        await asyncio.sleep(0.01)
+        return {"type": "http.disconnect"}
+    
+    request = Request({"type": "http", "path": "/translate", "headers": []}, receive)
+    work_cancelled = asyncio.Event()
+    
+    async def work():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            work_cancelled.set()
+            raise
+    
+    # Test a disconnect during the work
+    response = await run_until_disconnect(request, work())
+    
+    # Check results
+    assert response.status_code == 499
+    assert work_cancelled.is_set()
+
+
+@patch("src.api.endpoints.pipeline_config.enable_streaming", True)
+@patch("src.api.endpoints.pipeline")
+def test_translate_websocket(mock_pipeline):
+    """Test that the WebSocket endpoint translates each utterance as it ends."""
+    async def utterance_events(audio_data, source_lang, target_lang, voice):
+        yield {"type": "transcript", "text": "Hello"}
+        yield {"type": "translation", "text": "Bonjour"}
+        yield {"type": "audio", "audio": b"mock_audio_output"}
+    
+    # Set up mocks
+    mock_pipeline.translate_utterance = MagicMock(side_effect=utterance_events)
+    
+    # One second of loud audio followed by one second of silence
+    speech = b"\x00\x40" * 16000
+    silence = b"\x00\x00" * 16000
+    
+    with client.websocket_connect("/ws/translate?source_lang=en&target_lang=fr") as websocket:
+        websocket.send_bytes(speech)
+        websocket.send_bytes(silence)
+        
+        # Check results
+        assert websocket.receive_json() == {"type": "transcript", "text": "Hello", "utterance": 0}
+        assert websocket.receive_json() == {"type": "translation", "text": "Bonjour", "utterance": 0}
+        assert websocket.receive_bytes() == b"mock_audio_output"
+        assert websocket.receive_json() == {"type": "utterance_end", "utterance": 0}
+        
+        websocket.send_json({"type": "end"})
+    
+    mock_pipeline.translate_utterance.assert_called_once()
+
+
+@patch("src.api.endpoints.pipeline_config.enable_streaming", True)
+@patch("src.api.endpoints.pipeline")
+def test_translate_websocket_reports_utterance_errors(mock_pipeline):
+    """Test that a failed utterance is reported and the stream carries on."""
+    calls = []
+    
+    async def utterance_events(audio_data, source_lang, target_lang, voice):
+        calls.append(audio_data)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        yield {"type": "transcript", "text": "Hello"}
+    
+    # Set up mocks
+    mock_pipeline.translate_utterance = MagicMock(side_effect=utterance_events)
+    
+    speech = b"\x00\x40" * 16000
+    silence = b"\x00\x00" * 16000
+    
+    with client.websocket_connect("/ws/translate?source_lang=en&target_lang=fr") as websocket:
+        websocket.send_bytes(speech + silence)
+        websocket.send_bytes(speech + silence)
+        
+        # Check results
+        assert websocket.receive_json() == {
+            "type": "error",
+            "utterance": 0,
+            "error": "Unexpected error: boom",
+            "stage": None
+        }
+        assert websocket.receive_json() == {"type": "transcript", "text": "Hello", "utterance": 1}
+        assert websocket.receive_json() == {"type": "utterance_end", "utterance": 1}
+        
+        websocket.send_json({"type": "end"})
+
+
+@patch("src.api.endpoints.pipeline_config.enable_streaming", True)
+@patch("src.api.endpoints.admission_controller")
+def test_translate_websocket_closes_when_worker_fails(mock_admission):
+    """Test that the WebSocket is closed with 1011 if the translation worker stops."""
+    # Set up mocks
+    mock_admission.acquire = AsyncMock(side_effect=RuntimeError("broken"))
+    
+    speech = b"\x00\x40" * 16000
+    silence = b"\x00\x00" * 16000
+    
+    with client.websocket_connect("/ws/translate?source_lang=en&target_lang=fr") as websocket:
+        websocket.send_bytes(speech + silence)
+        
+        # Check results
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            websocket.receive_json()
+    
+    assert exc_info.value.code == 1011
+
+
+@patch("src.api.endpoints.pipeline_config.enable_streaming", True)
+def test_translate_websocket_rejects_bad_input():
+    """Test that bad stream parameters and malformed frames close the WebSocket."""
+    # Unsupported sample rate
+    with pytest.raises(WebSocketDisconnect) as exc_info:
+        with client.websocket_connect("/ws/translate?source_lang=en&target_lang=fr&sample_rate=0") as websocket:
+            websocket.receive_json()
+    assert exc_info.value.code == 1003
+    
+    # Malformed control message
+    with client.websocket_connect("/ws/translate?source_lang=en&target_lang=fr") as websocket:
+        websocket.send_text("not json")
+        assert websocket.receive_json()["type"] == "error"
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            websocket.receive_json()
+    assert exc_info.value.code == 1007
+
+
+@patch("src.api.endpoints.pipeline_config.enable_streaming", True)
+@patch("src.api.endpoints.pipeline_config.stream_max_queued_utterances", 1)
+@patch("src.api.endpoints.pipeline")
+def test_translate_websocket_closes_when_behind(mock_pipeline):
+    """Test that the WebSocket is closed once translation falls too far behind."""
+    async def stalled_events(audio_data, source_lang, target_lang, voice):
+        await asyncio.Event().wait()
+        yield {}
+    
+    # Set up mocks
+    mock_pipeline.translate_utterance = MagicMock(side_effect=stalled_events)
+    
+    speech = b"\x00\x40" * 16000
+    silence = b"\x00\x00" * 16000
+    
+    with client.websocket_connect("/ws/translate?source_lang=en&target_lang=fr") as websocket:
+        for _ in range(3):
+            websocket.send_bytes(speech + silence)
+        
+        # Check results
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            websocket.receive_json()
+    
+    assert exc_info.value.code == 1013
+
+
+def test_translate_websocket_disabled():
+    """Test that the WebSocket endpoint is closed when streaming is disabled."""
+    with pytest.raises(WebSocketDisconnect) as exc_info:
+        with client.websocket_connect("/ws/translate?source_lang=en&target_lang=fr") as websocket:
+            websocket.receive_json()
+    
+    assert exc_info.value.code == 1008
+
+
+@patch("src.api.endpoints.pipeline")
+def test_translate_no_speech(mock_pipeline):
+    """Test that the translate endpoint returns 204 when the input has no speech."""
+    # Set up mocks
+    mock_pipeline.translate_speech = AsyncMock(return_value=b"")
+    
+    # Test translation
+    response = client.post(
+        "/translate",
+        files={"audio": ("audio.wav", b"mock_audio_data", "audio/wav")},
+        data={"source_lang": "en", "target_lang": "fr"}
+    )
+    
+    # Check results
+    assert response.status_code == 204
+    assert response.content == b""
+
+
+@pytest.mark.asyncio
+async def test_open_file_response_serves_evicted_file(tmp_path):
+    """Test that cached audio is served from its open file and then closed."""
+    cache = DiskAudioCache(str(tmp_path), max_bytes=1024)
+    key = cache.make_key("Bonjour", "fr", "default", "wav")
+    cache.put(key, "wav", b"RIFF-audio")
+    
+    async def receive():
+        return {"type": "http.disconnect"}
+    
+    for extensions in ({}, {"http.response.zerocopysend": {}}):
+        # Look up the audio, then evict it
+        cached = cache.get(key)
+        os.remove(cached.path)
+        
+        messages = []
+        
+        async def send(message):
+            messages.append(message)
+        
+        response = OpenFileResponse(cached.open(), cached.path, media_type="audio/wav")
+        await response({"type": "http", "method": "GET", "extensions": extensions}, receive, send)
+        
+        # Check results
+        assert (b"content-length", b"10") in messages[0]["headers"]
+        if extensions:
+            assert messages[1]["type"] == "http.response.zerocopysend"
+            assert messages[1]["count"] == 10
+        else:
+            assert messages[1]["body"] == b"RIFF-audio"
+        assert cached.file.closed
+        
+        cache.put(key, "wav", b"RIFF-audio")
+
+
+@patch("src.api.endpoints.pipeline")
+def test_translate_raw(mock_pipeline):
+    """Test the raw body endpoint with parameters in headers."""
+    # Set up mocks
+    mock_pipeline.translate_speech = AsyncMock(return_value=b"mock_audio_output")
+    
+    # Test translation
+    response = client.post(
+        "/translate/raw?target_lang=fr",
+        content=b"mock_audio_data",
+        headers={"Content-Type": "application/octet-stream", "X-Source-Language": "en"}
+    )
+    
+    # Check results
+    assert response.status_code == 200
+    assert response.content == b"mock_audio_output"
+    
+    # Check calls: the body is passed on spooled, not as bytes
+    call_kwargs = mock_pipeline.translate_speech.call_args.kwargs
+    assert call_kwargs["source_lang"] == "en"
+    assert call_kwargs["target_lang"] == "fr"
+    assert len(call_kwargs["audio_data"]) == len(b"mock_audio_data")
+
+
+@patch("src.api.endpoints.pipeline")
+def test_translate_batch(mock_pipeline):
+    """Test that batch items are deduplicated and streamed back as NDJSON."""
+    # Set up mocks
+    mock_pipeline.config.supported_language_pairs = [("en", "fr")]
+    mock_pipeline.translate_speech = AsyncMock(return_value=b"mock_audio_output")
+    
+    # Test batch translation: two identical clips and one unsupported pair
+    response = client.post(
+        "/translate/batch",
+        files=[
+            ("files", ("a.wav", b"same_audio", "audio/wav")),
+            ("files", ("b.wav", b"same_audio", "audio/wav")),
+            ("files", ("c.wav", b"other_audio", "audio/wav"))
+        ],
+        data={
+            "source_lang": "en",
+            "target_lang": "fr",
+            "manifest": json.dumps([{"id": "first"}, {}, {"target_lang": "xx"}])
+        }
+    )
+    
+    # Check results
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    results = {line["index"]: line for line in map(json.loads, response.text.splitlines())}
+    assert len(results) == 3
+    assert results[0]["id"] == "first" and results[0]["status"] == "ok"
+    assert results[1]["id"] == "b.wav" and results[1]["audio"] == results[0]["audio"]
+    assert results[2]["status"] == "error" and results[2]["status_code"] == 400
+    
+    # Identical clips are translated once
+    mock_pipeline.translate_speech.assert_called_once()
+
+
+@patch("src.api.endpoints.admission_controller")
+@patch("src.api.endpoints.pipeline")
+def test_translate_batch_items_go_through_admission(mock_pipeline, mock_admission):
+    """Test that each batch item is admitted on its own, and a shed item fails alone."""
+    # Set up mocks: the second admission is shed
+    mock_pipeline.config.supported_language_pairs = [("en", "fr")]
+    mock_pipeline.translate_speech = AsyncMock(return_value=b"mock_audio_output")
+    mock_admission.acquire = AsyncMock(side_effect=[None, OverloadedError("Server overloaded", retry_after=1.0)])
+    
+    response = client.post(
+        "/translate/batch",
+        files=[
+            ("files", ("a.wav", b"first_audio", "audio/wav")),
+            ("files", ("b.wav", b"second_audio", "audio/wav"))
+        ],
+        data={"source_lang": "en", "target_lang": "fr"},
+        headers={"X-Tenant-ID": "acme"}
+    )
+    
+    # Check results
+    assert response.status_code == 200
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(result["status"] for result in results) == ["error", "ok"]
+    assert [result["status_code"] for result in results if result["status"] == "error"] == [503]
+    assert all(call.kwargs["tenant"] == "acme" for call in mock_admission.acquire.call_args_list)
+    mock_admission.release.assert_called_once()
+
+
+@patch("src.api.endpoints.pipeline")
+def test_translate_batch_item_status_codes(mock_pipeline):
+    """Test that failed batch items report the same status codes as single requests."""
+    # Set up mocks: each clip fails a different way
+    errors = {
+        b"slow_audio": DeadlineExceededError("Translation batched request deadline exceeded"),
+        b"open_audio": PipelineError("TTS failed", stage="tts", details={"circuit": "open"}),
+        b"busy_audio": PipelineError("ASR failed", stage="asr", details={"overloaded": True}),
+        b"late_audio": PipelineError("ASR failed", stage="asr", details={"deadline_exceeded": True}),
+        b"bad_audio": PipelineError("ASR failed", stage="asr")
+    }
+    
+    async def translate_speech(audio_data, **kwargs):
+        raise errors[audio_data.head(len(audio_data))]
+    
+    mock_pipeline.config.supported_language_pairs = [("en", "fr")]
+    mock_pipeline.translate_speech = translate_speech
+    
+    response = client.post(
+        "/translate/batch",
+        files=[("files", (f"{index}.wav", audio, "audio/wav")) for index, audio in enumerate(errors)],
+        data={"source_lang": "en", "target_lang": "fr"}
+    )
+    
+    # Check results
+    assert response.status_code == 200
+    results = {line["index"]: line for line in map(json.loads, response.text.splitlines())}
+    assert [results[index]["status_code"] for index in range(len(errors))] == [504, 503, 503, 504, 500]
+    assert all(result["status"] == "error" for result in results.values())
+
+
+@patch("src.api.endpoints.job_manager")
+def test_get_job_checks_tenant(mock_job_manager):
+    """Test that a job is only visible to the tenant that submitted it."""
+    # Set up mocks
+    mock_job_manager.get = AsyncMock(return_value={
+        "id": "job-1",
+        "status": "queued",
+        "stage": None,
+        "source_lang": "en",
+        "target_lang": "fr",
+        "audio_format": "wav",
+        "tenant": "acme",
+        "attempts": 0,
+        "created_at": 0.0,
+        "started_at": None,
+        "finished_at": None,
+        "output_size": None,
+        "error": None,
+        "details": None
+    })
+    
+    # Check results
+    assert client.get("/jobs/job-1", headers={"X-Tenant-ID": "acme"}).status_code == 200
+    assert client.get("/jobs/job-1", headers={"X-Tenant-ID": "other"}).status_code == 404
+    assert client.get("/jobs/job-1/audio", headers={"X-Tenant-ID": "other"}).status_code == 404
@@ -1,19 +1,35 @@
+import asyncio
+import base64
+import socket
+import tempfile
+
+import httpx
 import pytest
+from prometheus_client import REGISTRY
 from unittest.mock import AsyncMock, patch, MagicMock
 
-from src.config import ServiceConfig
+from src.config import LongAudioConfig, ServiceConfig
 from src.clients.asr_client import ASRClient
+from src.clients.batching import MicroBatcher
+from src.clients.concurrency import AdaptiveConcurrencyLimiter
+from src.clients.hedging import HedgeBudget, latency_percentile
+from src.clients.http_pool import ConnectionPoolManager, DNSCache, PooledTransport
 from src.clients.translation_client import TranslationClient
 from src.clients.tts_client import TTSClient
-from src.utils.errors import ASRError, TranslationError, TTSError
+from src.utils.audio import write_wav
+from src.utils.cache import TranscriptionCache, TranslationCache, hash_audio
+from src.utils import deadline, json_codec
+from src.utils.errors import ASRError, DeadlineExceededError, TranslationError
+from src.utils.metrics import SERVICE_LATENCY
+from src.utils.spool import SpooledAudio
 
 
 @pytest.fixture
 def mock_service_discovery():
     """Create a mock service discovery."""
-    mock = AsyncMock()
+    mock = MagicMock()
     mock.get_service_url.return_value = "http://mock-service:8000"
-    mock.check_service_health.return_value = True
+    mock.check_service_health = AsyncMock(return_value=True)
     return mock
 
 
@@ -75,7 +91,7 @@ async def test_asr_client_transcribe(
     """Test ASR client transcription."""
     # Set up mocks
     mock_get_service_discovery.return_value = mock_service_discovery
-    mock_response.json.return_value = {"text": "Hello, world!"}
+    mock_response.content = json_codec.dumps({"text": "Hello, world!"})
     mock_request.return_value = mock_response
     
     # Create client
@@ -109,7 +125,7 @@ async def test_translation_client_translate(
     """Test translation client translation."""
     # Set up mocks
     mock_get_service_discovery.return_value = mock_service_discovery
-    mock_response.json.return_value = {"translation": "Bonjour, monde!"}
+    mock_response.content = json_codec.dumps({"translation": "Bonjour, monde!"})
     mock_request.return_value = mock_response
     
     # Create client
@@ -196,3 +212,703 @@ async def test_asr_client_error(
     # Check error
     assert "500" in str(excinfo.value)
     assert "Internal Server Error" in str(excinfo.value)
+
+
+@pytest.mark.asyncio
+@patch("src.clients.translation_client.get_service_discovery")
+@patch("httpx.AsyncClient.request")
+async def test_translation_client_retries_with_budget(
+    mock_request,
+    mock_get_service_discovery,
+    mock_service_discovery,
+    mock_translation_config
+):
+    """Test that transient failures are retried within the service's retry budget."""
+    # Set up mocks
+    mock_get_service_discovery.return_value = mock_service_discovery
+    unavailable = MagicMock(status_code=503, text="Service Unavailable")
+    success = MagicMock(status_code=200, content=json_codec.dumps({"translation": "Bonjour"}))
+    mock_request.side_effect = [httpx.ConnectError("refused"), unavailable, success]
+    
+    # Create client with room for one retry in its budget
+    config = mock_translation_config.model_copy(
+        update={"name": "mock-translation-retry", "retries": 2, "backoff_factor": 0.001, "retry_budget_burst": 2.0}
+    )
+    client = TranslationClient(config)
+    retries_before = REGISTRY.get_sample_value(
+        "service_retries_total", {"service": "translation", "reason": "connect_error"}
+    ) or 0
+    
+    # A connection failure and a 503 are both retried
+    assert await client.translate(text="Hello", source_lang="en", target_lang="fr") == "Bonjour"
+    assert mock_request.call_count == 3
+    assert REGISTRY.get_sample_value(
+        "service_retries_total", {"service": "translation", "reason": "connect_error"}
+    ) == retries_before + 1
+    
+    # With the budget spent the next failure is not retried
+    mock_request.reset_mock()
+    mock_request.side_effect = [unavailable, success]
+    with pytest.raises(TranslationError) as excinfo:
+        await client.translate(text="Goodbye", source_lang="en", target_lang="fr")
+    assert excinfo.value.status_code == 503
+    assert mock_request.call_count == 1
+
+
+@pytest.mark.asyncio
+@patch("src.clients.translation_client.get_service_discovery")
+@patch("httpx.AsyncClient.request")
+async def test_translation_client_retries_dropped_connections(
+    mock_request,
+    mock_get_service_discovery,
+    mock_service_discovery,
+    mock_translation_config
+):
+    """Test that reset connections are retried and count as circuit breaker failures."""
+    # Set up mocks
+    mock_get_service_discovery.return_value = mock_service_discovery
+    success = MagicMock(status_code=200, content=json_codec.dumps({"translation": "Bonjour"}))
+    mock_request.side_effect = [httpx.RemoteProtocolError("Server disconnected"), success]
+    
+    # Create client
+    config = mock_translation_config.model_copy(
+        update={"name": "mock-translation-dropped", "backoff_factor": 0.001}
+    )
+    client = TranslationClient(config)
+    retries_before = REGISTRY.get_sample_value(
+        "service_retries_total", {"service": "translation", "reason": "protocol_error"}
+    ) or 0
+    
+    # Check results
+    assert await client.translate(text="Hello", source_lang="en", target_lang="fr") == "Bonjour"
+    assert mock_request.call_count == 2
+    assert REGISTRY.get_sample_value(
+        "service_retries_total", {"service": "translation", "reason": "protocol_error"}
+    ) == retries_before + 1
+    assert sum(bucket[2] for bucket in client.retry_policy.circuit_breaker._buckets) == 1
+
+
+@pytest.mark.asyncio
+@patch("src.clients.translation_client.get_service_discovery")
+@patch("httpx.AsyncClient.request")
+async def test_translation_client_circuit_breaker(
+    mock_request,
+    mock_get_service_discovery,
+    mock_service_discovery,
+    mock_translation_config
+):
+    """Test that an open circuit breaker fails fast and closes after successful probes."""
+    # Set up mocks
+    mock_get_service_discovery.return_value = mock_service_discovery
+    unavailable = MagicMock(status_code=503, text="Service Unavailable")
+    success = MagicMock(status_code=200, content=json_codec.dumps({"translation": "Bonjour"}))
+    mock_request.side_effect = [unavailable, unavailable]
+    
+    # Create client whose breaker opens after two failed calls
+    config = mock_translation_config.model_copy(
+        update={
+            "name": "mock-translation-circuit",
+            "retries": 0,
+            "circuit_min_calls": 2,
+            "circuit_open_duration": 0.05,
+            "circuit_half_open_calls": 1
+        }
+    )
+    client = TranslationClient(config)
+    for _ in range(2):
+        with pytest.raises(TranslationError):
+            await client.translate(text="Hello", source_lang="en", target_lang="fr")
+    assert client.retry_policy.circuit_breaker.state == "open"
+    assert REGISTRY.get_sample_value("circuit_breaker_state", {"service": "translation"}) == 2
+    
+    # While open, requests fail without being sent
+    with pytest.raises(TranslationError) as excinfo:
+        await client.translate(text="Hello", source_lang="en", target_lang="fr")
+    assert excinfo.value.details["circuit"] == "open"
+    assert mock_request.call_count == 2
+    
+    # After the open period a successful probe closes the breaker
+    await asyncio.sleep(0.06)
+    mock_request.side_effect = [success]
+    assert await client.translate(text="Hello", source_lang="en", target_lang="fr") == "Bonjour"
+    assert client.retry_policy.circuit_breaker.state == "closed"
+    assert REGISTRY.get_sample_value("circuit_breaker_state", {"service": "translation"}) == 0
+
+
+@pytest.mark.asyncio
+@patch("src.clients.translation_client.get_service_discovery")
+@patch("httpx.AsyncClient.request")
+async def test_translation_client_passes_deadline_errors_through(
+    mock_request,
+    mock_get_service_discovery,
+    mock_service_discovery,
+    mock_translation_config
+):
+    """Test that a call cut short by its deadline is not wrapped as a translation error."""
+    # Set up mocks
+    mock_get_service_discovery.return_value = mock_service_discovery
+    
+    async def slow_request(*args, **kwargs):
+        await asyncio.sleep(5)
+    
+    mock_request.side_effect = slow_request
+    
+    # Create client
+    config = mock_translation_config.model_copy(update={"name": "mock-translation-deadline"})
+    client = TranslationClient(config)
+    deadline.set_deadline(0.05)
+    
+    # Check results
+    with pytest.raises(DeadlineExceededError) as excinfo:
+        await client.translate(text="Hello", source_lang="en", target_lang="fr")
+    assert not isinstance(excinfo.value, TranslationError)
+    assert excinfo.value.details["deadline_exceeded"] is True
+    assert sum(bucket[2] for bucket in client.retry_policy.circuit_breaker._buckets) == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter_adapts_and_sheds(mock_tts_config):
+    """Test that the concurrency limiter queues and sheds excess requests and follows latency."""
+    config = mock_tts_config.model_copy(
+        update={
+            "name": "mock-tts-limiter",
+            "concurrency_initial_limit": 1,
+            "concurrency_max_limit": 10,
+            "concurrency_max_queue": 1,
+            "concurrency_max_wait": 1.0
+        }
+    )
+    limiter = AdaptiveConcurrencyLimiter(config)
+    
+    # One request runs, one queues and a third is shed
+    assert await limiter.acquire()
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queued == 1
+    assert not await limiter.acquire()
+    
+    # Releasing the slot hands it to the queued request
+    limiter.release(latency=0.1)
+    assert await waiting
+    assert limiter.in_flight == 1
+    assert REGISTRY.get_sample_value("service_in_flight", {"service": "tts"}) == 1
+    
+    # Steady latency grows a busy limit, even with a mix of short and long
+    # requests, and rising latency shrinks it
+    limiter = AdaptiveConcurrencyLimiter(
+        config.model_copy(
+            update={"concurrency_initial_limit": 20, "concurrency_max_limit": 100, "concurrency_baseline_samples": 50}
+        )
+    )
+    for _ in range(15):
+        await limiter.acquire()
+    for index in range(40):
+        limiter.release(latency=0.1 if index % 2 else 1.0)
+        await limiter.acquire()
+    grown = limiter.limit
+    assert grown > 20
+    assert REGISTRY.get_sample_value("service_concurrency_limit", {"service": "tts"}) == grown
+    for _ in range(10):
+        limiter.release(latency=3.0)
+        await limiter.acquire()
+    assert limiter.limit < grown
+    
+    # Failures cut the limit
+    limit = limiter._limit
+    limiter.release(dropped=True)
+    assert limiter._limit == pytest.approx(limit * config.concurrency_backoff_ratio)
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_reuses_client(mock_asr_config):
+    """Test that the connection pool keeps one long-lived client per service."""
+    # Configure split timeouts
+    config = mock_asr_config.model_copy(update={"connect_timeout": 0.5})
+    
+    # Create pool
+    pool = ConnectionPoolManager()
+    
+    # Get the client twice
+    first = pool.get_client(config)
+    second = pool.get_client(config)
+    
+    # Check results
+    assert first is second
+    assert first.timeout.connect == 0.5
+    assert first.timeout.read == config.timeout
+    
+    # Closing the pool closes the client
+    await pool.close()
+    assert first.is_closed
+
+
+@pytest.mark.asyncio
+@patch("httpx.AsyncClient.request")
+async def test_connection_pool_enforces_deadline(mock_request, mock_asr_config, mock_response):
+    """Test that pooled requests forward the deadline and stop when it passes."""
+    mock_request.return_value = mock_response
+    pool = ConnectionPoolManager()
+    deadline.set_deadline(1.0)
+    
+    # The remaining budget is forwarded in milliseconds
+    await pool.request(mock_asr_config, "POST", "http://mock-service:8000/v1/transcribe")
+    headers = mock_request.call_args.kwargs["headers"]
+    assert 900 < int(headers[deadline.DEADLINE_HEADER]) <= 1000
+    
+    # A call that outlives the deadline is cut off
+    async def slow_request(*args, **kwargs):
+        await asyncio.sleep(5)
+    
+    mock_request.side_effect = slow_request
+    deadline.set_deadline(0.05)
+    with pytest.raises(DeadlineExceededError):
+        await pool.request(mock_asr_config, "POST", "http://mock-service:8000/v1/transcribe")
+    
+    await pool.close()
+
+
+@pytest.mark.asyncio
+@patch("httpx.AsyncClient.request")
+async def test_connection_pool_hedges_slow_requests(mock_request, mock_asr_config, mock_response):
+    """Test that a request slower than the hedge percentile is raced by a second copy."""
+    config = mock_asr_config.model_copy(
+        update={"hedge_percentile": 0.9, "hedge_min_samples": 10, "hedge_min_delay": 0.01}
+    )
+    
+    # Fast observed latency puts the hedge delay in the first bucket
+    for _ in range(10):
+        SERVICE_LATENCY.labels(service="asr", operation="/hedge-test").observe(0.01)
+    assert 0 < latency_percentile("asr", "/hedge-test", 0.9, 10) <= 0.05
+    
+    # The first copy hangs; the hedge answers
+    first_cancelled = asyncio.Event()
+    
+    async def request(*args, **kwargs):
+        if mock_request.call_count == 1:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                first_cancelled.set()
+                raise
+        return mock_response
+    
+    mock_request.side_effect = request
+    pool = ConnectionPoolManager()
+    wins_before = REGISTRY.get_sample_value("service_hedge_wins_total", {"service": "asr"}) or 0
+    
+    response = await pool.hedged_request(config, "/hedge-test", "POST", "http://mock-service:8000/hedge-test", content=b"x")
+    
+    # Check results
+    assert response is mock_response
+    assert mock_request.call_count == 2
+    await asyncio.wait_for(first_cancelled.wait(), 1)
+    assert REGISTRY.get_sample_value("service_hedge_wins_total", {"service": "asr"}) == wins_before + 1
+    
+    # Without budget left the slow request is simply awaited
+    pool.hedge_budget = HedgeBudget(ratio=0.0, burst=0.0)
+    mock_request.reset_mock()
+    mock_request.side_effect = None
+    mock_request.return_value = mock_response
+    await pool.hedged_request(config, "/hedge-test", "POST", "http://mock-service:8000/hedge-test", content=b"x")
+    assert mock_request.call_count == 1
+    
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_dns_cache_resolves_once():
+    """Test that DNS resolution results are cached."""
+    cache = DNSCache(ttl=60.0)
+    
+    # Set up mocks
+    loop = asyncio.get_running_loop()
+    infos = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.7", 80))]
+    with patch.object(loop, "getaddrinfo", AsyncMock(return_value=infos)) as mock_getaddrinfo:
+        first = await cache.resolve("mock-service", 80)
+        second = await cache.resolve("mock-service", 80)
+        literal = await cache.resolve("127.0.0.1", 80)
+    
+    # Check results
+    assert first == second == "10.0.0.7"
+    assert literal == "127.0.0.1"
+    mock_getaddrinfo.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_pooled_transport_connects_through_dns_cache():
+    """Test that the pooled transport connects to the address the DNS cache resolves."""
+    async def handle(reader, writer):
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+        await writer.drain()
+        writer.close()
+    
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    
+    # Set up mocks
+    loop = asyncio.get_running_loop()
+    infos = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", port))]
+    transport = PooledTransport(dns_cache=DNSCache(ttl=60.0), limits=httpx.Limits(max_connections=1))
+    async with server, httpx.AsyncClient(transport=transport) as client:
+        with patch.object(loop, "getaddrinfo", AsyncMock(return_value=infos)) as mock_getaddrinfo:
+            response = await client.get(f"http://mock-service:{port}/")
+    
+    # Check results
+    assert response.status_code == 200
+    assert response.text == "ok"
+    mock_getaddrinfo.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch("src.clients.translation_client.get_service_discovery")
+@patch("httpx.AsyncClient.request")
+async def test_translation_client_cache(
+    mock_request,
+    mock_get_service_discovery,
+    mock_service_discovery,
+    mock_response,
+    mock_translation_config
+):
+    """Test that repeated translations are served from the cache."""
+    # Set up mocks
+    mock_get_service_discovery.return_value = mock_service_discovery
+    mock_response.content = json_codec.dumps({"translation": "Bonjour, monde!"})
+    mock_request.return_value = mock_response
+    
+    # Create client with a cache
+    client = TranslationClient(
+        mock_translation_config,
+        cache=TranslationCache(max_bytes=1024, ttl=60)
+    )
+    
+    # Translate the same phrase twice
+    first = await client.translate(text="Hello, world!", source_lang="en", target_lang="fr")
+    second = await client.translate(text=" Hello, world", source_lang="en", target_lang="fr")
+    
+    # Check results
+    assert first == second == "Bonjour, monde!"
+    mock_request.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch("src.clients.asr_client.get_service_discovery")
+@patch("httpx.AsyncClient.request")
+async def test_asr_client_cache_collapses_concurrent_requests(
+    mock_request,
+    mock_get_service_discovery,
+    mock_service_discovery,
+    mock_response,
+    mock_asr_config
+):
+    """Test that identical concurrent uploads share one ASR call and are cached."""
+    # Set up mocks
+    mock_get_service_discovery.return_value = mock_service_discovery
+    asr_result = {
+        "text": "Hello, world!",
+        "segments": [{"id": 0, "start": 0.0, "end": 1.2, "text": "Hello, world!"}]
+    }
+    mock_response.content = json_codec.dumps(asr_result)
+    
+    async def slow_request(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return mock_response
+    
+    mock_request.side_effect = slow_request
+    
+    # Create client with a cache
+    client = ASRClient(mock_asr_config, cache=TranscriptionCache(max_bytes=1024, ttl=60))
+    
+    # Transcribe the same audio concurrently, then once more
+    results = await asyncio.gather(*[
+        client.transcribe_verbose(audio_data=b"mock_audio_data", language="en")
+        for _ in range(3)
+    ])
+    text = await client.transcribe(audio_data=b"mock_audio_data", language="en")
+    
+    # Check results
+    assert all(result == asr_result for result in results)
+    assert results[0]["segments"][0]["end"] == 1.2
+    assert text == "Hello, world!"
+    mock_request.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch("src.clients.translation_client.get_service_discovery")
+@patch("httpx.AsyncClient.request")
+async def test_translation_client_batches_concurrent_requests(
+    mock_request,
+    mock_get_service_discovery,
+    mock_service_discovery,
+    mock_response,
+    mock_translation_config
+):
+    """Test that concurrent translations are sent as one batch with per-item errors."""
+    # Set up mocks
+    mock_get_service_discovery.return_value = mock_service_discovery
+    mock_response.content = json_codec.dumps({
+        "translations": ["Bonjour", {"error": "Input too long"}, {"translated_text": "Salut"}]
+    })
+    mock_request.return_value = mock_response
+    
+    # Create client with batching
+    client = TranslationClient(mock_translation_config, batch_max_size=8, batch_window=0.01)
+    
+    # Translate three texts concurrently
+    results = await asyncio.gather(
+        client.translate(text="Hello", source_lang="en", target_lang="fr"),
+        client.translate(text="x" * 10000, source_lang="en", target_lang="fr"),
+        client.translate(text="Hi", source_lang="en", target_lang="fr"),
+        return_exceptions=True
+    )
+    
+    # Check results
+    assert results[0] == "Bonjour"
+    assert isinstance(results[1], TranslationError)
+    assert results[2] == "Salut"
+    
+    # Check calls
+    mock_request.assert_called_once()
+    assert mock_request.call_args.kwargs["url"].endswith("/translate/batch")
+    assert mock_request.call_args.kwargs["json"]["texts"] == ["Hello", "x" * 10000, "Hi"]
+
+
+@pytest.mark.asyncio
+@patch("src.clients.translation_client.get_service_discovery")
+@patch("httpx.AsyncClient.request")
+async def test_translation_client_batch_fallback(
+    mock_request,
+    mock_get_service_discovery,
+    mock_service_discovery,
+    mock_translation_config
+):
+    """Test that only an unsupported batch endpoint falls back to single requests."""
+    # Set up mocks
+    mock_get_service_discovery.return_value = mock_service_discovery
+    unavailable = MagicMock(status_code=400, text="Bad Request")
+    
+    # A failed batch fails every text without further requests
+    config = mock_translation_config.model_copy(update={"name": "mock-translation-fallback"})
+    client = TranslationClient(config, batch_max_size=8, batch_window=0.01)
+    mock_request.return_value = unavailable
+    results = await asyncio.gather(
+        client.translate(text="Hello", source_lang="en", target_lang="fr"),
+        client.translate(text="Hi", source_lang="en", target_lang="fr"),
+        return_exceptions=True
+    )
+    assert all(isinstance(result, TranslationError) for result in results)
+    assert results[0] is not results[1]
+    assert results[0].status_code == 400
+    assert mock_request.call_count == 1
+    
+    # A missing batch endpoint is retried text by text
+    mock_request.reset_mock()
+    mock_request.return_value = None
+    mock_request.side_effect = [
+        MagicMock(status_code=404, text="Not Found"),
+        MagicMock(status_code=200, content=json_codec.dumps({"translation": "Bonjour"})),
+        MagicMock(status_code=200, content=json_codec.dumps({"translation": "Salut"}))
+    ]
+    results = await asyncio.gather(
+        client.translate(text="Hello", source_lang="en", target_lang="fr"),
+        client.translate(text="Hi", source_lang="en", target_lang="fr")
+    )
+    assert sorted(results) == ["Bonjour", "Salut"]
+    assert mock_request.call_count == 3
+
+
+@pytest.mark.asyncio
+@patch("src.clients.tts_client.get_service_discovery")
+@patch("httpx.AsyncClient.request")
+async def test_tts_client_batches_by_voice(
+    mock_request,
+    mock_get_service_discovery,
+    mock_service_discovery,
+    mock_tts_config
+):
+    """Test that concurrent synthesis jobs are batched per language and voice."""
+    # Set up mocks, standing in for the single and batch endpoints
+    mock_get_service_discovery.return_value = mock_service_discovery
+    
+    async def tts_service(method, url, json, **kwargs):
+        response = MagicMock()
+        response.status_code = 200
+        if url.endswith("/synthesize/batch"):
+            response.content = json_codec.dumps({
+                "results": [
+                    {"audio": base64.b64encode(f"{json['voice']}:{text}".encode()).decode()}
+                    for text in json["texts"]
+                ]
+            })
+        else:
+            response.content = f"{json['voice']}:{json['text']}".encode()
+        return response
+    
+    mock_request.side_effect = tts_service
+    
+    # Create client with batching
+    client = TTSClient(mock_tts_config, batch_max_size=8, batch_max_wait=0.02)
+    
+    # Synthesize with two voices concurrently
+    results = await asyncio.gather(
+        client.synthesize(text="Bonjour", language="fr", voice="alice"),
+        client.synthesize(text="Salut", language="fr", voice="bob"),
+        client.synthesize(text="Merci", language="fr", voice="alice")
+    )
+    
+    # Check results
+    assert results == [b"alice:Bonjour", b"bob:Salut", b"alice:Merci"]
+    
+    # Check calls: one request per voice, batched where there was more than one job
+    urls = sorted(call.kwargs["url"] for call in mock_request.call_args_list)
+    assert len(urls) == 2
+    assert urls[0].endswith("/synthesize")
+    assert urls[1].endswith("/synthesize/batch")
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_adaptive_window():
+    """Test that the adaptive flush window stays zero when idle and grows under load."""
+    async def send_batch(key, items):
+        return items
+    
+    batcher = MicroBatcher("test", send_batch, max_batch_size=8, max_wait=0.05, adaptive=True)
+    
+    # Idle groups flush at once
+    assert batcher._window("idle") == 0.0
+    
+    # Work in flight widens the window
+    batcher._in_flight["busy"] = 16
+    for _ in range(20):
+        window = batcher._window("busy")
+    assert 0.0 < window <= 0.05
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_uses_latest_deadline():
+    """Test that a batch runs under its most patient caller's deadline."""
+    budgets = []
+    release = asyncio.Event()
+    
+    async def send_batch(key, items):
+        budgets.append(deadline.remaining())
+        await release.wait()
+        return items
+    
+    batcher = MicroBatcher("test", send_batch, max_batch_size=2, max_wait=1.0)
+    
+    async def submit(item, timeout):
+        deadline.set_deadline(timeout)
+        return await batcher.submit("key", item)
+    
+    # The caller with the short deadline triggers the flush
+    patient = asyncio.create_task(submit("patient", 5.0))
+    await asyncio.sleep(0)
+    hasty = asyncio.create_task(submit("hasty", 0.05))
+    
+    # Only the hasty caller gives up; the batch still completes for the other
+    with pytest.raises(DeadlineExceededError):
+        await hasty
+    release.set()
+    
+    # Check results
+    assert await patient == "patient"
+    assert budgets[0] > 4.0
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_gives_each_caller_its_own_error():
+    """Test that a failed batch hands every caller a separate stage error."""
+    async def send_batch(key, items):
+        raise ValueError("bad batch")
+    
+    batcher = MicroBatcher("test", send_batch, max_batch_size=2, max_wait=1.0, error_class=TranslationError)
+    
+    results = await asyncio.gather(
+        batcher.submit("key", "first"),
+        batcher.submit("key", "second"),
+        return_exceptions=True
+    )
+    
+    # Check results
+    assert all(isinstance(result, TranslationError) for result in results)
+    assert results[0] is not results[1]
+    results[0].details["deadline_exceeded"] = True
+    assert "deadline_exceeded" not in results[1].details
+
+
+@pytest.mark.asyncio
+@patch("src.clients.asr_client.get_service_discovery")
+@patch("httpx.AsyncClient.request")
+async def test_asr_client_long_audio(
+    mock_request,
+    mock_get_service_discovery,
+    mock_service_discovery,
+    mock_response,
+    mock_asr_config
+):
+    """Test that long recordings are transcribed as parallel windows and stitched."""
+    # Set up mocks
+    mock_get_service_discovery.return_value = mock_service_discovery
+    mock_response.content = json_codec.dumps({
+        "text": "word",
+        "segments": [{"id": 0, "start": 0.5, "end": 1.5, "text": " word"}]
+    })
+    mock_request.return_value = mock_response
+    
+    # Create client that chunks anything over 5 seconds into 4 second windows
+    long_audio = LongAudioConfig(
+        enabled=True,
+        threshold_seconds=5.0,
+        window_seconds=4.0,
+        overlap_seconds=0.5
+    )
+    client = ASRClient(mock_asr_config, long_audio=long_audio)
+    
+    # Ten seconds of silence
+    audio = write_wav((1, 2, 8000), b"\x00\x00" * 80000)
+    result = await client.transcribe_verbose(audio_data=audio, language="en")
+    
+    # Check results: one segment per window, shifted to the full recording
+    assert mock_request.call_count == len(result["segments"]) == 4
+    assert result["segments"][0]["start"] == 0.5
+    assert result["segments"][1]["start"] == 3.0
+    assert result["text"] == "word word word word"
+
+
+@pytest.mark.asyncio
+@patch("src.clients.asr_client.get_service_discovery")
+@patch("httpx.AsyncClient.request")
+async def test_asr_client_streams_spooled_audio(
+    mock_request,
+    mock_get_service_discovery,
+    mock_service_discovery,
+    mock_response,
+    mock_asr_config
+):
+    """Test that spooled uploads are passed to the ASR request as a file, not bytes."""
+    # Set up mocks
+    mock_get_service_discovery.return_value = mock_service_discovery
+    mock_response.content = json_codec.dumps({"text": "Hello, world!"})
+    mock_request.return_value = mock_response
+    
+    # Spool the audio to a temporary file
+    spooled_file = tempfile.SpooledTemporaryFile(max_size=16)
+    spooled_file.write(b"mock_audio_data" * 4)
+    audio = SpooledAudio(spooled_file)
+    
+    # Create client with a cache, which hashes the file in chunks
+    client = ASRClient(mock_asr_config, cache=TranscriptionCache(max_bytes=1024, ttl=60))
+    result = await client.transcribe(audio_data=audio, language="en")
+    
+    # Check results
+    assert result == "Hello, world!"
+    assert len(audio) == 60
+    assert await audio.digest() == await hash_audio(b"mock_audio_data" * 4)
+    
+    # Check calls: the upload is sent as a file, from the shared call's own
+    # handle, leaving the request's file open
+    _, upload = mock_request.call_args.kwargs["files"]["file"]
+    assert hasattr(upload, "read")
+    assert upload is not spooled_file
+    assert not spooled_file.closed
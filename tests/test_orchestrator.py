@@ -1,8 +1,17 @@
+import asyncio
+import io
+
 import pytest
+from prometheus_client import REGISTRY
 from unittest.mock import AsyncMock, patch, MagicMock
 
 from src.config import PipelineConfig, ServiceConfig
+from src.orchestrator.jobs import JobManager
 from src.orchestrator.pipeline import TranslationPipeline
+from src.orchestrator.streaming import UtteranceSegmenter
+from src.utils.admission import AdmissionController
+from src.utils.audio import read_wav, streaming_wav_header, write_wav
+from src.utils.disk_cache import CachedAudioFile
 from src.utils.errors import PipelineError, ASRError, TranslationError, TTSError
 
 
@@ -180,3 +189,339 @@ async def test_check_services_health(
     mock_asr_client.check_health.assert_called_once()
     mock_translation_client.check_health.assert_called_once()
     mock_tts_client.check_health.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch("src.orchestrator.pipeline.ASRClient")
+@patch("src.orchestrator.pipeline.TranslationClient")
+@patch("src.orchestrator.pipeline.TTSClient")
+async def test_translate_speech_tts_cache(
+    mock_tts_client_class,
+    mock_translation_client_class,
+    mock_asr_client_class,
+    mock_config,
+    mock_asr_client,
+    mock_translation_client,
+    mock_tts_client,
+    tmp_path
+):
+    """Test that repeated synthesis is served from the disk audio cache."""
+    # Set up mocks
+    mock_asr_client_class.return_value = mock_asr_client
+    mock_translation_client_class.return_value = mock_translation_client
+    mock_tts_client_class.return_value = mock_tts_client
+    
+    # Create pipeline with a TTS cache
+    config = mock_config.model_copy(update={"tts_cache_dir": str(tmp_path)})
+    pipeline = TranslationPipeline(config)
+    
+    # Translate twice
+    first = await pipeline.translate_speech(
+        audio_data=b"mock_audio_data",
+        source_lang="en",
+        target_lang="fr"
+    )
+    second = await pipeline.translate_speech(
+        audio_data=b"mock_audio_data",
+        source_lang="en",
+        target_lang="fr"
+    )
+    
+    # Check results
+    assert first == b"mock_audio_data"
+    assert isinstance(second, CachedAudioFile)
+    assert second.read() == b"mock_audio_data"
+    mock_tts_client.synthesize.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch("src.orchestrator.pipeline.ASRClient")
+@patch("src.orchestrator.pipeline.TranslationClient")
+@patch("src.orchestrator.pipeline.TTSClient")
+async def test_translate_speech_segment_pipeline(
+    mock_tts_client_class,
+    mock_translation_client_class,
+    mock_asr_client_class,
+    mock_config,
+    mock_asr_client,
+    mock_translation_client,
+    mock_tts_client
+):
+    """Test that segments are translated concurrently and stitched in order."""
+    # Set up mocks
+    mock_asr_client.transcribe_verbose.return_value = {
+        "text": " One. Two.",
+        "segments": [
+            {"id": 0, "start": 0.0, "end": 1.0, "text": " One."},
+            {"id": 1, "start": 1.0, "end": 2.0, "text": " Two."}
+        ]
+    }
+    
+    async def translate(text, source_lang, target_lang):
+        # The first segment is slower, so completion order differs from input order
+        await asyncio.sleep(0.05 if text == "One." else 0.01)
+        return text.upper()
+    
+    async def synthesize(text, language, voice, audio_format):
+        return write_wav((1, 2, 16000), text.encode().ljust(8, b"\0"))
+    
+    mock_translation_client.translate.side_effect = translate
+    mock_tts_client.synthesize.side_effect = synthesize
+    mock_asr_client_class.return_value = mock_asr_client
+    mock_translation_client_class.return_value = mock_translation_client
+    mock_tts_client_class.return_value = mock_tts_client
+    
+    # Create pipeline in segment mode
+    config = mock_config.model_copy(update={"segment_pipeline": True})
+    pipeline = TranslationPipeline(config)
+    
+    # Test translation
+    stages = []
+    
+    async def on_stage(stage):
+        stages.append(stage)
+    
+    result = await pipeline.translate_speech(
+        audio_data=b"mock_audio_data",
+        source_lang="en",
+        target_lang="fr",
+        on_stage=on_stage
+    )
+    
+    # Check results
+    _, frames = read_wav(result)
+    assert frames == b"ONE.\0\0\0\0TWO.\0\0\0\0"
+    assert stages == ["asr", "translation", "tts"]
+    mock_asr_client.transcribe.assert_not_called()
+    assert mock_translation_client.translate.call_count == 2
+    assert mock_tts_client.synthesize.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch("src.orchestrator.pipeline.ASRClient")
+@patch("src.orchestrator.pipeline.TranslationClient")
+@patch("src.orchestrator.pipeline.TTSClient")
+async def test_translate_speech_stream(
+    mock_tts_client_class,
+    mock_translation_client_class,
+    mock_asr_client_class,
+    mock_config,
+    mock_asr_client,
+    mock_translation_client,
+    mock_tts_client
+):
+    """Test that streamed output starts with one header and keeps sentence order."""
+    # Set up mocks
+    mock_translation_client.translate.return_value = "Bonjour. Au revoir."
+    
+    async def synthesize(text, language, voice, audio_format):
+        # The first sentence is slower, so completion order differs from input order
+        await asyncio.sleep(0.05 if text == "Bonjour." else 0.01)
+        return write_wav((1, 2, 16000), text.encode())
+    
+    mock_tts_client.synthesize.side_effect = synthesize
+    mock_asr_client_class.return_value = mock_asr_client
+    mock_translation_client_class.return_value = mock_translation_client
+    mock_tts_client_class.return_value = mock_tts_client
+    
+    # Create pipeline
+    pipeline = TranslationPipeline(mock_config)
+    
+    # Test streaming translation
+    audio_chunks = await pipeline.translate_speech_stream(
+        audio_data=b"mock_audio_data",
+        source_lang="en",
+        target_lang="fr"
+    )
+    chunks = [chunk async for chunk in audio_chunks]
+    
+    # Check results
+    assert chunks == [streaming_wav_header((1, 2, 16000)), b"Bonjour.", b"Au revoir."]
+
+
+def test_utterance_segmenter():
+    """Test that speech followed by a pause is cut into one utterance."""
+    segmenter = UtteranceSegmenter(16000, min_silence_ms=300)
+    
+    # Half a second of loud audio, then silence, fed in small chunks
+    audio = b"\x00\x40" * 8000 + b"\x00\x00" * 16000
+    utterances = []
+    for offset in range(0, len(audio), 1000):
+        utterances.extend(segmenter.feed(audio[offset:offset + 1000]))
+    
+    # Check results
+    assert len(utterances) == 1
+    assert len(utterances[0]) >= 8000 * 2
+    assert segmenter.flush() is None
+
+
+@pytest.mark.asyncio
+@patch("src.orchestrator.pipeline.ASRClient")
+@patch("src.orchestrator.pipeline.TranslationClient")
+@patch("src.orchestrator.pipeline.TTSClient")
+async def test_translate_speech_no_speech(
+    mock_tts_client_class,
+    mock_translation_client_class,
+    mock_asr_client_class,
+    mock_config,
+    mock_asr_client,
+    mock_translation_client,
+    mock_tts_client
+):
+    """Test that silent input skips ASR, translation and TTS when VAD is enabled."""
+    # Set up mocks
+    mock_asr_client_class.return_value = mock_asr_client
+    mock_translation_client_class.return_value = mock_translation_client
+    mock_tts_client_class.return_value = mock_tts_client
+    
+    # Create pipeline with voice activity detection
+    mock_config.vad_enabled = True
+    pipeline = TranslationPipeline(mock_config)
+    
+    # Test translation of two seconds of silence
+    result = await pipeline.translate_speech(
+        audio_data=write_wav((1, 2, 16000), b"\x00\x00" * 32000),
+        source_lang="en",
+        target_lang="fr"
+    )
+    
+    # Check results
+    assert result == b""
+    mock_asr_client.transcribe.assert_not_called()
+    mock_translation_client.translate.assert_not_called()
+    mock_tts_client.synthesize.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("src.orchestrator.pipeline.ASRClient")
+@patch("src.orchestrator.pipeline.TranslationClient")
+@patch("src.orchestrator.pipeline.TTSClient")
+async def test_translate_speech_cancelled(
+    mock_tts_client_class,
+    mock_translation_client_class,
+    mock_asr_client_class,
+    mock_config,
+    mock_asr_client,
+    mock_translation_client,
+    mock_tts_client
+):
+    """Test that cancelling a translation stops it in its current stage."""
+    # Set up mocks, with a translation that never finishes
+    translation_started = asyncio.Event()
+    
+    async def translate(**kwargs):
+        translation_started.set()
+        await asyncio.sleep(10)
+    
+    mock_translation_client.translate.side_effect = translate
+    mock_asr_client_class.return_value = mock_asr_client
+    mock_translation_client_class.return_value = mock_translation_client
+    mock_tts_client_class.return_value = mock_tts_client
+    
+    # Create pipeline
+    pipeline = TranslationPipeline(mock_config)
+    cancelled_before = REGISTRY.get_sample_value("pipeline_cancelled_total", {"stage": "translation"}) or 0
+    
+    # Cancel the translation while it waits for the translation service
+    task = asyncio.ensure_future(
+        pipeline.translate_speech(audio_data=b"mock_audio_data", source_lang="en", target_lang="fr")
+    )
+    await translation_started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    
+    # Check results
+    assert REGISTRY.get_sample_value("pipeline_cancelled_total", {"stage": "translation"}) == cancelled_before + 1
+    mock_tts_client.synthesize.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_job_manager_runs_and_recovers_jobs(mock_config, tmp_path):
+    """Test that queued jobs run to completion and survive a restart."""
+    config = mock_config.model_copy(update={"jobs_dir": str(tmp_path), "jobs_poll_interval": 0.01})
+    stages = []
+    
+    async def translate_speech(audio_data, source_lang, target_lang, audio_format, voice, on_stage):
+        for stage in ("asr", "translation", "tts"):
+            await on_stage(stage)
+            stages.append(stage)
+        return b"translated:" + await audio_data.read()
+    
+    pipeline = MagicMock()
+    pipeline.translate_speech = translate_speech
+    
+    # A job left running by a crashed process is requeued on start
+    manager = JobManager(pipeline, config)
+    interrupted = await manager.submit(io.BytesIO(b"first"), "en", "fr")
+    manager.store.claim()
+    manager.store.close()
+    
+    admission = AdmissionController(max_in_flight=1, max_queue=10, max_wait=1.0)
+    admission.acquire = MagicMock(wraps=admission.acquire)
+    manager = JobManager(pipeline, config, admission)
+    queued = await manager.submit(io.BytesIO(b"second"), "en", "fr", tenant="acme")
+    await manager.start()
+    try:
+        for _ in range(100):
+            jobs = [await manager.get(job_id) for job_id in (interrupted, queued)]
+            if all(job["status"] == "completed" for job in jobs):
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await manager.stop()
+    
+    # Check results
+    assert [job["status"] for job in jobs] == ["completed", "completed"]
+    assert jobs[0]["attempts"] == 2
+    assert [job["tenant"] for job in jobs] == ["default", "acme"]
+    
+    # Each run went through admission control under its tenant
+    assert sorted(call.kwargs["tenant"] for call in admission.acquire.call_args_list) == ["acme", "default"]
+    assert admission.in_flight == 0
+    assert sorted(stages) == sorted(["asr", "translation", "tts"] * 2)
+    with open(manager.output_path(jobs[0]), "rb") as f:
+        assert f.read() == b"translated:first"
+
+
+@pytest.mark.asyncio
+async def test_job_manager_retries_transient_failures(mock_config, tmp_path):
+    """Test that jobs are retried after failures that may pass, and not after client errors."""
+    config = mock_config.model_copy(update={
+        "jobs_dir": str(tmp_path),
+        "jobs_poll_interval": 0.01,
+        "jobs_retry_backoff": 0.01,
+        "jobs_max_attempts": 3
+    })
+    calls = {}
+    
+    async def translate_speech(audio_data, source_lang, target_lang, audio_format, voice, on_stage):
+        audio = await audio_data.read()
+        calls[audio] = calls.get(audio, 0) + 1
+        if audio == b"flaky" and calls[audio] == 1:
+            raise PipelineError("TTS failed", stage="tts", details={"circuit": "open"})
+        if audio == b"invalid":
+            raise PipelineError("Translation failed", stage="translation", status_code=400)
+        if audio == b"down":
+            raise PipelineError("ASR failed", stage="asr", status_code=503)
+        return b"translated:" + audio
+    
+    pipeline = MagicMock()
+    pipeline.translate_speech = translate_speech
+    
+    manager = JobManager(pipeline, config)
+    job_ids = [await manager.submit(io.BytesIO(audio), "en", "fr") for audio in (b"flaky", b"invalid", b"down")]
+    await manager.start()
+    try:
+        for _ in range(200):
+            jobs = [await manager.get(job_id) for job_id in job_ids]
+            if all(job["status"] in ("completed", "failed") for job in jobs):
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await manager.stop()
+    
+    # Check results: retried until it worked, failed at once, retried until out of attempts
+    assert [job["status"] for job in jobs] == ["completed", "failed", "failed"]
+    assert [job["attempts"] for job in jobs] == [2, 1, 3]
+    assert calls == {b"flaky": 2, b"invalid": 1, b"down": 3}
@@ -0,0 +1,486 @@
+import asyncio
+import struct
+import time
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from src.config import TenantConfig
+
+from src.utils import deadline
+from src.utils.admission import AdmissionController
+from src.utils.audio import (
+    concatenate_wav,
+    read_wav,
+    streaming_wav_header,
+    wav_frames_view,
+    wav_header,
+    write_wav
+)
+from src.utils.audio_preprocessing import normalize_for_asr
+from src.utils.cache import LRUCache, SingleFlight, TranslationCache
+from src.utils.disk_cache import DiskAudioCache
+from src.utils.errors import DeadlineExceededError, OverloadedError, RateLimitError, ValidationError
+from src.utils.long_audio import merge_transcriptions, split_wav_on_silence
+from src.utils.tenancy import TenantLimiter
+from src.utils.text import normalize_text, split_sentences
+from src.utils.vad import trim_silence
+
+
+def test_normalize_text():
+    """Test text normalization for cache keys."""
+    # Whitespace and trailing punctuation
+    assert normalize_text("  Hello,   world!  ") == "Hello, world"
+    
+    # Unicode NFC: decomposed and composed forms match
+    assert normalize_text("cafe\u0301.") == "caf\u00e9"
+    
+    # Punctuation-only text
+    assert normalize_text("...") == ""
+
+
+def test_lru_cache_evicts_by_size():
+    """Test that the cache evicts least recently used entries by size."""
+    cache = LRUCache("test", max_bytes=10, ttl=60)
+    
+    # Fill the cache
+    cache.set("a", "A", 4)
+    cache.set("b", "B", 4)
+    
+    # Touch "a" so "b" is the least recently used
+    assert cache.get("a") == "A"
+    
+    # Adding "c" evicts "b"
+    cache.set("c", "C", 4)
+    
+    # Check results
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+    assert cache.size_bytes == 8
+
+
+def test_lru_cache_expires_entries():
+    """Test that cache entries expire after the TTL."""
+    cache = LRUCache("test", max_bytes=100, ttl=10)
+    cache.set("a", "A", 1)
+    
+    # Move the clock past the TTL
+    with patch("src.utils.cache.time.monotonic", return_value=time.monotonic() + 11):
+        assert cache.get("a") is None
+    
+    # Check results
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+
+
+def test_translation_cache_normalizes_keys():
+    """Test that trivially different transcripts share a cache entry."""
+    cache = TranslationCache(max_bytes=1024, ttl=60)
+    cache.set_translation(" Hello, world!", "en", "fr", "Bonjour, monde!")
+    
+    # Check results
+    assert cache.get_translation("Hello,  world", "en", "fr") == "Bonjour, monde!"
+    assert cache.get_translation("Hello, world", "en", "de") is None
+
+
+def test_disk_audio_cache_round_trip(tmp_path):
+    """Test storing and serving audio from the disk cache."""
+    cache = DiskAudioCache(str(tmp_path), max_bytes=1024)
+    key = cache.make_key("Bonjour", "fr", "default", "wav")
+    
+    # Miss, then store
+    assert cache.get(key) is None
+    cache.put(key, "wav", b"RIFF-audio")
+    
+    # Check results
+    cached = cache.get(key)
+    assert cached is not None
+    assert cached.size == len(b"RIFF-audio")
+    with open(cached.path, "rb") as f:
+        assert f.read() == b"RIFF-audio"
+
+
+def test_disk_audio_cache_evicts_and_rebuilds(tmp_path):
+    """Test size-bounded eviction and rebuilding the index from disk."""
+    cache = DiskAudioCache(str(tmp_path), max_bytes=10)
+    cache.put("aa01", "wav", b"12345")
+    cache.put("bb02", "wav", b"12345")
+    
+    # Touch the first entry so the second is least recently used, keeping
+    # the second one open
+    looked_up = cache.get("bb02")
+    assert cache.get("aa01") is not None
+    cache.put("cc03", "wav", b"12345")
+    
+    # Check results
+    assert cache.get("bb02") is None
+    assert looked_up.read() == b"12345"
+    assert cache.size_bytes == 10
+    
+    # Leave an interrupted write behind and rebuild
+    (tmp_path / "aa" / "partial.tmp").write_bytes(b"x")
+    rebuilt = DiskAudioCache(str(tmp_path), max_bytes=10)
+    
+    # Check results
+    assert len(rebuilt) == 2
+    assert rebuilt.get("aa01") is not None
+    assert rebuilt.get("cc03") is not None
+    assert not (tmp_path / "aa" / "partial.tmp").exists()
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancels_when_all_waiters_leave():
+    """Test that a shared call is cancelled only after its last waiter leaves."""
+    group = SingleFlight()
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+    
+    async def call():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+    
+    # Two waiters share the call
+    first = asyncio.create_task(group.run("key", call))
+    second = asyncio.create_task(group.run("key", call))
+    await started.wait()
+    
+    # Cancelling one waiter keeps the call running
+    first.cancel()
+    await asyncio.sleep(0)
+    assert not cancelled.is_set()
+    
+    # Cancelling the last waiter cancels the call
+    second.cancel()
+    await asyncio.sleep(0.01)
+    assert cancelled.is_set()
+    assert len(group) == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_outlives_short_deadline():
+    """Test that a waiter running out of time leaves the shared call running for the others."""
+    group = SingleFlight()
+    budgets = []
+    release = asyncio.Event()
+    
+    async def call():
+        await release.wait()
+        budgets.append(deadline.remaining())
+        return "result"
+    
+    async def wait(timeout):
+        deadline.set_deadline(timeout)
+        return await group.run("key", call)
+    
+    # The first waiter has the shorter deadline
+    hasty = asyncio.create_task(wait(0.05))
+    await asyncio.sleep(0)
+    patient = asyncio.create_task(wait(5.0))
+    
+    with pytest.raises(DeadlineExceededError):
+        await hasty
+    release.set()
+    
+    # Check results
+    assert await patient == "result"
+    assert budgets[0] > 4.0
+
+
+def test_concatenate_wav():
+    """Test joining WAV chunks and rejecting mismatched formats."""
+    first = write_wav((1, 2, 16000), b"\x01\x00\x02\x00")
+    second = write_wav((1, 2, 16000), b"\x03\x00")
+    
+    # Check results
+    wav_format, frames = read_wav(concatenate_wav([first, second]))
+    assert wav_format == (1, 2, 16000)
+    assert frames == b"\x01\x00\x02\x00\x03\x00"
+    
+    # Mismatched sample rates cannot be joined
+    with pytest.raises(ValidationError):
+        concatenate_wav([first, write_wav((1, 2, 22050), b"\x00\x00")])
+
+
+def test_wav_frames_view():
+    """Test that WAV frames are exposed as a read-only view of the input."""
+    audio = write_wav((1, 2, 16000), b"\x01\x00\x02\x00")
+    
+    wav_format, frames = wav_frames_view(audio)
+    
+    # Check results
+    assert wav_format == (1, 2, 16000)
+    assert frames.readonly
+    assert frames.obj is audio
+    assert frames.tobytes() == b"\x01\x00\x02\x00"
+    assert wav_header(wav_format, len(frames)) == audio[:44]
+    
+    with pytest.raises(ValidationError):
+        wav_frames_view(b"not a wav file")
+
+
+def test_split_sentences():
+    """Test splitting translated text into sentences."""
+    assert split_sentences("Bonjour. Comment allez-vous ? Bien!") == [
+        "Bonjour.",
+        "Comment allez-vous ?",
+        "Bien!"
+    ]
+    assert split_sentences("नमस्ते। आप कैसे हैं?") == ["नमस्ते।", "आप कैसे हैं?"]
+    assert split_sentences("   ") == []
+
+
+def test_streaming_wav_header():
+    """Test the streaming WAV header layout."""
+    header = streaming_wav_header((2, 2, 48000))
+    
+    # Check results
+    assert len(header) == 44
+    assert header[:4] == b"RIFF" and header[8:12] == b"WAVE"
+    assert header[36:40] == b"data"
+    assert header[40:44] == b"\xff\xff\xff\xff"
+    assert struct.unpack("<HIIHH", header[22:36]) == (2, 48000, 192000, 4, 16)
+
+
+def test_split_wav_on_silence():
+    """Test that long audio is split into overlapping windows at a pause."""
+    rate = 8000
+    tone = (np.sin(np.arange(rate) * 2 * np.pi * 440 / rate) * 10000).astype("<i2")
+    
+    # Speech until 3.0 s, a pause until 3.2 s, then speech until 6.0 s
+    samples = np.concatenate([
+        np.tile(tone, 3),
+        np.zeros(int(0.2 * rate), dtype="<i2"),
+        np.tile(tone, 3)[:int(2.8 * rate)]
+    ])
+    audio = write_wav((1, 2, rate), samples.tobytes())
+    
+    windows = split_wav_on_silence(audio, window_seconds=4.0, overlap_seconds=0.5)
+    
+    # Check results
+    assert len(windows) == 2
+    first_start, first_end, _ = windows[0]
+    second_start, second_end, second_audio = windows[1]
+    assert first_start == 0.0
+    assert 3.0 <= first_end < 3.2
+    assert second_start == pytest.approx(first_end - 0.5)
+    assert second_end == 6.0
+    assert len(read_wav(second_audio)[1]) == int((second_end - second_start) * rate) * 2
+
+
+def test_merge_transcriptions():
+    """Test stitching overlapping window transcriptions."""
+    windows = [
+        (0.0, 10.0, {"text": "a b", "segments": [
+            {"id": 0, "start": 0.0, "end": 4.0, "text": " a"},
+            {"id": 1, "start": 4.0, "end": 9.5, "text": " b"}
+        ]}),
+        (9.0, 20.0, {"text": "b c", "segments": [
+            {"id": 0, "start": 0.0, "end": 0.8, "text": " b"},
+            {"id": 1, "start": 0.8, "end": 5.0, "text": " c"}
+        ]})
+    ]
+    
+    merged = merge_transcriptions(windows)
+    
+    # Check results: the repeated segment in the overlap is dropped
+    assert merged["text"] == "a b c"
+    assert [(s["id"], s["start"], s["end"]) for s in merged["segments"]] == [
+        (0, 0.0, 4.0),
+        (1, 4.0, 9.5),
+        (2, 9.8, 14.0)
+    ]
+
+
+def test_normalize_for_asr():
+    """Test downmixing and anti-aliased resampling of uploads to 16 kHz mono."""
+    rate = 48000
+    t = np.arange(rate) / rate
+    
+    # Stereo: a 1 kHz tone on the left, a 10 kHz tone on the right that must
+    # be filtered out rather than aliased into the speech band
+    left = np.sin(2 * np.pi * 1000 * t) * 0.5
+    right = np.sin(2 * np.pi * 10000 * t) * 0.5
+    frames = (np.stack([left, right], axis=1) * 32767).astype("<i2").tobytes()
+    audio = write_wav((2, 2, rate), frames)
+    
+    normalized, audio_format = normalize_for_asr(audio)
+    
+    # Check results
+    assert audio_format == "wav"
+    wav_format, pcm = read_wav(normalized)
+    assert wav_format == (1, 2, 16000)
+    assert len(normalized) < len(audio) / 5
+    
+    samples = np.frombuffer(pcm, dtype="<i2").astype(np.float32) / 32768
+    expected = np.sin(2 * np.pi * 1000 * np.arange(16000) / 16000) * 0.25
+    assert np.max(np.abs(samples[200:-200] - expected[200:-200])) < 0.01
+    
+    # Audio already in the target format is passed through untouched
+    assert normalize_for_asr(normalized) == (normalized, "wav")
+
+
+def test_trim_silence():
+    """Test that silence is trimmed and timestamps map back to the original."""
+    rate = 16000
+    rng = np.random.default_rng(0)
+    tone = (np.sin(np.arange(rate) * 2 * np.pi * 440 / rate) * 8000).astype("<i2")
+    noise = (rng.standard_normal(rate) * 30).astype("<i2")
+    
+    # 2 s silence, 1 s speech, 3 s silence, 0.5 s speech, 1 s silence
+    samples = np.concatenate([noise, noise, tone, noise, noise, noise, tone[:rate // 2], noise])
+    trimmed = trim_silence(write_wav((1, 2, rate), samples.tobytes()), padding_ms=200)
+    
+    # Check results: two spans around the speech, long pause removed
+    assert len(trimmed.spans) == 2
+    assert trimmed.spans[0][0] == pytest.approx(1.8, abs=0.05)
+    assert trimmed.spans[1][1] == pytest.approx(6.7, abs=0.05)
+    assert trimmed.duration < 3.0
+    assert len(read_wav(trimmed.audio_data)[1]) < len(samples)
+    
+    # Timestamps in the second span map past the removed pause
+    second_start = trimmed.spans[0][1] - trimmed.spans[0][0]
+    assert trimmed.to_original(second_start + 0.1) == pytest.approx(trimmed.spans[1][0] + 0.1)
+    
+    # Pure silence has no speech
+    assert not trim_silence(write_wav((1, 2, rate), np.tile(noise, 2).tobytes())).has_speech
+
+
+@pytest.mark.asyncio
+async def test_admission_controller_queues_and_sheds():
+    """Test that admission queues up to its bound and sheds the rest."""
+    controller = AdmissionController(max_in_flight=1, max_queue=1, max_wait=0.5)
+    
+    await controller.acquire()
+    waiter = asyncio.ensure_future(controller.acquire())
+    await asyncio.sleep(0)
+    assert controller.queued == 1
+    
+    # The queue is full
+    with pytest.raises(OverloadedError) as exc_info:
+        await controller.acquire()
+    assert exc_info.value.details == {"reason": "queue_full"}
+    assert exc_info.value.retry_after >= 1
+    
+    # Releasing hands the slot to the queued request
+    controller.release(service_time=2.0)
+    await waiter
+    assert controller.in_flight == 1 and controller.queued == 0
+    
+    # The estimated wait now exceeds max_wait, so the next request is shed at once
+    with pytest.raises(OverloadedError) as exc_info:
+        await controller.acquire()
+    assert exc_info.value.details == {"reason": "deadline"}
+    assert exc_info.value.retry_after == 2.0
+    
+    controller.release()
+    assert controller.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_admission_controller_fair_queuing():
+    """Test that a tenant with a deep queue cannot starve another tenant."""
+    controller = AdmissionController(max_in_flight=1, max_queue=10, max_wait=5.0)
+    await controller.acquire()
+    
+    admitted = []
+    
+    async def request(tenant):
+        await controller.acquire(tenant=tenant, cost=10.0)
+        admitted.append(tenant)
+    
+    # A backlog from one tenant queues ahead of a single interactive request
+    tasks = [asyncio.ensure_future(request("bulk")) for _ in range(3)]
+    tasks.append(asyncio.ensure_future(request("interactive")))
+    await asyncio.sleep(0)
+    
+    for _ in tasks:
+        controller.release()
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    
+    # Check results
+    assert admitted == ["bulk", "interactive", "bulk", "bulk"]
+
+
+@pytest.mark.asyncio
+async def test_deadline_stage_budget():
+    """Test that the deadline is split across the remaining stages."""
+    shares = {"asr": 0.5, "translation": 0.2, "tts": 0.3}
+    
+    # Without a deadline there is no budget and retries are unrestricted
+    with deadline.stage_budget("asr", shares) as budget:
+        assert budget is None
+        assert deadline.can_retry(60.0)
+    
+    deadline.set_deadline(10.0)
+    
+    # Each stage gets its share of what the stages from it onwards are owed
+    with deadline.stage_budget("asr", shares) as budget:
+        assert 4.9 < budget <= 5.0
+        assert deadline.remaining() <= 5.0
+        assert deadline.can_retry(1.0)
+        assert not deadline.can_retry(5.0)
+    with deadline.stage_budget("translation", shares) as budget:
+        assert 3.9 < budget <= 4.0
+    with deadline.stage_budget("tts", shares) as budget:
+        assert 9.9 < budget <= 10.0
+    
+    # Errors raised after a stage runs out of time are marked
+    with pytest.raises(ValidationError) as exc_info:
+        with deadline.stage_budget("translation", {"translation": 0.0, "tts": 1.0}):
+            raise ValidationError("Too late")
+    assert exc_info.value.details["deadline_exceeded"]
+    assert not deadline.expired()
+
+
+def test_tenant_limiter_quotas():
+    """Test per-tenant request and audio-seconds token buckets."""
+    limiter = TenantLimiter(
+        TenantConfig(
+            requests_per_second=1.0,
+            request_burst=2.0,
+            tenant_overrides={"bulk": {"audio_seconds_per_second": 10.0, "audio_seconds_burst": 60.0}},
+            api_keys={"secret": "bulk"}
+        )
+    )
+    
+    # Tenants come from the API key first, then the header
+    assert limiter.resolve_tenant("other", "secret") == "bulk"
+    assert limiter.resolve_tenant(None, None) == "default"
+    assert limiter.resolve_tenant(None, "unknown") is None
+    
+    # With API keys configured the header alone is not trusted
+    assert limiter.resolve_tenant("bulk", None) == "default"
+    
+    # Without keys, unconfigured header tenants are capped
+    open_limiter = TenantLimiter(TenantConfig(tenant_overrides={"bulk": {}}, max_header_tenants=1))
+    assert open_limiter.resolve_tenant("first", None) == "first"
+    assert open_limiter.resolve_tenant("second", None) == "default"
+    assert open_limiter.resolve_tenant("bulk", None) == "bulk"
+    assert open_limiter.resolve_tenant("first", None) == "first"
+    
+    # The request bucket allows a burst of two
+    limiter.check("default", 5.0)
+    limiter.check("default", 5.0)
+    with pytest.raises(RateLimitError) as exc_info:
+        limiter.check("default", 5.0)
+    assert exc_info.value.details["quota"] == "requests"
+    assert 0 < exc_info.value.retry_after <= 1.0
+    
+    # A request shed after the check gets its charge back
+    limiter.refund("default", 5.0)
+    limiter.check("default", 5.0)
+    
+    # Audio longer than the burst is let through once the bucket is full,
+    # then has to be paid back
+    limiter.check("bulk", 90.0)
+    with pytest.raises(RateLimitError) as exc_info:
+        limiter.check("bulk", 1.0)
+    assert exc_info.value.details["quota"] == "audio_seconds"
+    assert exc_info.value.retry_after > 3.0